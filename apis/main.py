@@ -211,6 +211,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Keyset pagination cursors for list endpoints (posts, comments)
+    expose_headers=["X-Next-After-Ts", "X-Next-After-Id"],
 )
 
 # Add request context middleware for logging
@@ -29,6 +29,7 @@ class Settings(BaseModel):
     redis_username: str = "default"  # Add username field for Redis Cloud
     redis_password: str = ""
     redis_db: int = 0
+    redis_pool_size: int = 50  # Max pooled Redis connections; requests wait for a free one beyond this
     
     # PostgreSQL Configuration
     postgres_host: str = "localhost"
@@ -38,6 +39,10 @@ class Settings(BaseModel):
     postgres_password: str = "password"
 
     db_pool_size: int = 10  # Default pool size for database connections
+    db_pool_min_size: int = 2  # Connections the PostgreSQL pool keeps open when idle
+    db_pool_max_inactive_lifetime: float = 300.0  # Seconds before an idle pooled connection is closed
+    db_pool_max_queries: int = 50000  # Queries after which a pooled connection is replaced
+    db_statement_cache_size: int = 256  # Prepared statements kept per PostgreSQL connection
     
     # SQLite Configuration
     sqlite_path: str = "./itg_docverse.db"
@@ -128,12 +133,17 @@ def get_settings() -> Settings:
         "redis_username": os.getenv("REDIS_USERNAME", defaults.redis_username),
         "redis_password": os.getenv("REDIS_PASSWORD", defaults.redis_password),
         "redis_db": int(os.getenv("REDIS_DB", defaults.redis_db)),
+        "redis_pool_size": int(os.getenv("REDIS_POOL_SIZE", defaults.redis_pool_size)),
         "postgres_host": os.getenv("POSTGRES_HOST", defaults.postgres_host),
         "postgres_port": int(os.getenv("POSTGRES_PORT", defaults.postgres_port)),
         "postgres_db": os.getenv("POSTGRES_DB", defaults.postgres_db),
         "postgres_user": os.getenv("POSTGRES_USER", defaults.postgres_user),
         "postgres_password": os.getenv("POSTGRES_PASSWORD", defaults.postgres_password),
         "db_pool_size": int(os.getenv("DB_POOL_SIZE", defaults.db_pool_size)),
+        "db_pool_min_size": int(os.getenv("DB_POOL_MIN_SIZE", defaults.db_pool_min_size)),
+        "db_pool_max_inactive_lifetime": float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", defaults.db_pool_max_inactive_lifetime)),
+        "db_pool_max_queries": int(os.getenv("DB_POOL_MAX_QUERIES", defaults.db_pool_max_queries)),
+        "db_statement_cache_size": int(os.getenv("DB_STATEMENT_CACHE_SIZE", defaults.db_statement_cache_size)),
         "sqlite_path": os.getenv("SQLITE_PATH", defaults.sqlite_path),
         "jwt_secret_key": os.getenv("JWT_SECRET_KEY", defaults.jwt_secret_key),
         "jwt_algorithm": os.getenv("JWT_ALGORITHM", defaults.jwt_algorithm),
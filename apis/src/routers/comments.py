@@ -3,15 +3,17 @@ Comments API Router
 Handles all comment-related endpoints (requires authentication)
 """
 
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Optional
 import uuid
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 
 from ..models.comment import Comment, CommentCreate, CommentUpdate, CommentPublic
 from ..services.database.factory import DatabaseServiceFactory
 from ..services.database.base import DatabaseService
 from ..middleware.dependencies import get_current_user_from_middleware
 from ..utils.logger import get_logger
+from ..config.settings import settings
 
 router = APIRouter()
 
@@ -23,15 +25,30 @@ async def get_db_service() -> DatabaseService:
 
 @router.get("/", response_model=List[CommentPublic])
 async def get_all_comments(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of comments to skip"),
     limit: int = Query(10, ge=1, le=100, description="Number of comments to return"),
+    after_ts: Optional[datetime] = Query(None, description="Keyset cursor: created timestamp of the last comment on the previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: ID of the last comment on the previous page"),
     current_user: Dict[str, Any] = Depends(get_current_user_from_middleware),
     db: DatabaseService = Depends(get_db_service)
 ):
-    """Get all comments with pagination (requires authentication)"""
+    """Get all comments with pagination (requires authentication)
+    
+    On PostgreSQL, a full page carries the cursor for the next page in the
+    X-Next-After-Ts / X-Next-After-Id headers (pass them back as after_ts/after_id).
+    """
     try:
+        # Keyset cursors are only understood by the PostgreSQL service
+        cursor_kwargs = {}
+        if settings.database_type == "postgresql" and after_ts and after_id:
+            cursor_kwargs = {'after_ts': after_ts, 'after_id': after_id}
         # Get recent comments from all posts
-        comments_data = await db.get_recent_comments(skip, limit)
+        comments_data = await db.get_recent_comments(skip, limit, **cursor_kwargs)
+        if settings.database_type == "postgresql" and comments_data and len(comments_data) == limit:
+            last = comments_data[-1]
+            response.headers["X-Next-After-Ts"] = last['created_ts'].isoformat()
+            response.headers["X-Next-After-Id"] = last['id']
         comments = []
         for comment_dict in comments_data:
             comment = CommentPublic(
@@ -5,6 +5,7 @@ Handles image/file uploads with database storage and tagging
 import uuid
 import os
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
@@ -54,6 +55,9 @@ class MyImagesResponse(BaseModel):
     total: int
     page: int
     limit: int
+    # Keyset cursor for the next page (PostgreSQL only; None on the last page)
+    next_after_ts: Optional[str] = None
+    next_after_id: Optional[str] = None
 
 # Allowed file types
 ALLOWED_IMAGE_TYPES = {
@@ -194,36 +198,39 @@ async def get_my_images(
     sort_by: str = "recent",
     page: int = 1,
     limit: int = 20,
+    after_ts: Optional[datetime] = None,
+    after_id: Optional[str] = None,
     current_user: dict = Depends(get_current_user_from_middleware),
     db = Depends(get_database_service)
 ):
-    """Get user's uploaded images with filtering"""
+    """Get user's uploaded images with filtering
+    
+    after_ts/after_id (created_ts and id of the last file on the previous page)
+    switch recent-first listings to keyset pagination on PostgreSQL.
+    """
     try:
         logger.info(f"🖼️ Getting images for user: {current_user.get('user_id', 'unknown')}")
         logger.info(f"📋 Parameters: visibility={visibility}, tags={tags}, search={search}, page={page}, limit={limit}")
         
         offset = (page - 1) * limit
         
-        # Get files with filters
-        files = await db.get_user_uploads(
+        # Keyset cursors are only understood by the PostgreSQL service
+        cursor_kwargs = {}
+        if settings.database_type == "postgresql" and after_ts and after_id:
+            cursor_kwargs = {'after_ts': after_ts, 'after_id': after_id}
+        
+        # Get files with filters, plus the total count
+        files, total = await db.get_user_uploads_page(
             user_id=current_user['user_id'],
             offset=offset,
             limit=limit,
             visibility=visibility,
             tags=[tags] if tags else None,
-            search=search
+            search=search,
+            **cursor_kwargs
         )
         
         logger.info(f"📁 Found {len(files)} files")
-        
-        # Get total count
-        total = await db.count_user_uploads(
-            user_id=current_user['user_id'],
-            visibility=visibility,
-            tags=[tags] if tags else None,
-            search=search
-        )
-        
         logger.info(f"📊 Total count: {total}")
         
         # Format response
@@ -252,11 +259,19 @@ async def get_my_images(
         
         logger.info(f"✅ Returning {len(file_responses)} images")
         
+        # The cursor is the last row's (created_ts, id), the recent-first ordering key
+        next_after_ts = next_after_id = None
+        if settings.database_type == "postgresql" and files and len(files) == limit:
+            next_after_ts = files[-1]['created_ts'].isoformat()
+            next_after_id = files[-1]['id']
+        
         return MyImagesResponse(
             files=file_responses,
             total=total,
             page=page,
-            limit=limit
+            limit=limit,
+            next_after_ts=next_after_ts,
+            next_after_id=next_after_id
         )
         
     except Exception as e:
@@ -282,7 +297,7 @@ async def get_file(
         
         return await serve_cached_or_db_file(
             file_id=file_id,
-            db_getter_func=db.get_content_upload,
+            db_getter_func=db.get_content_upload_blob,
             access_checker_func=check_access,
             current_user=current_user
         )
@@ -3,8 +3,9 @@ Posts API Router
 Handles all post-related endpoints (requires authentication)
 """
 
+from datetime import datetime
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 
 from ..models.post import Post, PostCreate, PostUpdate, PostPublic, PostType, PostStatus, PostSummary, PostAnalytics, UserAnalytics
 from ..services.database.factory import DatabaseServiceFactory
@@ -151,6 +152,7 @@ async def get_db_service() -> DatabaseService:
 
 @router.get("/", response_model=List[PostPublic])
 async def get_posts(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of posts to skip"),
     limit: int = Query(10, ge=1, le=100, description="Number of posts to return"), 
     author_id: Optional[str] = Query(None, description="Filter by author ID"),
@@ -160,11 +162,17 @@ async def get_posts(
     post_type: Optional[PostType] = Query(None, description="Filter by post type"),
     favorites_posts: Optional[bool] = Query(None, description="Filter to show only favorite posts"),
     favorite_tags: Optional[bool] = Query(None, description="Filter to show posts from favorite tags"),
+    after_ts: Optional[datetime] = Query(None, description="Keyset cursor: activity timestamp of the last post on the previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: ID of the last post on the previous page"),
     current_user: Dict[str, Any] = Depends(get_current_user_from_middleware),
     status: PostStatus = Query(PostStatus.PUBLISHED, description="Filter by status"),
     db: DatabaseService = Depends(get_db_service)
 ):
-    """Get posts with filtering and pagination (requires authentication)"""
+    """Get posts with filtering and pagination (requires authentication)
+    
+    On PostgreSQL, a full non-trending page carries the cursor for the next page
+    in the X-Next-After-Ts / X-Next-After-Id headers (pass them back as after_ts/after_id).
+    """
     try:
         # Log query parameters - just like log4j!
         logger.info(f"Fetching posts with params: skip={skip}, limit={limit}, author_id={author_id}, tag_id={tag_id}, post_type={post_type}, status={status}, trending={trending}, timeframe={timeframe}, favorites_posts={favorites_posts}, favorite_tags={favorite_tags}")
@@ -185,6 +193,10 @@ async def get_posts(
                 favorite_tags=favorite_tags
             )
         else:
+            # Keyset cursors are only understood by the PostgreSQL service
+            cursor_kwargs = {}
+            if settings.database_type == "postgresql" and after_ts and after_id:
+                cursor_kwargs = {'after_ts': after_ts, 'after_id': after_id}
             posts = await db.get_posts(
                 skip=skip,
                 limit=limit,
@@ -193,8 +205,14 @@ async def get_posts(
                 trending=trending,
                 timeframe=timeframe,
                 post_type=post_type,
-                status=status
+                status=status,
+                **cursor_kwargs
             )
+            # The cursor is the last row's feed ordering key: (COALESCE(updated_ts, created_ts), id)
+            if settings.database_type == "postgresql" and not trending and posts and len(posts) == limit:
+                last = posts[-1]
+                response.headers["X-Next-After-Ts"] = (last['updated_ts'] or last['created_ts']).isoformat()
+                response.headers["X-Next-After-Id"] = last['id']
 
         # Log the resulting posts
         logger.debug(f"Fetched {len(posts)} posts")
@@ -28,7 +28,7 @@ async def get_public_file(
         
         return await serve_cached_or_db_file(
             file_id=file_id,
-            db_getter_func=db.get_content_upload,
+            db_getter_func=db.get_content_upload_blob,
             access_checker_func=check_public_access,
             current_user=None  # No user for public access
         )
@@ -76,6 +76,18 @@ async def get_post_reactions(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching reactions: {str(e)}")
 
+@router.get("/post/{post_id}/summary", response_model=List[Dict[str, Any]])
+async def get_post_reaction_summary(
+    post_id: str,
+    db: DatabaseService = Depends(get_db_service),
+    user: Dict[str, Any] = Depends(get_current_user_from_middleware)
+):
+    """Get reaction counts per type for a post, flagging the current user's reactions"""
+    try:
+        return await db.get_reaction_summary(post_id, 'post', user_id=user.get("user_id"))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching reaction summary: {str(e)}")
+
 # Discussion/Comment Reaction Endpoints
 @router.post("/discussion/{discussion_id}/add", response_model=ReactionResponse)
 async def add_reaction_to_discussion(
@@ -125,6 +137,18 @@ async def get_discussion_reactions(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching reactions: {str(e)}")
 
+@router.get("/discussion/{discussion_id}/summary", response_model=List[Dict[str, Any]])
+async def get_discussion_reaction_summary(
+    discussion_id: str,
+    db: DatabaseService = Depends(get_db_service),
+    user: Dict[str, Any] = Depends(get_current_user_from_middleware)
+):
+    """Get reaction counts per type for a discussion/comment, flagging the current user's reactions"""
+    try:
+        return await db.get_reaction_summary(discussion_id, 'discussion', user_id=user.get("user_id"))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching reaction summary: {str(e)}")
+
 @router.get("/favorites/tags", response_model=Dict[str, List[str]])
 async def get_user_favorite_tags(
     db: DatabaseService = Depends(get_db_service),
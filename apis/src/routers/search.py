@@ -133,14 +133,14 @@ async def traditional_database_search(
         # Add post type filter if specified
         if post_types:
             if settings.database_type == "postgresql":
-                # PostgreSQL uses numbered placeholders
-                start_param = len(params) + 1
-                placeholders = ",".join([f"${i}" for i in range(start_param, start_param + len(post_types))])
+                # PostgreSQL binds the whole list as one array parameter
+                base_query += f" AND p.post_type_id = ANY(${len(params) + 1}::text[])"
+                params.append(list(post_types))
             else:
                 # SQLite uses ? placeholders
                 placeholders = ",".join(["?" for _ in post_types])
-            base_query += f" AND p.post_type_id IN ({placeholders})"
-            params.extend(post_types)
+                base_query += f" AND p.post_type_id IN ({placeholders})"
+                params.extend(post_types)
         
         # Add grouping and ordering (simplified to avoid tt.name reference issues)
         base_query += """
@@ -394,11 +394,13 @@ async def get_posts_to_index(db_service: DatabaseService, force_reindex: bool =
             # Get all published posts
             if post_types:
                 if settings.database_type == "postgresql":
-                    # Use numbered placeholders for PostgreSQL
-                    placeholders = ', '.join([f'${i+1}' for i in range(len(post_types))])
+                    # PostgreSQL binds the whole list as one array parameter
+                    post_type_filter = "= ANY($1::text[])"
+                    post_type_params = (list(post_types),)
                 else:
                     # Use ? placeholders for SQLite
-                    placeholders = ', '.join(['?' for _ in post_types])
+                    post_type_filter = f"IN ({', '.join(['?' for _ in post_types])})"
+                    post_type_params = tuple(post_types)
                 
                 posts_query = f"""
                     SELECT p.id, p.title, p.post_type_id, p.author_id, p.created_ts,
@@ -409,11 +411,11 @@ async def get_posts_to_index(db_service: DatabaseService, force_reindex: bool =
                     JOIN users u ON p.author_id = u.id
                     LEFT JOIN post_tags pt ON p.id = pt.post_id
                     LEFT JOIN tag_types tt ON pt.tag_id = tt.id
-                    WHERE p.status = 'published' AND p.post_type_id IN ({placeholders})
+                    WHERE p.status = 'published' AND p.post_type_id {post_type_filter}
                     GROUP BY p.id
                 """
                 
-                posts = await db_service.execute_query(posts_query, tuple(post_types))
+                posts = await db_service.execute_query(posts_query, post_type_params)
             else:
                 posts_query = f"""
                     SELECT p.id, p.title, p.post_type_id, p.author_id, p.created_ts,
@@ -294,9 +294,9 @@ async def update_user_roles(
         current_role_ids = {r['role_id'] for r in current_assignments}
 
         # Assign missing roles
-        for role_id in to_set:
-            if role_id not in current_role_ids:
-                await db.assign_role_to_user(user_id, role_id, assigned_by=current_user.get('user_id'))
+        missing_roles = [role_id for role_id in to_set if role_id not in current_role_ids]
+        if missing_roles:
+            await db.assign_roles_to_user(user_id, missing_roles, assigned_by=current_user.get('user_id'))
 
         # Remove roles not requested
         for role_id in current_role_ids:
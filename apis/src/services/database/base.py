@@ -4,7 +4,7 @@ Defines the contract for all database implementations
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 
 from ...models.user import User
 from ...models.post import Post, PostType, PostStatus
@@ -64,6 +64,11 @@ class DatabaseService(ABC):
         """Assign a role to a user"""
         pass
 
+    async def assign_roles_to_user(self, user_id: str, role_ids: List[str], assigned_by: str = None) -> bool:
+        """Assign several roles to a user (services may override with a batched implementation)"""
+        results = [await self.assign_role_to_user(user_id, role_id, assigned_by=assigned_by) for role_id in role_ids]
+        return all(results)
+
     @abstractmethod
     async def remove_role_from_user(self, user_id: str, role_id: str) -> bool:
         """Remove a role assignment from a user"""
@@ -187,6 +192,15 @@ class DatabaseService(ABC):
         """Add a reaction to a post, discussion, or tag"""
         pass
     
+    async def add_reactions_bulk(self, reactions: List[Dict[str, Any]]) -> int:
+        """Add several reactions (target_id, user_id, reaction_type, optional target_type); returns the number added"""
+        added = 0
+        for reaction in reactions:
+            await self.add_reaction(reaction['target_id'], reaction['user_id'], reaction['reaction_type'],
+                                    target_type=reaction.get('target_type', 'post'))
+            added += 1
+        return added
+    
     @abstractmethod
     async def remove_reaction(self, target_id: str, user_id: str, reaction_type: str, target_type: str = 'post') -> bool:
         """Remove a reaction from a post, discussion, or tag"""
@@ -197,6 +211,24 @@ class DatabaseService(ABC):
         """Get reactions for a target (post, discussion, tag)"""
         pass
     
+    async def get_reaction_summary(self, target_id: str, target_type: str = 'post',
+                                   user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get one row per reaction type with its count and whether user_id reacted (services may aggregate in the database)"""
+        summary: Dict[str, Dict[str, Any]] = {}
+        for reaction in await self.get_reactions(target_id, target_type):
+            reaction_type = reaction.get('reaction_type') or reaction.get('event_type_id')
+            entry = summary.setdefault(reaction_type, {
+                'reaction_type': reaction_type,
+                'icon': reaction.get('icon'),
+                'color': reaction.get('color'),
+                'count': 0,
+                'user_reacted': False,
+            })
+            entry['count'] += 1
+            if user_id and reaction.get('user_id') == user_id:
+                entry['user_reacted'] = True
+        return sorted(summary.values(), key=lambda entry: entry['count'], reverse=True)
+    
     @abstractmethod
     async def get_post_reactions(self, post_id: str) -> List[Dict[str, Any]]:
         """Get reactions for a post"""
@@ -235,6 +267,11 @@ class DatabaseService(ABC):
         """Execute a query and return results"""
         pass
     
+    async def iter_query(self, query: str, params: tuple = ()) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the rows of a query one at a time (backends that can stream override this)"""
+        for row in await self.execute_query(query, params):
+            yield row
+    
     @abstractmethod
     async def execute_command(self, command: str, params: tuple = ()) -> bool:
         """Execute a command (INSERT, UPDATE, DELETE)"""
@@ -287,6 +324,10 @@ class DatabaseService(ABC):
         """Get file upload data by ID"""
         pass
     
+    async def get_content_upload_blob(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """Get file upload metadata together with file_data (services may override when get_content_upload omits it)"""
+        return await self.get_content_upload(file_id)
+    
     @abstractmethod
     async def get_user_uploads(self, user_id: str, visibility: Optional[str] = None, 
                               tags: Optional[List[str]] = None, search: Optional[str] = None,
@@ -294,6 +335,16 @@ class DatabaseService(ABC):
         """Get user's uploaded files with filtering"""
         pass
     
+    async def get_user_uploads_page(self, user_id: str, visibility: Optional[str] = None,
+                                    tags: Optional[List[str]] = None, search: Optional[str] = None,
+                                    sort_by: str = "recent", limit: int = 50, offset: int = 0,
+                                    **cursor) -> Tuple[List[Dict[str, Any]], int]:
+        """Get one page of user's uploaded files plus the total count (services may fetch both in one query)"""
+        files = await self.get_user_uploads(user_id, visibility=visibility, tags=tags, search=search,
+                                            sort_by=sort_by, limit=limit, offset=offset, **cursor)
+        total = await self.count_user_uploads(user_id, visibility=visibility, tags=tags, search=search)
+        return files, total
+    
     @abstractmethod
     async def count_user_uploads(self, user_id: str, visibility: Optional[str] = None, 
                                 tags: Optional[List[str]] = None, search: Optional[str] = None) -> int:
@@ -13,7 +13,7 @@ class DatabaseMigration:
     """Database migration and versioning system"""
     
     # Current database version
-    CURRENT_VERSION = "2.1.0"
+    CURRENT_VERSION = "2.7.0"
     
     # SQLite-specific migrations
     SQLITE_MIGRATIONS: Dict[str, str] = {
@@ -112,6 +112,36 @@ class DatabaseMigration:
             CURRENT_TIMESTAMP,
             'ef85dcf4-97dd-4ccb-b481-93067b0cfd27'  -- System user
         );
+        """,
+        
+        "2.2.0": """
+        -- Feed ordering index for keyset pagination in get_posts
+        CREATE INDEX IF NOT EXISTS idx_posts_feed_order
+            ON posts(status, is_latest, COALESCE(updated_ts, created_ts) DESC, id DESC);
+        """,
+        
+        "2.3.0": """
+        -- Post counters are denormalized by triggers in PostgreSQL only
+        """,
+        
+        "2.4.0": """
+        -- Keyset pagination indexes for recent comments and per-user uploads
+        CREATE INDEX IF NOT EXISTS idx_post_discussions_recent
+            ON post_discussions(created_ts DESC, id DESC) WHERE is_deleted = FALSE;
+        CREATE INDEX IF NOT EXISTS idx_content_uploads_user_recent
+            ON content_uploads(uploaded_by, created_ts DESC, id DESC) WHERE is_deleted = FALSE;
+        """,
+        
+        "2.5.0": """
+        -- Trigram search indexes are PostgreSQL only (pg_trgm)
+        """,
+        
+        "2.6.0": """
+        -- Upload blobs stay inline in content_uploads on SQLite
+        """,
+        
+        "2.7.0": """
+        -- Site setting uniqueness over NULL user_id is enforced in PostgreSQL only
         """
     }
     
@@ -216,6 +246,137 @@ class DatabaseMigration:
             'ef85dcf4-97dd-4ccb-b481-93067b0cfd27'  -- System user
         )
         ON CONFLICT (id) DO NOTHING;
+        """,
+        
+        "2.2.0": """
+        -- Feed ordering index for keyset pagination in get_posts
+        CREATE INDEX IF NOT EXISTS idx_posts_feed_order
+            ON posts(status, is_latest, COALESCE(updated_ts, created_ts) DESC, id DESC);
+        """,
+        
+        "2.3.0": """
+        -- Denormalized per-post counters, kept current by triggers
+        ALTER TABLE posts ADD COLUMN IF NOT EXISTS reaction_count INTEGER NOT NULL DEFAULT 0;
+        ALTER TABLE posts ADD COLUMN IF NOT EXISTS view_count INTEGER NOT NULL DEFAULT 0;
+        ALTER TABLE posts ADD COLUMN IF NOT EXISTS comment_count INTEGER NOT NULL DEFAULT 0;
+        
+        CREATE OR REPLACE FUNCTION posts_reaction_count_trg() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' AND NEW.target_type = 'post' THEN
+                UPDATE posts SET reaction_count = reaction_count + 1 WHERE id = NEW.target_id;
+            ELSIF TG_OP = 'DELETE' AND OLD.target_type = 'post' THEN
+                UPDATE posts SET reaction_count = GREATEST(reaction_count - 1, 0) WHERE id = OLD.target_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        
+        CREATE OR REPLACE FUNCTION posts_view_count_trg() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' AND NEW.target_type = 'post' AND NEW.event_type_id = 'event-view' THEN
+                UPDATE posts SET view_count = view_count + 1 WHERE id = NEW.target_id;
+            ELSIF TG_OP = 'DELETE' AND OLD.target_type = 'post' AND OLD.event_type_id = 'event-view' THEN
+                UPDATE posts SET view_count = GREATEST(view_count - 1, 0) WHERE id = OLD.target_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        
+        CREATE OR REPLACE FUNCTION posts_comment_count_trg() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE posts SET comment_count = comment_count + 1 WHERE id = NEW.post_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE posts SET comment_count = GREATEST(comment_count - 1, 0) WHERE id = OLD.post_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        
+        DROP TRIGGER IF EXISTS trg_posts_reaction_count ON reactions;
+        CREATE TRIGGER trg_posts_reaction_count AFTER INSERT OR DELETE ON reactions
+            FOR EACH ROW EXECUTE FUNCTION posts_reaction_count_trg();
+        DROP TRIGGER IF EXISTS trg_posts_view_count ON user_events;
+        CREATE TRIGGER trg_posts_view_count AFTER INSERT OR DELETE ON user_events
+            FOR EACH ROW EXECUTE FUNCTION posts_view_count_trg();
+        DROP TRIGGER IF EXISTS trg_posts_comment_count ON post_discussions;
+        CREATE TRIGGER trg_posts_comment_count AFTER INSERT OR DELETE ON post_discussions
+            FOR EACH ROW EXECUTE FUNCTION posts_comment_count_trg();
+        
+        -- One-time backfill from the source tables
+        UPDATE posts p SET
+            reaction_count = (SELECT COUNT(*) FROM reactions r WHERE r.target_id = p.id AND r.target_type = 'post'),
+            view_count = (SELECT COUNT(*) FROM user_events ue
+                          WHERE ue.target_id = p.id AND ue.target_type = 'post' AND ue.event_type_id = 'event-view'),
+            comment_count = (SELECT COUNT(*) FROM post_discussions pd WHERE pd.post_id = p.id);
+        """,
+        
+        "2.4.0": """
+        -- Keyset pagination indexes for recent comments and per-user uploads
+        CREATE INDEX IF NOT EXISTS idx_post_discussions_recent
+            ON post_discussions(created_ts DESC, id DESC) WHERE is_deleted = FALSE;
+        CREATE INDEX IF NOT EXISTS idx_content_uploads_user_recent
+            ON content_uploads(uploaded_by, created_ts DESC, id DESC) WHERE is_deleted = FALSE;
+        """,
+        
+        "2.5.0": """
+        -- Trigram indexes so search ILIKE '%term%' predicates can use GIN instead of seq scans.
+        -- pg_trgm may need a superuser; without it the indexes are skipped and search still works.
+        DO $$
+        BEGIN
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        EXCEPTION WHEN insufficient_privilege THEN
+            RAISE NOTICE 'pg_trgm not available: %', SQLERRM;
+        END
+        $$;
+        
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+                CREATE INDEX IF NOT EXISTS idx_posts_title_trgm
+                    ON posts USING gin (title gin_trgm_ops);
+                CREATE INDEX IF NOT EXISTS idx_posts_feed_content_trgm
+                    ON posts USING gin (feed_content gin_trgm_ops);
+                CREATE INDEX IF NOT EXISTS idx_posts_content_current_trgm
+                    ON posts_content USING gin (content gin_trgm_ops) WHERE is_current = TRUE;
+            END IF;
+        END
+        $$;
+        """,
+        
+        "2.6.0": """
+        -- Move upload bytes out of content_uploads so metadata rows stay small.
+        -- Uploads are mostly already-compressed media, so skip TOAST compression.
+        CREATE TABLE IF NOT EXISTS content_uploads_blob (
+            upload_id VARCHAR(50) PRIMARY KEY REFERENCES content_uploads(id) ON DELETE CASCADE,
+            file_data BYTEA NOT NULL
+        );
+        ALTER TABLE content_uploads_blob ALTER COLUMN file_data SET STORAGE EXTERNAL;
+        
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM information_schema.columns
+                       WHERE table_name = 'content_uploads' AND column_name = 'file_data') THEN
+                INSERT INTO content_uploads_blob (upload_id, file_data)
+                SELECT id, file_data FROM content_uploads WHERE file_data IS NOT NULL
+                ON CONFLICT (upload_id) DO NOTHING;
+                ALTER TABLE content_uploads DROP COLUMN file_data;
+            END IF;
+        END
+        $$;
+        """,
+        
+        "2.7.0": """
+        -- UNIQUE(setting_key, user_id) lets global settings (NULL user_id) repeat;
+        -- keep the most recently updated row per key and enforce one from now on
+        DELETE FROM site_settings s
+        USING site_settings d
+        WHERE s.setting_key = d.setting_key
+          AND s.user_id IS NOT DISTINCT FROM d.user_id
+          AND (COALESCE(s.updated_ts, s.created_ts), s.id) < (COALESCE(d.updated_ts, d.created_ts), d.id);
+        
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_site_settings_key_user
+            ON site_settings (setting_key, COALESCE(user_id, ''));
         """
     }
     
@@ -356,7 +517,15 @@ class DatabaseMigration:
             if current_version is None:
                 # Fresh installation - run full bootstrap
                 logger.info("🆕 Fresh database detected, running full bootstrap")
-                return await db_service.run_full_bootstrap()
+                if not await db_service.run_full_bootstrap():
+                    return False
+                
+                # bootstrap.sql seeds the base schema version; bring it up to date right away
+                needs_migration, current_version, target_version = await DatabaseMigration.needs_migration(db_service)
+                if needs_migration and current_version:
+                    logger.info(f"🔄 Applying migrations after bootstrap: {current_version} -> {target_version}")
+                    return await DatabaseMigration.run_migrations(db_service, current_version)
+                return True
             
             elif needs_migration:
                 # Existing database needs upgrade
@@ -3,12 +3,16 @@ PostgreSQL Database Service Implementation
 Provides PostgreSQL-specific database operations
 """
 
+import asyncio
 import asyncpg
+import functools
 import logging
-import json
+import orjson
 import re
+import time
 import uuid
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Set, Tuple
 
 from .base import DatabaseService
 from ...config.settings import settings
@@ -16,6 +20,346 @@ from ...config.settings import settings
 logger = logging.getLogger(__name__)
 
 
+# Opening/closing tag of a dollar-quoted string: $$ or $name$ (not $1 placeholders)
+_DOLLAR_QUOTE_TAG = re.compile(r'\$(?:[A-Za-z_][A-Za-z_0-9]*)?\$')
+
+
+def _iter_sql_statements(sql: str) -> Iterator[str]:
+    """Yield the statements of a SQL script in a single pass.
+    
+    Splits on ';' only outside quoted literals/identifiers, dollar-quoted bodies and
+    comments. Comments between statements are skipped, so every statement starts
+    with its keyword.
+    """
+    length = len(sql)
+    start: Optional[int] = None
+    i = 0
+    while i < length:
+        char = sql[i]
+        if char == '-' and sql.startswith('--', i):
+            end = sql.find('\n', i)
+            i = length if end == -1 else end + 1
+            continue
+        if char == '/' and sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+            continue
+        if char == ';':
+            if start is not None:
+                statement = sql[start:i].strip()
+                if statement:
+                    yield statement
+                start = None
+            i += 1
+            continue
+        if start is None:
+            if char.isspace():
+                i += 1
+                continue
+            start = i
+        if char == "'" or char == '"':
+            # A doubled quote ('') simply re-enters this branch as a new literal
+            end = sql.find(char, i + 1)
+            i = length if end == -1 else end + 1
+            continue
+        if char == '$':
+            match = _DOLLAR_QUOTE_TAG.match(sql, i)
+            if match:
+                end = sql.find(match.group(0), match.end())
+                i = length if end == -1 else end + len(match.group(0))
+                continue
+        i += 1
+    if start is not None:
+        statement = sql[start:].strip()
+        if statement:
+            yield statement
+
+
+# Conflict targets for tables with known constraints when converting INSERT OR IGNORE
+_CONFLICT_CLAUSES = {
+    'users': 'ON CONFLICT (id) DO NOTHING',
+    'posts': 'ON CONFLICT (id) DO NOTHING',
+    'posts_content': 'ON CONFLICT (id) DO NOTHING',
+    'post_types': 'ON CONFLICT (id) DO NOTHING',
+    'tag_types': 'ON CONFLICT (id) DO NOTHING',
+    'event_types': 'ON CONFLICT (id) DO NOTHING',
+    'reactions': 'ON CONFLICT (event_type_id, user_id, target_type, target_id) DO NOTHING',
+    'post_tags': 'ON CONFLICT (post_id, tag_id) DO NOTHING',
+    'post_discussions': 'ON CONFLICT (id) DO NOTHING',
+    'user_events': 'ON CONFLICT (id) DO NOTHING',
+    'user_stats': 'ON CONFLICT (user_id) DO NOTHING',
+    'tag_stats': 'ON CONFLICT (tag_id) DO NOTHING',
+    'kb_types': 'ON CONFLICT (id) DO NOTHING',
+    'knowledge_base': 'ON CONFLICT (id) DO NOTHING',
+    'kb_index_triggers': 'ON CONFLICT (id) DO NOTHING',
+    'kb_indexes': 'ON CONFLICT (id) DO NOTHING',
+    'kb_metadata': 'ON CONFLICT (id) DO NOTHING'
+}
+
+_INSERT_OR_IGNORE = re.compile(r'INSERT\s+OR\s+IGNORE\s+INTO\s+(\w+)(\s+.*?);', re.IGNORECASE | re.DOTALL)
+
+# Explicit column lists for hot getters; upload listings leave out the file_data blob
+_TAG_COLUMNS = "id, name, description, color, category, is_active, created_ts, updated_ts, created_by"
+_UPLOAD_META_COLUMNS = """cu.id, cu.filename, cu.original_filename, cu.content_type, cu.file_size,
+                   cu.uploaded_by, cu.is_public, cu.visibility, cu.title, cu.description,
+                   cu.created_ts, cu.updated_ts, cu.created_by, cu.updated_by,
+                   cu.is_deleted, cu.deleted_ts, cu.deleted_by"""
+_DISCUSSION_COLUMNS = """pd.id, pd.post_id, pd.post_revision, pd.parent_discussion_id, pd.author_id,
+                   pd.content, pd.content_type, pd.is_edited, pd.edit_reason, pd.is_deleted,
+                   pd.delete_reason, pd.thread_level, pd.thread_path, pd.created_ts, pd.updated_ts,
+                   pd.created_by, pd.updated_by, pd.deleted_ts, pd.deleted_by"""
+
+# Upload listing filter; $3 visibility, $4 search pattern and $5 tag names are NULL when unused
+_UPLOAD_FILTER_SQL = """cu.uploaded_by = $1 AND cu.is_deleted = $2
+                AND ($3::text IS NULL OR cu.visibility = $3)
+                AND ($4::text IS NULL OR cu.title ILIKE $4 OR cu.original_filename ILIKE $4
+                     OR cu.description ILIKE $4)
+                AND ($5::text[] IS NULL OR EXISTS (
+                    SELECT 1
+                    FROM content_upload_tags cut
+                    JOIN tag_types tt ON cut.tag_id = tt.id
+                    WHERE cut.upload_id = cu.id AND tt.name = ANY($5::text[])
+                ))"""
+
+# Upload metadata update; $2.. follow _UPLOAD_UPDATE_FIELDS and NULL keeps the current value
+_UPLOAD_UPDATE_FIELDS = ('title', 'description', 'visibility', 'is_public', 'updated_by', 'is_deleted')
+_UPDATE_UPLOAD_SQL = """
+    UPDATE content_uploads SET
+        title = COALESCE($2, title),
+        description = COALESCE($3, description),
+        visibility = COALESCE($4, visibility),
+        is_public = COALESCE($5, is_public),
+        updated_by = COALESCE($6, updated_by),
+        is_deleted = COALESCE($7, is_deleted),
+        updated_ts = CURRENT_TIMESTAMP
+    WHERE id = $1
+"""
+
+# Resolve a post tag by name in one round-trip: an active tag with that name, else a
+# newly created one whose ID is the slug (ASCII letters/digits, lowercased, spaces to
+# hyphens), else the existing tag already holding that slug.
+_RESOLVE_TAG_SQL = """
+    WITH t AS (
+        SELECT $1::text AS name,
+               lower(replace(regexp_replace($1::text, '[^a-zA-Z0-9 ]', '', 'g'), ' ', '-')) AS slug
+    ), existing AS (
+        SELECT tt.id FROM tag_types tt, t WHERE tt.name = t.name AND tt.is_active = TRUE
+    ), created AS (
+        INSERT INTO tag_types (id, name, description, created_by)
+        SELECT t.slug, t.name, 'Auto-created tag: ' || t.name, $2 FROM t
+        WHERE NOT EXISTS (SELECT 1 FROM existing)
+        ON CONFLICT DO NOTHING
+        RETURNING id
+    )
+    SELECT COALESCE(
+               (SELECT id FROM existing LIMIT 1),
+               (SELECT id FROM created),
+               (SELECT tt.id FROM tag_types tt, t WHERE tt.id = t.slug)
+           ) AS id,
+           EXISTS (SELECT 1 FROM created) AS created
+"""
+
+# Single post with author, post type, current content and tag names
+# Per-row counts for databases without the posts counter columns from migration 2.3.0
+# (bootstrap.sql does not create them, so they are missing when SKIP_MIGRATIONS=true)
+_POST_COUNT_SUBQUERIES = """,
+           (
+               SELECT COUNT(*)
+               FROM reactions r
+               WHERE r.target_id = p.id AND r.target_type = 'post'
+           ) AS reaction_count,
+           (
+               SELECT COUNT(*)
+               FROM user_events ue
+               WHERE ue.target_id = p.id AND ue.target_type = 'post' AND ue.event_type_id = 'event-view'
+           ) AS view_count,
+           (
+               SELECT COUNT(*)
+               FROM post_discussions pd
+               WHERE pd.post_id = p.id
+           ) AS comment_count"""
+
+_POST_BY_ID_TEMPLATE = """
+    SELECT p.*, pt.name as post_type_name, u.username, u.display_name,
+           u.email, u.avatar_url, pc.content, pc.revision,
+           (
+               SELECT string_agg(tt.name, ', ')
+               FROM post_tags ptg
+               JOIN tag_types tt ON ptg.tag_id = tt.id
+               WHERE ptg.post_id = p.id
+           ) AS tags{counts}
+    FROM posts p
+    JOIN post_types pt ON p.post_type_id = pt.id
+    JOIN users u ON p.author_id = u.id
+    LEFT JOIN posts_content pc ON p.id = pc.post_id AND pc.is_current = $1
+    WHERE p.id = $2
+"""
+_POST_BY_ID_SQL = _POST_BY_ID_TEMPLATE.format(counts='')
+_POST_BY_ID_LEGACY_SQL = _POST_BY_ID_TEMPLATE.format(counts=_POST_COUNT_SUBQUERIES)
+
+# Optional schema pieces added by migrations, as existence checks (see _has_schema_feature)
+_SCHEMA_FEATURE_SQL = {
+    # 2.3.0: trigger-maintained reaction/view/comment counters on posts
+    'post_counters': """SELECT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'posts' AND column_name = 'reaction_count')""",
+    # 2.6.0: upload bytes moved from content_uploads.file_data to content_uploads_blob
+    'upload_blob_table': """SELECT EXISTS (
+        SELECT 1 FROM information_schema.tables
+        WHERE table_schema = current_schema() AND table_name = 'content_uploads_blob')""",
+}
+
+# Reaction upsert; the event_types CTE rejects unknown reaction types (no row returned)
+_UPSERT_REACTION_SQL = """
+    WITH et AS (SELECT id FROM event_types WHERE id = $1 AND category = 'reaction')
+    INSERT INTO reactions
+        (id, event_type_id, user_id, target_type, target_id, target_revision, reaction_value)
+    SELECT gen_random_uuid()::text, et.id, $2, $3, $4, $5, $6 FROM et
+    ON CONFLICT (event_type_id, user_id, target_type, target_id)
+    DO UPDATE SET reaction_value = EXCLUDED.reaction_value, updated_ts = CURRENT_TIMESTAMP
+    RETURNING id, created_ts
+"""
+
+
+# Site setting statements are fixed texts, so each pooled connection parses and plans them
+# once and then reuses the prepared statement from asyncpg's statement cache
+_GET_SITE_SETTING_SQL = """
+    SELECT id, setting_key, setting_value, setting_type, user_id, description,
+           is_active, created_ts, updated_ts, created_by, updated_by
+    FROM site_settings
+    WHERE setting_key = $1 AND user_id IS NOT DISTINCT FROM $2::text AND is_active = TRUE
+"""
+
+# Site setting upsert ($1 key, $2 value, $3 type, $4 description, $5 user_id or NULL for global).
+# Written as UPDATE-then-INSERT because global settings have a NULL user_id, which a plain
+# UNIQUE(setting_key, user_id) cannot match; uq_site_settings_key_user backs it against races.
+_UPSERT_SITE_SETTING_SQL = """
+    WITH actor AS (
+        SELECT COALESCE($5::text,
+                        (SELECT id FROM users WHERE username = 'system' AND is_active = TRUE LIMIT 1)) AS id
+    ), updated AS (
+        UPDATE site_settings
+        SET setting_value = $2, setting_type = $3, description = $4,
+            updated_ts = CURRENT_TIMESTAMP, updated_by = (SELECT id FROM actor)
+        WHERE setting_key = $1 AND user_id IS NOT DISTINCT FROM $5::text
+        RETURNING 1
+    )
+    INSERT INTO site_settings
+        (id, setting_key, setting_value, setting_type, user_id, description, created_by, updated_by)
+    SELECT gen_random_uuid()::text, $1, $2, $3, $5::text, $4, actor.id, actor.id FROM actor
+    WHERE NOT EXISTS (SELECT 1 FROM updated)
+"""
+
+
+@functools.lru_cache(maxsize=512)
+def _to_pg_placeholders(query: str) -> str:
+    """Rewrite ? placeholders as $n; memoized so each SQL text is converted once
+    
+    The converted text is what asyncpg keys its per-connection prepared-statement
+    cache on, so it must stay identical across calls for the same query.
+    """
+    if '?' not in query:
+        return query
+    idx = 0
+    def repl(_match):
+        nonlocal idx
+        idx += 1
+        return f'${idx}'
+    return re.sub(r'\?', repl, query)
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string using orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _naive_utc(ts: Optional[datetime]) -> Optional[datetime]:
+    """Keyset cursor timestamps bind to TIMESTAMP (no time zone) columns, so aware values become naive UTC"""
+    if ts is not None and ts.tzinfo is not None:
+        return ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Pool init hook: encode/decode json and jsonb columns with orjson instead of stdlib json"""
+    for type_name in ('json', 'jsonb'):
+        await conn.set_type_codec(type_name, encoder=_json_dumps, decoder=orjson.loads, schema='pg_catalog')
+
+
+# Seconds that small, read-mostly reference tables (tags, role types) are served from memory
+REFERENCE_CACHE_TTL = 30
+
+_POSTS_TIMEFRAME_INTERVALS = {
+    'today': '1 day',
+    'week': '7 days',
+    'month': '30 days',
+}
+
+# Feed query text keyed by filter shape; a fixed set of SQL strings keeps the
+# asyncpg statement cache (and the server-side plans behind it) warm.
+POSTS_QUERIES: Dict[Tuple[bool, bool, bool, bool, Optional[str], bool, bool], str] = {}
+
+
+def _posts_query(trending: bool, has_author: bool, has_type: bool, has_tag: bool,
+                 timeframe: Optional[str], use_cursor: bool, has_counters: bool = True) -> str:
+    """Return the get_posts SQL for a filter shape, building it on first use"""
+    key = (trending, has_author, has_type, has_tag, timeframe, use_cursor, has_counters)
+    query = POSTS_QUERIES.get(key)
+    if query is not None:
+        return query
+    
+    # Reaction/view/comment counts are denormalized onto posts (p.*) by triggers;
+    # without the counter columns they are counted per row instead
+    parts = ["""
+            SELECT p.*, pt.name as post_type_name, u.username, u.display_name,
+                   u.email, u.avatar_url,
+                   (
+                       SELECT string_agg(tt.name, ', ')
+                       FROM post_tags ptg
+                       JOIN tag_types tt ON ptg.tag_id = tt.id
+                       WHERE ptg.post_id = p.id
+                   ) AS tags, p.feed_content as content""",
+             "" if has_counters else _POST_COUNT_SUBQUERIES,
+             """
+            FROM posts p
+            JOIN post_types pt ON p.post_type_id = pt.id
+            JOIN users u ON p.author_id = u.id
+            WHERE p.status = $1 AND p.is_latest = $2"""]
+    param_count = 2
+    
+    if timeframe:
+        parts.append(f" AND p.created_ts >= NOW() - INTERVAL '{_POSTS_TIMEFRAME_INTERVALS[timeframe]}'")
+    if has_author:
+        param_count += 1
+        parts.append(f" AND p.author_id = ${param_count}")
+    if has_type:
+        param_count += 1
+        parts.append(f" AND pt.id = ${param_count}")
+    if has_tag:
+        param_count += 1
+        parts.append(f" AND EXISTS (SELECT 1 FROM post_tags ptg WHERE ptg.post_id = p.id AND ptg.tag_id = ${param_count})")
+    if use_cursor:
+        parts.append(f" AND (COALESCE(p.updated_ts, p.created_ts), p.id) < (${param_count + 1}, ${param_count + 2})")
+        param_count += 2
+    
+    # Order by reaction count for trending, otherwise by most recent activity (updated or created)
+    if trending:
+        reaction_order = "p.reaction_count" if has_counters else "reaction_count"
+        parts.append(f" ORDER BY {reaction_order} DESC, COALESCE(p.updated_ts, p.created_ts) DESC, p.id DESC")
+    else:
+        parts.append(" ORDER BY COALESCE(p.updated_ts, p.created_ts) DESC, p.id DESC")
+    
+    param_count += 1
+    parts.append(f" LIMIT ${param_count}")
+    if not use_cursor:
+        parts.append(f" OFFSET ${param_count + 1}")
+    
+    query = ''.join(parts)
+    POSTS_QUERIES[key] = query
+    return query
+
+
+
 class PostgreSQLService(DatabaseService):
     """PostgreSQL database service implementation"""
     
@@ -23,6 +367,13 @@ class PostgreSQLService(DatabaseService):
         """Initialize PostgreSQL service"""
         self.database_url = settings.get_database_url()  # Use get_database_url() method
         self.connection_pool: Optional[asyncpg.Pool] = None
+        # Reference table cache: key -> (expires_at, rows)
+        self._reference_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._reference_cache_locks: Dict[str, asyncio.Lock] = {}
+        # Names of tables known to exist; the app never drops tables, so hits never go stale
+        self._known_tables: Set[str] = set()
+        # Migration-added schema pieces: name -> (checked_at, present); reset after bootstrap/migrations
+        self._schema_features: Dict[str, Tuple[float, bool]] = {}
         
     async def initialize(self):
         """Initialize PostgreSQL database connection pool"""
@@ -30,9 +381,13 @@ class PostgreSQLService(DatabaseService):
             # Create connection pool
             self.connection_pool = await asyncpg.create_pool(
                 self.database_url,
-                min_size=2,
+                min_size=min(settings.db_pool_min_size, settings.db_pool_size),
                 max_size=settings.db_pool_size,
-                command_timeout=60
+                max_queries=settings.db_pool_max_queries,
+                max_inactive_connection_lifetime=settings.db_pool_max_inactive_lifetime,
+                command_timeout=60,
+                statement_cache_size=settings.db_statement_cache_size,
+                init=_init_connection
             )
             
             # Test connection
@@ -100,7 +455,7 @@ class PostgreSQLService(DatabaseService):
             from pathlib import Path
             bootstrap_sql_path = Path(__file__).parent.parent.parent.parent / "bootstrap.sql"
             
-            logger.debug(f"📂 Looking for bootstrap SQL at: {bootstrap_sql_path}")
+            logger.debug("📂 Looking for bootstrap SQL at: %s", bootstrap_sql_path)
             
             if not bootstrap_sql_path.exists():
                 logger.warning(f"❌ Bootstrap SQL file not found: {bootstrap_sql_path}")
@@ -110,7 +465,9 @@ class PostgreSQLService(DatabaseService):
             with open(bootstrap_sql_path, 'r', encoding='utf-8') as file:
                 sql_content = file.read()
                 
-            logger.info(f"📊 Loaded bootstrap SQL: {len(sql_content)} characters, {len(sql_content.split(';'))} statements")
+            logger.info("📊 Loaded bootstrap SQL: %d characters", len(sql_content))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📊 Bootstrap SQL contains ~%d statements", sql_content.count(';'))
                 
             # Execute bootstrap SQL
             await self.execute_bootstrap(sql_content)
@@ -118,75 +475,104 @@ class PostgreSQLService(DatabaseService):
             
         except Exception as e:
             logger.error(f"❌ Failed to run database bootstrap: {e}")
-            logger.debug(f"🔍 Bootstrap error details: {str(e)}", exc_info=True)
+            logger.debug("🔍 Bootstrap error details: %s", e, exc_info=True)
             raise
             
     # Helper to convert SQLite-style '?' placeholders to PostgreSQL '$1, $2, ...'
     def _convert_placeholders(self, query: str) -> str:
-        if '?' not in query:
-            return query
-        idx = 0
-        def repl(_match):
-            nonlocal idx
-            idx += 1
-            return f'${idx}'
-        return re.sub(r'\?', repl, query)
+        return _to_pg_placeholders(query)
             
     async def execute_bootstrap(self, sql_content: str):
         """Execute bootstrap SQL script, converting SQLite syntax to PostgreSQL"""
         try:
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             async with self.connection_pool.acquire() as conn:
-                logger.debug(f"🔧 Starting bootstrap execution with {len(sql_content)} characters of SQL")
+                logger.debug("🔧 Starting bootstrap execution with %d characters of SQL", len(sql_content))
                 
                 # Convert SQLite-specific syntax to PostgreSQL
                 logger.debug("🔄 Converting SQLite syntax to PostgreSQL...")
                 pg_sql = self._convert_sqlite_to_postgres(sql_content)
                 
                 # Log conversion results
-                original_lines = len(sql_content.split('\n'))
-                converted_lines = len(pg_sql.split('\n'))
-                logger.debug(f"📝 SQL conversion complete: {original_lines} → {converted_lines} lines")
+                if debug_enabled:
+                    logger.debug("📝 SQL conversion complete: %d → %d lines",
+                                 sql_content.count('\n') + 1, pg_sql.count('\n') + 1)
                 
-                # Split SQL content into individual statements
-                statements = [stmt.strip() for stmt in pg_sql.split(';') if stmt.strip()]
-                logger.info(f"📊 Executing {len(statements)} SQL statements...")
+                # Split SQL content into individual statements (quote-aware)
+                statements = list(_iter_sql_statements(pg_sql))
+                total = len(statements)
+                logger.info(f"📊 Executing {total} SQL statements...")
                 
                 success_count = 0
                 warning_count = 0
                 
-                for i, statement in enumerate(statements, 1):
-                    if statement.strip():
+                # Runs of seed INSERTs are sent as a single multi-statement script
+                # (one round trip, one implicit transaction). Other statements, and
+                # any run that fails as a whole, are executed one by one so a bad
+                # statement only produces a warning.
+                i = 0
+                while i < total:
+                    j = i
+                    while j < total and statements[j][:6].upper() == 'INSERT':
+                        j += 1
+                    if j - i > 1:
                         try:
-                            # Log statement type for debugging
-                            stmt_type = statement.split()[0].upper() if statement.split() else "UNKNOWN"
-                            logger.debug(f"[{i}/{len(statements)}] Executing {stmt_type}: {statement[:50]}...")
-                            
-                            await conn.execute(statement)
+                            await conn.execute(';\n'.join(statements[i:j]))
+                            success_count += j - i
+                            logger.debug("✅ [%d-%d/%d] INSERT batch successful", i + 1, j, total)
+                            i = j
+                            continue
+                        except Exception as batch_error:
+                            logger.debug("🔁 INSERT batch [%d-%d/%d] failed, retrying per statement: %s",
+                                         i + 1, j, total, batch_error)
+                    else:
+                        j = i + 1
+                    
+                    for index in range(i, j):
+                        if await self._execute_bootstrap_statement(conn, statements[index], index + 1, total, debug_enabled):
                             success_count += 1
-                            
-                            if stmt_type in ['CREATE', 'INSERT']:
-                                logger.debug(f"✅ [{i}/{len(statements)}] {stmt_type} successful")
-                                
-                        except Exception as stmt_error:
+                        else:
                             warning_count += 1
-                            logger.warning(f"⚠️ [{i}/{len(statements)}] Statement execution warning: {stmt_error}")
-                            logger.debug(f"📋 Failed statement: {statement[:200]}...")
+                    i = j
                 
                 logger.info(f"✅ Bootstrap SQL executed: {success_count} successful, {warning_count} warnings")
+                return True
                 
         except Exception as e:
             logger.error(f"❌ Bootstrap execution failed: {e}")
             raise
+
+    async def _execute_bootstrap_statement(self, conn, statement: str, index: int, total: int,
+                                           debug_enabled: bool) -> bool:
+        """Execute a single bootstrap statement, logging a warning instead of raising on failure"""
+        try:
+            # Log statement type for debugging
+            if debug_enabled:
+                stmt_type = statement.split(None, 1)[0].upper()
+                logger.debug("[%d/%d] Executing %s: %s...", index, total, stmt_type, statement[:50])
+            
+            await conn.execute(statement)
+            
+            if debug_enabled and stmt_type in ('CREATE', 'INSERT'):
+                logger.debug("✅ [%d/%d] %s successful", index, total, stmt_type)
+            return True
+                
+        except Exception as stmt_error:
+            logger.warning("⚠️ [%d/%d] Statement execution warning: %s", index, total, stmt_error)
+            if debug_enabled:
+                logger.debug("📋 Failed statement: %s...", statement[:200])
+            return False
             
     def _convert_sqlite_to_postgres(self, sql_content: str) -> str:
         """Convert SQLite-specific syntax to PostgreSQL"""
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         logger.debug("🔍 Starting SQLite to PostgreSQL conversion...")
         
-        original_pragmas = len(re.findall(r'PRAGMA\s+[^;]*;', sql_content, flags=re.IGNORECASE))
-        original_inserts = len(re.findall(r'INSERT\s+OR\s+IGNORE', sql_content, flags=re.IGNORECASE))
-        
-        logger.debug(f"📊 Found {original_pragmas} PRAGMA statements to remove")
-        logger.debug(f"📊 Found {original_inserts} INSERT OR IGNORE statements to convert")
+        if debug_enabled:
+            original_pragmas = len(re.findall(r'PRAGMA\s+[^;]*;', sql_content, flags=re.IGNORECASE))
+            original_inserts = len(re.findall(r'INSERT\s+OR\s+IGNORE', sql_content, flags=re.IGNORECASE))
+            logger.debug("📊 Found %d PRAGMA statements to remove", original_pragmas)
+            logger.debug("📊 Found %d INSERT OR IGNORE statements to convert", original_inserts)
         
         # Remove SQLite PRAGMA statements
         sql_content = re.sub(r'PRAGMA\s+[^;]*;', '', sql_content, flags=re.IGNORECASE)
@@ -196,98 +582,109 @@ class PostgreSQLService(DatabaseService):
         # We need to do this carefully to place ON CONFLICT in the right position
         
         def convert_insert_statement(match):
-            full_statement = match.group(0)
-            table_name = match.group(1)
-            
-            logger.debug(f"🔧 Converting INSERT OR IGNORE for table: {table_name}")
+            table_name, body = match.group(1), match.group(2)
             
-            # Define specific conflict resolution for tables with known constraints
-            conflict_clause_map = {
-                'users': 'ON CONFLICT (id) DO NOTHING',
-                'posts': 'ON CONFLICT (id) DO NOTHING',
-                'posts_content': 'ON CONFLICT (id) DO NOTHING',
-                'post_types': 'ON CONFLICT (id) DO NOTHING',
-                'tag_types': 'ON CONFLICT (id) DO NOTHING',
-                'event_types': 'ON CONFLICT (id) DO NOTHING',
-                'reactions': 'ON CONFLICT (event_type_id, user_id, target_type, target_id) DO NOTHING',
-                'post_tags': 'ON CONFLICT (post_id, tag_id) DO NOTHING',
-                'post_discussions': 'ON CONFLICT (id) DO NOTHING',
-                'user_events': 'ON CONFLICT (id) DO NOTHING',
-                'user_stats': 'ON CONFLICT (user_id) DO NOTHING',
-                'tag_stats': 'ON CONFLICT (tag_id) DO NOTHING',
-                'kb_types': 'ON CONFLICT (id) DO NOTHING',
-                'knowledge_base': 'ON CONFLICT (id) DO NOTHING',
-                'kb_index_triggers': 'ON CONFLICT (id) DO NOTHING',
-                'kb_indexes': 'ON CONFLICT (id) DO NOTHING',
-                'kb_metadata': 'ON CONFLICT (id) DO NOTHING'
-            }
+            logger.debug("🔧 Converting INSERT OR IGNORE for table: %s", table_name)
             
-            conflict_clause = conflict_clause_map.get(table_name.lower(), 'ON CONFLICT DO NOTHING')
-            logger.debug(f"📋 Using conflict clause for {table_name}: {conflict_clause}")
-            
-            # Replace INSERT OR IGNORE with INSERT and add conflict clause at the end
-            converted = full_statement.replace('INSERT OR IGNORE INTO', 'INSERT INTO')
-            
-            # Find the position before the final semicolon and add conflict clause
-            if converted.endswith(';'):
-                converted = converted[:-1] + f' {conflict_clause};'
-            else:
-                converted = converted + f' {conflict_clause}'
+            conflict_clause = _CONFLICT_CLAUSES.get(table_name.lower(), 'ON CONFLICT DO NOTHING')
+            logger.debug("📋 Using conflict clause for %s: %s", table_name, conflict_clause)
             
-            return converted
+            # Rebuild as INSERT INTO with the conflict clause ahead of the final semicolon
+            return f"INSERT INTO {table_name}{body} {conflict_clause};"
         
         # Process each INSERT OR IGNORE statement
-        sql_content = re.sub(
-            r'INSERT\s+OR\s+IGNORE\s+INTO\s+(\w+)\s+.*?;',
-            convert_insert_statement,
-            sql_content,
-            flags=re.IGNORECASE | re.DOTALL
-        )
+        sql_content = _INSERT_OR_IGNORE.sub(convert_insert_statement, sql_content)
         
-        converted_conflicts = len(re.findall(r'ON CONFLICT', sql_content, flags=re.IGNORECASE))
-        logger.debug(f"✅ Added {converted_conflicts} ON CONFLICT clauses")
+        if debug_enabled:
+            converted_conflicts = len(re.findall(r'ON CONFLICT', sql_content, flags=re.IGNORECASE))
+            logger.debug("✅ Added %d ON CONFLICT clauses", converted_conflicts)
         
         logger.debug("🎯 SQLite to PostgreSQL conversion completed")
         return sql_content
             
     async def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
-        """Execute a query and return results"""
-        try:
-            async with self.connection_pool.acquire() as conn:
-                pg_query = self._convert_placeholders(query)
-                rows = await conn.fetch(pg_query, *params)
-                return [dict(row) for row in rows]
-        except Exception as e:
-            logger.error(f"Query execution failed: {e}")
-            raise
+        """Execute a query and return results (errors propagate to the caller)"""
+        async with self.connection_pool.acquire() as conn:
+            pg_query = self._convert_placeholders(query)
+            rows = await conn.fetch(pg_query, *params)
+            return [dict(row) for row in rows]
+            
+    async def execute_one(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
+        """Execute a query and return its first row only (None when there are no rows)"""
+        async with self.connection_pool.acquire() as conn:
+            row = await conn.fetchrow(self._convert_placeholders(query), *params)
+            return dict(row) if row is not None else None
+            
+    async def execute_scalar(self, query: str, params: tuple = ()) -> Any:
+        """Execute a query and return the first column of its first row"""
+        async with self.connection_pool.acquire() as conn:
+            return await conn.fetchval(self._convert_placeholders(query), *params)
+            
+    async def iter_query(self, query: str, params: tuple = (), prefetch: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Stream query rows through a server-side cursor, fetching `prefetch` rows per round trip.
+        
+        The connection and its transaction stay open until the iteration finishes, so callers
+        should consume the rows promptly rather than awaiting slow work between them.
+        """
+        async with self.connection_pool.acquire() as conn:
+            async with conn.transaction():
+                async for row in conn.cursor(self._convert_placeholders(query), *params, prefetch=prefetch):
+                    yield dict(row)
+            
+    async def fetch_records(self, query: str, params: tuple = ()) -> List[asyncpg.Record]:
+        """Like execute_query, but returns the asyncpg Records as-is for read-only consumers"""
+        async with self.connection_pool.acquire() as conn:
+            return await conn.fetch(self._convert_placeholders(query), *params)
+            
+    async def fetch_record(self, query: str, params: tuple = ()) -> Optional[asyncpg.Record]:
+        """Like execute_one, but returns the asyncpg Record as-is for read-only consumers"""
+        async with self.connection_pool.acquire() as conn:
+            return await conn.fetchrow(self._convert_placeholders(query), *params)
             
     async def execute_command(self, command: str, params: tuple = ()) -> bool:
-        """Execute a command (INSERT, UPDATE, DELETE)"""
-        try:
-            async with self.connection_pool.acquire() as conn:
-                pg_command = self._convert_placeholders(command)
-                await conn.execute(pg_command, *params)
-                return True
-        except Exception as e:
-            logger.error(f"Command execution failed: {e}")
-            raise
+        """Execute a command (INSERT, UPDATE, DELETE); errors propagate to the caller"""
+        async with self.connection_pool.acquire() as conn:
+            pg_command = self._convert_placeholders(command)
+            await conn.execute(pg_command, *params)
+            return True
+            
+    async def _cached_reference_query(self, cache_key: str, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Run a reference-table query, serving the result from a short-lived in-process cache"""
+        entry = self._reference_cache.get(cache_key)
+        if entry and entry[0] > time.monotonic():
+            return [dict(row) for row in entry[1]]
+        
+        # One refill per key at a time; concurrent callers wait for it instead of hitting the database
+        lock = self._reference_cache_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            entry = self._reference_cache.get(cache_key)
+            if not entry or entry[0] <= time.monotonic():
+                rows = await self.execute_query(query, params)
+                entry = (time.monotonic() + REFERENCE_CACHE_TTL, rows)
+                self._reference_cache[cache_key] = entry
+        return [dict(row) for row in entry[1]]
+    
+    def invalidate_reference_cache(self, cache_key: Optional[str] = None) -> None:
+        """Drop cached reference data (a single key, or everything) after a write"""
+        if cache_key is None:
+            self._reference_cache.clear()
+        else:
+            self._reference_cache.pop(cache_key, None)
             
     # User operations
     async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
-        results = await self.execute_query(
+        return await self.execute_one(
             "SELECT * FROM users WHERE id = $1 AND is_active = $2",
             (user_id, True)
         )
-        return results[0] if results else None
         
     async def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user by username"""
-        results = await self.execute_query(
+        return await self.execute_one(
             "SELECT * FROM users WHERE username = $1 AND is_active = $2",
             (username, True)
         )
-        return results[0] if results else None
         
     async def create_user(self, user_data: Dict[str, Any]) -> str:
         """Create a new user"""
@@ -311,182 +708,87 @@ class PostgreSQLService(DatabaseService):
                        status: str = "published",
                        tag_id: Optional[str] = None,
                        trending: Optional[bool] = None,
-                       timeframe: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get posts with optional filters (author, post_type, tag)"""
-        
-        # Base query with reaction count subquery for trending
-        if trending:
-            query = """
-                SELECT p.*, pt.name as post_type_name, u.username, u.display_name,
-                       u.email, u.avatar_url,
-                       (
-                           SELECT string_agg(tt.name, ', ')
-                           FROM post_tags ptg
-                           JOIN tag_types tt ON ptg.tag_id = tt.id
-                           WHERE ptg.post_id = p.id
-                       ) AS tags, 
-                       p.feed_content as content,
-                       (
-                           SELECT COUNT(*)
-                           FROM reactions r
-                           WHERE r.target_id = p.id AND r.target_type = 'post'
-                       ) AS reaction_count,
-                       (
-                           SELECT COUNT(*)
-                           FROM user_events ue
-                           WHERE ue.target_id = p.id AND ue.target_type = 'post' AND ue.event_type_id = 'event-view'
-                       ) AS view_count,
-                       (
-                           SELECT COUNT(*)
-                           FROM post_discussions pd
-                           WHERE pd.post_id = p.id
-                       ) AS comment_count
-                FROM posts p
-                JOIN post_types pt ON p.post_type_id = pt.id
-                JOIN users u ON p.author_id = u.id
-                WHERE p.status = $1 AND p.is_latest = $2
-            """
-        else:
-            query = """
-                SELECT p.*, pt.name as post_type_name, u.username, u.display_name,
-                       u.email, u.avatar_url,
-                       (
-                           SELECT string_agg(tt.name, ', ')
-                           FROM post_tags ptg
-                           JOIN tag_types tt ON ptg.tag_id = tt.id
-                           WHERE ptg.post_id = p.id
-                       ) AS tags, p.feed_content as content,
-                       (
-                           SELECT COUNT(*)
-                           FROM user_events ue
-                           WHERE ue.target_id = p.id AND ue.target_type = 'post' AND ue.event_type_id = 'event-view'
-                       ) AS view_count,
-                       (
-                           SELECT COUNT(*)
-                           FROM post_discussions pd
-                           WHERE pd.post_id = p.id
-                       ) AS comment_count
-                FROM posts p
-                JOIN post_types pt ON p.post_type_id = pt.id
-                JOIN users u ON p.author_id = u.id
-                WHERE p.status = $1 AND p.is_latest = $2
-            """
+                       timeframe: Optional[str] = None,
+                       after_ts: Optional[datetime] = None,
+                       after_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get posts with optional filters (author, post_type, tag)
         
-        params: List[Any] = [status, True]
-        param_count = 2
+        Non-trending feeds support keyset pagination: pass the last row's
+        COALESCE(updated_ts, created_ts) and id as after_ts/after_id to fetch the
+        next page without OFFSET. skip is ignored when a cursor is given.
+        """
         
-        # Add timeframe filter for trending posts
-        if trending and timeframe and timeframe != 'all':
-            if timeframe == 'today':
-                query += f" AND p.created_ts >= NOW() - INTERVAL '1 day'"
-            elif timeframe == 'week':
-                query += f" AND p.created_ts >= NOW() - INTERVAL '7 days'"
-            elif timeframe == 'month':
-                query += f" AND p.created_ts >= NOW() - INTERVAL '30 days'"
+        # Trending-only timeframe; anything else is treated as 'all'
+        if not trending or timeframe not in _POSTS_TIMEFRAME_INTERVALS:
+            timeframe = None
+        # Keyset cursor (trending keeps OFFSET paging; its cursor would also need the reaction count)
+        use_cursor = not trending and after_ts is not None and after_id is not None
         
+        params: List[Any] = [status, True]
         if author_id:
-            param_count += 1
-            query += f" AND p.author_id = ${param_count}"
             params.append(author_id)
-            
         if post_type:
-            param_count += 1
-            query += f" AND pt.id = ${param_count}"
             params.append(post_type)
-        
         if tag_id:
-            param_count += 1
-            query += f" AND EXISTS (SELECT 1 FROM post_tags ptg WHERE ptg.post_id = p.id AND ptg.tag_id = ${param_count})"
             params.append(tag_id)
-        
-        # Order by reaction count for trending, otherwise by most recent activity (updated or created)
-        if trending:
-            query += " ORDER BY reaction_count DESC, COALESCE(p.updated_ts, p.created_ts) DESC"
+        if use_cursor:
+            params.extend([_naive_utc(after_ts), after_id])
+            params.append(limit)
         else:
-            query += " ORDER BY COALESCE(p.updated_ts, p.created_ts) DESC"
-            
-        param_count += 1
-        query += f" LIMIT ${param_count}"
-        params.append(limit)
-        
-        param_count += 1
-        query += f" OFFSET ${param_count}"
-        params.append(skip)
+            params.extend([limit, skip])
         
+        query = _posts_query(bool(trending), bool(author_id), bool(post_type),
+                             bool(tag_id), timeframe, use_cursor,
+                             await self._has_schema_feature('post_counters'))
         return await self.execute_query(query, tuple(params))
         
     async def get_post_by_id(self, post_id: str) -> Optional[Dict[str, Any]]:
         """Get post by ID"""
-        results = await self.execute_query(
-            """SELECT p.*, pt.name as post_type_name, u.username, u.display_name,
-                      u.email, u.avatar_url, pc.content, pc.revision,
-                      (
-                       SELECT string_agg(tt.name, ', ')
-                       FROM post_tags ptg
-                       JOIN tag_types tt ON ptg.tag_id = tt.id
-                       WHERE ptg.post_id = p.id
-                   ) AS tags,
-                   (
-                       SELECT COUNT(*)
-                       FROM user_events ue
-                       WHERE ue.target_id = p.id AND ue.target_type = 'post' AND ue.event_type_id = 'event-view'
-                   ) AS view_count,
-                   (
-                       SELECT COUNT(*)
-                       FROM post_discussions pd
-                       WHERE pd.post_id = p.id
-                   ) AS comment_count
-               FROM posts p
-               JOIN post_types pt ON p.post_type_id = pt.id
-               JOIN users u ON p.author_id = u.id
-               LEFT JOIN posts_content pc ON p.id = pc.post_id AND pc.is_current = $1
-               WHERE p.id = $2""",
-            (True, post_id)
-        )
-        return results[0] if results else None
+        return await self.execute_one(await self._post_by_id_sql(), (True, post_id))
+    
+    async def _post_by_id_sql(self) -> str:
+        """get_post_by_id SQL for the current schema (legacy per-row counts before migration 2.3.0)"""
+        return _POST_BY_ID_SQL if await self._has_schema_feature('post_counters') else _POST_BY_ID_LEGACY_SQL
         
     async def create_post(self, post_data: Dict[str, Any]) -> str:
-        """Create a new post"""
-        # Insert post record
-        await self.execute_command(
-            """INSERT INTO posts (id, post_type_id, title, feed_content, cover_image_url,
-                                author_id, status, revision, read_time, project_id,
-                                branch_name, git_url, document_type, created_by)
-               VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)""",
-            (
-                post_data['id'], post_data['post_type_id'], post_data['title'],
-                post_data.get('feed_content'), post_data.get('cover_image_url'),
-                post_data['author_id'], post_data.get('status', 'draft'),
-                post_data.get('revision', 0), post_data.get('read_time', 0),
-                post_data.get('project_id'), post_data.get('branch_name'),
-                post_data.get('git_url'), post_data.get('document_type'),
-                post_data.get('created_by', post_data['author_id'])
-            )
-        )
-        
-        # Insert content if provided
-        if 'content' in post_data:
-            # Use UUID for content ID since we have post_id column for relationship
-            import uuid
-            content_id = str(uuid.uuid4())
-            await self.execute_command(
-                """INSERT INTO posts_content (id, post_id, revision, content, is_current, created_by)
-                   VALUES ($1, $2, $3, $4, $5, $6)""",
-                (
-                    content_id,
-                    post_data['id'], post_data.get('revision', 0),
-                    post_data['content'], True,
-                    post_data.get('created_by', post_data['author_id'])
+        """Create a new post (post row and initial content in one transaction)"""
+        created_by = post_data.get('created_by', post_data['author_id'])
+        async with self.connection_pool.acquire() as conn:
+            async with conn.transaction():
+                # Insert post record
+                await conn.execute(
+                    """INSERT INTO posts (id, post_type_id, title, feed_content, cover_image_url,
+                                        author_id, status, revision, read_time, project_id,
+                                        branch_name, git_url, document_type, created_by)
+                       VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)""",
+                    post_data['id'], post_data['post_type_id'], post_data['title'],
+                    post_data.get('feed_content'), post_data.get('cover_image_url'),
+                    post_data['author_id'], post_data.get('status', 'draft'),
+                    post_data.get('revision', 0), post_data.get('read_time', 0),
+                    post_data.get('project_id'), post_data.get('branch_name'),
+                    post_data.get('git_url'), post_data.get('document_type'),
+                    created_by
                 )
-            )
+                
+                # Insert content if provided
+                if 'content' in post_data:
+                    # Content ID is a server-generated UUID; post_id carries the relationship
+                    await conn.execute(
+                        """INSERT INTO posts_content (id, post_id, revision, content, is_current, created_by)
+                           VALUES (gen_random_uuid()::text, $1, $2, $3, $4, $5)""",
+                        post_data['id'], post_data.get('revision', 0),
+                        post_data['content'], True,
+                        created_by
+                    )
             
         return post_data['id']
         
     # Tag operations
     async def get_tags(self) -> List[Dict[str, Any]]:
         """Get all active tags"""
-        return await self.execute_query(
-            "SELECT * FROM tag_types WHERE is_active = $1 ORDER BY name",
+        return await self._cached_reference_query(
+            'tags',
+            f"SELECT {_TAG_COLUMNS} FROM tag_types WHERE is_active = $1 ORDER BY name",
             (True,)
         )
         
@@ -510,40 +812,31 @@ class PostgreSQLService(DatabaseService):
                         post_id
                     )
                     
-                    # Add new tag associations
+                    # Resolve (or create) tag IDs, collecting association rows
+                    rows = []
+                    created_tag = False
                     for tag_name in tag_names:
-                        # Check if tag exists by name
-                        tag_row = await conn.fetchrow(
-                            "SELECT id FROM tag_types WHERE name = $1 AND is_active = TRUE",
-                            tag_name
-                        )
-                        if tag_row:
-                            tag_id = tag_row["id"]
-                        else:
-                            # Create tag with app-generated ID
-                            tag_id = re.sub(r'[^a-zA-Z0-9 ]', '', tag_name).lower().replace(' ', '-')
-                            logger.info(f"Creating new tag '{tag_name}' with ID '{tag_id}'")
-                            await conn.execute(
-                                """
-                                INSERT INTO tag_types (id, name, description, created_by)
-                                VALUES ($1, $2, $3, $4)
-                                """,
-                                tag_id,
-                                tag_name,
-                                f"Auto-created tag: {tag_name}",
-                                author_id
-                            )
-                        
-                        # Associate tag with post
-                        post_tag_id = str(uuid.uuid4())
-                        await conn.execute(
+                        # Resolve the tag by name, creating it (slug ID) when missing
+                        tag_row = await conn.fetchrow(_RESOLVE_TAG_SQL, tag_name, author_id)
+                        if tag_row["created"]:
+                            logger.info(f"Created new tag '{tag_name}' with ID '{tag_row['id']}'")
+                            created_tag = True
+
+                        rows.append((post_id, tag_row["id"], author_id))
+
+                    # Associate all tags with the post in one pipelined batch
+                    if rows:
+                        await conn.executemany(
                             """
                             INSERT INTO post_tags (id, post_id, tag_id, created_by)
-                            VALUES ($1, $2, $3, $4)
+                            VALUES (gen_random_uuid()::text, $1, $2, $3)
+                            ON CONFLICT (post_id, tag_id) DO NOTHING
                             """,
-                            post_tag_id, post_id, tag_id, author_id
+                            rows
                         )
             
+            if created_tag:
+                self.invalidate_reference_cache('tags')
             logger.info(f"Updated tags for post {post_id}: {tag_names}")
             return True
         except Exception as e:
@@ -551,45 +844,34 @@ class PostgreSQLService(DatabaseService):
             return False
 
     async def associate_tags_with_post(self, author_id: str, post_id: str, tag_names: List[str]) -> bool:
-        """Associate tags with a post (create tags if needed) using app-generated UUIDs"""
+        """Associate tags with a post (create tags if needed), in one transaction"""
+        created_tag = False
         try:
             async with self.connection_pool.acquire() as conn:
-                for tag_name in tag_names:
-                    # Check if tag exists by name
-                    tag_row = await conn.fetchrow(
-                        "SELECT id FROM tag_types WHERE name = $1 AND is_active = TRUE",
-                        tag_name
-                    )
-                    if tag_row:
-                        tag_id = tag_row["id"]
-                    else:
-                        # Create tag with app-generated ID
-                        tag_id = re.sub(r'[^a-zA-Z0-9 ]', '', tag_name).lower().replace(' ', '-')
-                        logger.info(f"Creating new tag '{tag_name}' with ID '{tag_id}'")
+                # Tag creation and links commit together
+                async with conn.transaction():
+                    for tag_name in tag_names:
+                        # Resolve the tag by name, creating it (slug ID) when missing
+                        tag_row = await conn.fetchrow(_RESOLVE_TAG_SQL, tag_name, author_id)
+                        if tag_row["created"]:
+                            logger.info(f"Created new tag '{tag_name}' with ID '{tag_row['id']}'")
+                            created_tag = True
+                        # Associate tag with post; ignore if exists
                         await conn.execute(
                             """
-                            INSERT INTO tag_types (id, name, description, created_by)
-                            VALUES ($1, $2, $3, $4)
+                            INSERT INTO post_tags (id, post_id, tag_id, created_by)
+                            VALUES (gen_random_uuid()::text, $1, $2, $3)
+                            ON CONFLICT (post_id, tag_id) DO NOTHING
                             """,
-                            tag_id,
-                            tag_name,
-                            f"Auto-created tag: {tag_name}",
-                            author_id
+                            post_id, tag_row["id"], author_id
                         )
-                    # Associate tag with post; ignore if exists
-                    post_tag_id = str(uuid.uuid4())
-                    await conn.execute(
-                        """
-                        INSERT INTO post_tags (id, post_id, tag_id, created_by)
-                        VALUES ($1, $2, $3, $4)
-                        ON CONFLICT (post_id, tag_id) DO NOTHING
-                        """,
-                        post_tag_id, post_id, tag_id, author_id
-                    )
             return True
         except Exception as e:
             logger.error(f"Failed to associate tags with post {post_id}: {e}")
             return False
+        finally:
+            if created_tag:
+                self.invalidate_reference_cache('tags')
 
     # Parity: users list
     async def get_users(self, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
@@ -618,28 +900,33 @@ class PostgreSQLService(DatabaseService):
 
     async def get_role_types(self) -> List[Dict[str, Any]]:
         """Get all active role types"""
-        return await self.execute_query(
+        return await self._cached_reference_query(
+            'role_types',
             "SELECT role_id, role_name, role_description, permissions, is_active FROM role_types WHERE is_active = $1 ORDER BY role_name",
             (True,)  # Use True instead of 1 for PostgreSQL boolean compatibility
         )
 
     async def assign_role_to_user(self, user_id: str, role_id: str, assigned_by: str = None) -> bool:
         """Assign a role to a user (idempotent)"""
+        return await self.assign_roles_to_user(user_id, [role_id], assigned_by=assigned_by)
+
+    async def assign_roles_to_user(self, user_id: str, role_ids: List[str], assigned_by: str = None) -> bool:
+        """Assign roles to a user in a single upsert (idempotent; reactivates existing assignments)"""
+        # Duplicates would make ON CONFLICT touch the same row twice
+        role_ids = list(dict.fromkeys(role_ids))
+        if not role_ids:
+            return True
         try:
-            assignment_id = str(uuid.uuid4())
-            # Insert if not exists
-            await self.execute_command(
-                "INSERT INTO user_roles (id, user_id, role_id, is_active, assigned_by, created_by) VALUES ($1, $2, $3, $4, $5, $6) ON CONFLICT (user_id, role_id) DO NOTHING",
-                (assignment_id, user_id, role_id, True, assigned_by or user_id, assigned_by or user_id)
-            )
-            # Ensure assignment is active
             await self.execute_command(
-                "UPDATE user_roles SET is_active = $1 WHERE user_id = $2 AND role_id = $3",
-                (True, user_id, role_id)
+                """INSERT INTO user_roles (id, user_id, role_id, is_active, assigned_by, created_by)
+                   SELECT gen_random_uuid()::text, $1, r.role_id, TRUE, $2, $2
+                   FROM UNNEST($3::text[]) AS r(role_id)
+                   ON CONFLICT (user_id, role_id) DO UPDATE SET is_active = TRUE""",
+                (user_id, assigned_by or user_id, role_ids)
             )
             return True
         except Exception as e:
-            logger.error(f"Failed to assign role {role_id} to user {user_id}: {e}")
+            logger.error(f"Failed to assign roles {role_ids} to user {user_id}: {e}")
             return False
 
     async def remove_role_from_user(self, user_id: str, role_id: str) -> bool:
@@ -664,78 +951,81 @@ class PostgreSQLService(DatabaseService):
                 tag_data.get('color'), tag_data.get('created_by')
             )
         )
+        self.invalidate_reference_cache('tags')
         return tag_data['id']
 
     async def get_tag_by_id(self, tag_id: str) -> Optional[Dict[str, Any]]:
         """Get tag by ID"""
-        results = await self.execute_query(
-            "SELECT * FROM tag_types WHERE id = $1 AND is_active = $2",
+        return await self.execute_one(
+            f"SELECT {_TAG_COLUMNS} FROM tag_types WHERE id = $1 AND is_active = $2",
             (tag_id, True)  # Use True instead of 1 for PostgreSQL boolean compatibility
         )
-        return results[0] if results else None
 
     async def get_tag_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get tag by name"""
-        results = await self.execute_query(
-            "SELECT * FROM tag_types WHERE name = $1 AND is_active = $2",
+        return await self.execute_one(
+            f"SELECT {_TAG_COLUMNS} FROM tag_types WHERE name = $1 AND is_active = $2",
             (name, True)  # Use True instead of 1 for PostgreSQL boolean compatibility
         )
-        return results[0] if results else None
         
     # Reaction operations
     async def add_reaction(self, target_id: str, user_id: str, reaction_type: str, target_type: str = 'post') -> Dict[str, Any]:
         """Add a reaction to a post or discussion"""
-        import uuid
-        reaction_id = str(uuid.uuid4())
-        
-        # Get event type ID for the reaction
-        event_type_result = await self.execute_query(
-            "SELECT id FROM event_types WHERE id = $1 AND category = 'reaction'",
-            (reaction_type,)
-        )
+        # Event type validation and the upsert share one round-trip
+        async with self.connection_pool.acquire() as conn:
+            row = await conn.fetchrow(
+                _UPSERT_REACTION_SQL,
+                reaction_type, user_id, target_type, target_id, None, 1
+            )
         
-        if not event_type_result:
+        if row is None:
             raise ValueError(f"Unknown reaction type: {reaction_type}")
-            
-        event_type_id = event_type_result[0]['id']
         
-        await self.execute_command(
-            """INSERT INTO reactions 
-               (id, event_type_id, user_id, target_type, target_id, target_revision, reaction_value)
-               VALUES ($1, $2, $3, $4, $5, $6, $7)
-               ON CONFLICT (event_type_id, user_id, target_type, target_id) 
-               DO UPDATE SET reaction_value = EXCLUDED.reaction_value, updated_ts = CURRENT_TIMESTAMP""",
-            (reaction_id, event_type_id, user_id, target_type, target_id, None, 1)
-        )
-        
-        # Return the created reaction
+        # Return the stored reaction
         return {
-            'id': reaction_id,
+            'id': row['id'],
             'target_id': target_id,
             'target_type': target_type,
             'user_id': user_id,
             'reaction_type': reaction_type,
-            'created_ts': 'now'  # In real implementation, get actual timestamp
+            'created_ts': row['created_ts'].isoformat() if row['created_ts'] else None
         }
+    
+    async def add_reactions_bulk(self, reactions: List[Dict[str, Any]]) -> int:
+        """Add several reactions over one connection using asyncpg's pipelined executemany
+        
+        Reactions with an unknown reaction type are skipped by the event type check.
+        """
+        if not reactions:
+            return 0
+        rows = [
+            (r['reaction_type'], r['user_id'], r.get('target_type', 'post'),
+             r['target_id'], r.get('target_revision'), r.get('reaction_value', 1))
+            for r in reactions
+        ]
+        async with self.connection_pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(_UPSERT_REACTION_SQL, rows)
+        return len(rows)
         
     async def remove_reaction(self, target_id: str, user_id: str, reaction_type: str, target_type: str = 'post') -> bool:
         """Remove a reaction from a post or discussion"""
         try:
-            # Validate reaction type exists
-            event_type = await self.execute_query(
-                "SELECT id FROM event_types WHERE id = $1 AND category = 'reaction'",
-                (reaction_type,)
-            )
-            if not event_type:
-                return False
-            event_type_id = event_type[0]['id']
-            await self.execute_command(
-                """
-                DELETE FROM reactions
-                WHERE event_type_id = $1 AND user_id = $2 AND target_type = $3 AND target_id = $4
-                """,
-                (event_type_id, user_id, target_type, target_id)
-            )
+            async with self.connection_pool.acquire() as conn:
+                # Validate reaction type exists
+                event_type_id = await conn.fetchval(
+                    "SELECT id FROM event_types WHERE id = $1 AND category = 'reaction'",
+                    reaction_type
+                )
+                if not event_type_id:
+                    return False
+                await conn.execute(
+                    """
+                    DELETE FROM reactions
+                    WHERE event_type_id = $1 AND user_id = $2 AND target_type = $3 AND target_id = $4
+                    """,
+                    event_type_id, user_id, target_type, target_id
+                )
             return True
         except Exception as e:
             logger.error(f"Failed to remove reaction: {e}")
@@ -746,34 +1036,24 @@ class PostgreSQLService(DatabaseService):
         """
         Delete (soft by default) a comment.
         - If user_id is provided, enforce ownership.
-        - Soft delete sets is_deleted = TRUE and updates updated_ts.
+        - Soft delete sets is_deleted = TRUE and stamps deleted_ts.
+        - Returns True only when a comment row was actually deleted.
         """
         try:
             if soft_delete:
-                if user_id:
-                    sql = """
-                        UPDATE comments
-                        SET is_deleted = TRUE, updated_ts = CURRENT_TIMESTAMP
-                        WHERE id = $1 AND author_id = $2
-                    """
-                    params = (comment_id, user_id)
-                else:
-                    sql = """
-                        UPDATE comments
-                        SET is_deleted = TRUE, updated_ts = CURRENT_TIMESTAMP
-                        WHERE id = $1
-                    """
-                    params = (comment_id,)
-                await self.execute_command(sql, params)
+                sql = """
+                    UPDATE post_discussions
+                    SET is_deleted = TRUE, deleted_ts = CURRENT_TIMESTAMP, updated_ts = CURRENT_TIMESTAMP
+                    WHERE id = $1 AND ($2::text IS NULL OR author_id = $2) AND is_deleted = FALSE
+                    RETURNING 1
+                """
             else:
-                if user_id:
-                    sql = "DELETE FROM comments WHERE id = $1 AND author_id = $2"
-                    params = (comment_id, user_id)
-                else:
-                    sql = "DELETE FROM comments WHERE id = $1"
-                    params = (comment_id,)
-                await self.execute_command(sql, params)
-            return True
+                sql = """
+                    DELETE FROM post_discussions
+                    WHERE id = $1 AND ($2::text IS NULL OR author_id = $2)
+                    RETURNING 1
+                """
+            return await self.execute_scalar(sql, (comment_id, user_id)) is not None
         except Exception as e:
             logger.error(f"Failed to delete comment {comment_id}: {e}")
             return False
@@ -786,7 +1066,9 @@ class PostgreSQLService(DatabaseService):
         """Get reactions for a post or discussion"""
         return await self.execute_query(
             """
-            SELECT r.*, et.id as reaction_type, et.icon, et.color,
+            SELECT r.id, r.event_type_id, r.user_id, r.target_type, r.target_id,
+                   r.target_revision, r.reaction_value, r.metadata, r.created_ts, r.updated_ts,
+                   et.id as reaction_type, et.icon, et.color,
                    u.username, u.display_name
             FROM reactions r
             JOIN event_types et ON r.event_type_id = et.id
@@ -797,6 +1079,23 @@ class PostgreSQLService(DatabaseService):
             (target_type, target_id)
         )
 
+    async def get_reaction_summary(self, target_id: str, target_type: str = 'post',
+                                   user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get reaction counts per type for a target, aggregated in the database"""
+        return await self.execute_query(
+            """
+            SELECT et.id AS reaction_type, et.icon, et.color,
+                   COUNT(*)::int AS count,
+                   COALESCE(bool_or(r.user_id = $3), FALSE) AS user_reacted
+            FROM reactions r
+            JOIN event_types et ON r.event_type_id = et.id
+            WHERE r.target_type = $1 AND r.target_id = $2
+            GROUP BY et.id, et.icon, et.color
+            ORDER BY count DESC
+            """,
+            (target_type, target_id, user_id)
+        )
+
     async def get_discussion_reactions(self, discussion_id: str) -> List[Dict[str, Any]]:
         """Get reactions for a discussion/comment"""
         return await self.get_reactions(discussion_id, 'discussion')
@@ -805,7 +1104,7 @@ class PostgreSQLService(DatabaseService):
     async def get_post_discussions(self, post_id: str) -> List[Dict[str, Any]]:
         """Get discussions for a post"""
         return await self.execute_query(
-            """SELECT pd.*, u.username, u.display_name, u.avatar_url
+            f"""SELECT {_DISCUSSION_COLUMNS}, u.username, u.display_name, u.avatar_url
                FROM post_discussions pd
                JOIN users u ON pd.author_id = u.id
                WHERE pd.post_id = $1 AND pd.is_deleted = $2
@@ -837,25 +1136,29 @@ class PostgreSQLService(DatabaseService):
         
     async def get_comment_by_id(self, comment_id: str) -> Optional[Dict[str, Any]]:
         """Get comment by ID"""
-        results = await self.execute_query(
-            """
-            SELECT pd.*, u.username, u.display_name, u.avatar_url
+        return await self.execute_one(
+            f"""
+            SELECT {_DISCUSSION_COLUMNS}, u.username, u.display_name, u.avatar_url
             FROM post_discussions pd
             JOIN users u ON pd.author_id = u.id
             WHERE pd.id = $1 AND pd.is_deleted = $2
             """,
             (comment_id, False)
         )
-        return results[0] if results else None
         
     async def get_comments_by_post(self, post_id: str) -> List[Dict[str, Any]]:
         """Get comments for a post"""
         return await self.get_post_discussions(post_id)
     
-    async def get_recent_comments(self, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get recent comments across all posts"""
-        return await self.execute_query(
-            """
+    async def get_recent_comments(self, skip: int = 0, limit: int = 10,
+                                  after_ts: Optional[datetime] = None,
+                                  after_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get recent comments across all posts
+        
+        Pass the last row's created_ts and id as after_ts/after_id for keyset
+        pagination; skip is ignored when a cursor is given.
+        """
+        query = """
             SELECT 
                 pd.id,
                 pd.post_id,
@@ -872,19 +1175,19 @@ class PostgreSQLService(DatabaseService):
             JOIN users u ON pd.author_id = u.id
             JOIN posts p ON pd.post_id = p.id
             WHERE pd.is_deleted = FALSE
-            ORDER BY pd.created_ts DESC
+        """
+        if after_ts is not None and after_id is not None:
+            query += """
+              AND (pd.created_ts, pd.id) < ($1, $2)
+            ORDER BY pd.created_ts DESC, pd.id DESC
+            LIMIT $3
+            """
+            return await self.execute_query(query, (_naive_utc(after_ts), after_id, limit))
+        query += """
+            ORDER BY pd.created_ts DESC, pd.id DESC
             LIMIT $1 OFFSET $2
-            """,
-            (limit, skip)
-        )
-        
-    async def delete_comment(self, comment_id: str) -> bool:
-        """Delete a comment (soft delete)"""
-        await self.execute_command(
-            "UPDATE post_discussions SET is_deleted = $1, deleted_ts = CURRENT_TIMESTAMP WHERE id = $2",
-            (True, comment_id)
-        )
-        return True
+        """
+        return await self.execute_query(query, (limit, skip))
         
     # Analytics operations
     async def log_user_event(self, event_data: Dict[str, Any]) -> str:
@@ -898,7 +1201,7 @@ class PostgreSQLService(DatabaseService):
                 event_data['id'], event_data['user_id'], event_data['event_type_id'],
                 event_data.get('target_type'), event_data.get('target_id'),
                 event_data.get('session_id'), event_data.get('ip_address'),
-                event_data.get('user_agent'), json.dumps(event_data.get('metadata', {}))
+                event_data.get('user_agent'), _json_dumps(event_data.get('metadata', {}))
             )
         )
         return event_data['id']
@@ -907,64 +1210,59 @@ class PostgreSQLService(DatabaseService):
                                  entity_type: str, entity_id: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Log mention events for multiple users"""
         try:
-            import uuid
-            from datetime import datetime
-            
             if not mentioned_user_ids:
                 return
             
             # Remove duplicates while preserving order
             mentioned_user_ids = list(dict.fromkeys(mentioned_user_ids))
             
-            # Validate mentioned users exist and get their usernames
-            placeholders = ','.join(f'${i+1}' for i in range(len(mentioned_user_ids)))
-            query = f"SELECT id, username FROM users WHERE username IN ({placeholders})"
-            valid_users = await self.execute_query(query, tuple(mentioned_user_ids))
-            
-            if not valid_users:
-                logger.warning(f"None of the mentioned usernames are valid: {mentioned_user_ids}")
-                return
-            
-            valid_user_map = {user['username']: user['id'] for user in valid_users}
-            invalid_usernames = set(mentioned_user_ids) - set(valid_user_map.keys())
-            
-            if invalid_usernames:
-                logger.warning(f"Invalid usernames in mentions: {invalid_usernames}")
-            
-            # Prepare batch insert data
-            now = datetime.utcnow().isoformat()
-            event_metadata = metadata or {}
-            event_metadata['mentioned_by'] = mentioning_user_id
-            metadata_json = json.dumps(event_metadata)
-            
-            events_to_insert = []
-            for username in valid_user_map.keys():
-                user_id = valid_user_map[username]
-                event_id = str(uuid.uuid4())
-                events_to_insert.append((
-                    event_id,
-                    user_id,
-                    'event-mentioned',
-                    entity_type,
-                    entity_id,
-                    None,  # session_id
-                    None,  # ip_address
-                    None,  # user_agent
-                    metadata_json
-                ))
-            
-            # Batch insert
-            if events_to_insert:
-                async with self.connection_pool.acquire() as conn:
-                    await conn.executemany(
-                        """INSERT INTO user_events 
-                           (id, user_id, event_type_id, target_type, target_id, session_id,
-                            ip_address, user_agent, metadata)
-                           VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)""",
-                        events_to_insert
+            async with self.connection_pool.acquire() as conn:
+                # Validate mentioned users exist and get their usernames
+                valid_users = await conn.fetch(
+                    "SELECT id, username FROM users WHERE username = ANY($1::text[])",
+                    mentioned_user_ids
+                )
+                
+                if not valid_users:
+                    logger.warning(f"None of the mentioned usernames are valid: {mentioned_user_ids}")
+                    return
+                
+                valid_user_map = {user['username']: user['id'] for user in valid_users}
+                invalid_usernames = set(mentioned_user_ids) - set(valid_user_map.keys())
+                
+                if invalid_usernames:
+                    logger.warning(f"Invalid usernames in mentions: {invalid_usernames}")
+                
+                # Prepare batch insert data
+                event_metadata = metadata or {}
+                event_metadata['mentioned_by'] = mentioning_user_id
+                metadata_json = _json_dumps(event_metadata)
+                
+                events_to_insert = [
+                    (
+                        str(uuid.uuid4()),
+                        user_id,
+                        'event-mentioned',
+                        entity_type,
+                        entity_id,
+                        None,  # session_id
+                        None,  # ip_address
+                        None,  # user_agent
+                        metadata_json
                     )
-                    
-                logger.info(f"Logged {len(events_to_insert)} mention events for {entity_type} {entity_id}")
+                    for user_id in valid_user_map.values()
+                ]
+                
+                # Batch insert on the same connection
+                await conn.executemany(
+                    """INSERT INTO user_events 
+                       (id, user_id, event_type_id, target_type, target_id, session_id,
+                        ip_address, user_agent, metadata)
+                       VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)""",
+                    events_to_insert
+                )
+                
+            logger.info(f"Logged {len(events_to_insert)} mention events for {entity_type} {entity_id}")
                 
         except Exception as e:
             logger.warning(f"Failed to log mention events: {e}")
@@ -973,11 +1271,10 @@ class PostgreSQLService(DatabaseService):
     # Statistics operations
     async def get_user_stats(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user statistics"""
-        results = await self.execute_query(
+        return await self.execute_one(
             "SELECT * FROM user_stats WHERE user_id = $1",
             (user_id,)
         )
-        return results[0] if results else None
         
     async def update_user_stats(self, user_id: str, stats: Dict[str, Any]) -> bool:
         """Update user statistics"""
@@ -1008,50 +1305,12 @@ class PostgreSQLService(DatabaseService):
         return True
     
     async def update_post(self, post_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Update a post and create new content version if content is provided"""
-        # Handle content update separately (create new version)
-        if 'content' in updates:
-            content = updates.pop('content')
-            
-            # First, mark current content as not current
-            await self.execute_command(
-                """
-                UPDATE posts_content
-                SET is_current = FALSE
-                WHERE post_id = $1 AND is_current = TRUE
-                """,
-                (post_id,)
-            )
-            
-            # Get the next revision number
-            result = await self.execute_query(
-                """
-                SELECT COALESCE(MAX(revision), 0) + 1 as next_revision
-                FROM posts_content
-                WHERE post_id = $1
-                """,
-                (post_id,)
-            )
-            next_revision = result[0]['next_revision'] if result else 1
-            
-            # Create new content version with UUID
-            import uuid
-            content_id = str(uuid.uuid4())
-            await self.execute_command(
-                """
-                INSERT INTO posts_content (id, post_id, revision, content, is_current, created_by)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                """,
-                (
-                    content_id,
-                    post_id,
-                    next_revision,
-                    content,
-                    True,
-                    updates.get('updated_by')
-                )
-            )
+        """Update a post and create new content version if content is provided
         
+        Runs on one connection in one transaction: a writable CTE retires the
+        current content row and inserts the next revision, then the posts row is
+        updated and the refreshed post read back.
+        """
         # Allowed fields to update in posts table
         allowed = ['title', 'feed_content', 'cover_image_url', 'status', 'updated_by']
         set_clauses: List[str] = []
@@ -1062,14 +1321,36 @@ class PostgreSQLService(DatabaseService):
                 params.append(updates[key])
                 set_clauses.append(f"{key} = ${len(params)}")
         
-        if set_clauses:
-            # add updated_ts
-            set_clause = ", ".join(set_clauses) + ", updated_ts = CURRENT_TIMESTAMP"
-            params.append(post_id)
-            query = f"UPDATE posts SET {set_clause} WHERE id = ${len(params)}"
-            await self.execute_command(query, tuple(params))
+        async with self.connection_pool.acquire() as conn:
+            async with conn.transaction():
+                # Handle content update separately (create new version)
+                if 'content' in updates:
+                    await conn.execute(
+                        """
+                        WITH retired AS (
+                            UPDATE posts_content
+                            SET is_current = FALSE
+                            WHERE post_id = $1 AND is_current = TRUE
+                        ), next_rev AS (
+                            SELECT COALESCE(MAX(revision), 0) + 1 AS revision
+                            FROM posts_content
+                            WHERE post_id = $1
+                        )
+                        INSERT INTO posts_content (id, post_id, revision, content, is_current, created_by)
+                        SELECT gen_random_uuid()::text, $1, next_rev.revision, $2, TRUE, $3 FROM next_rev
+                        """,
+                        post_id, updates['content'], updates.get('updated_by')
+                    )
+                
+                if set_clauses:
+                    # add updated_ts
+                    set_clause = ", ".join(set_clauses) + ", updated_ts = CURRENT_TIMESTAMP"
+                    params.append(post_id)
+                    await conn.execute(f"UPDATE posts SET {set_clause} WHERE id = ${len(params)}", *params)
+                
+                row = await conn.fetchrow(await self._post_by_id_sql(), True, post_id)
         
-        return await self.get_post_by_id(post_id)
+        return dict(row) if row is not None else None
         
     async def delete_post(self, post_id: str) -> bool:
         """Soft delete a post"""
@@ -1090,7 +1371,12 @@ class PostgreSQLService(DatabaseService):
             JOIN post_types pt ON p.post_type_id = pt.id
             JOIN users u ON p.author_id = u.id
             LEFT JOIN posts_content pc ON p.id = pc.post_id AND pc.is_current = TRUE
-            WHERE (p.title ILIKE $1 OR p.feed_content ILIKE $1 OR pc.content ILIKE $1)
+            WHERE p.id IN (
+                    -- One branch per table so each ILIKE can use its trigram index
+                    SELECT id FROM posts WHERE title ILIKE $1 OR feed_content ILIKE $1
+                    UNION
+                    SELECT post_id FROM posts_content WHERE is_current = TRUE AND content ILIKE $1
+                  )
               AND p.status = $2 AND p.is_latest = $3
             ORDER BY p.created_ts DESC LIMIT $4
             """,
@@ -1098,204 +1384,215 @@ class PostgreSQLService(DatabaseService):
         )
         
     async def get_stats(self) -> Dict[str, int]:
-        """Get application statistics"""
-        stats: Dict[str, int] = {}
-        # Users
-        user_results = await self.execute_query(
-            "SELECT COUNT(*) as count FROM users WHERE is_active = $1",
-            (True,)
-        )
-        stats['users'] = user_results[0]['count'] if user_results else 0
-        # Posts
-        post_results = await self.execute_query(
-            "SELECT COUNT(*) as count FROM posts WHERE status = $1 AND is_latest = $2",
-            ('published', True)
-        )
-        stats['posts'] = post_results[0]['count'] if post_results else 0
-        # Tags
-        tag_results = await self.execute_query(
-            "SELECT COUNT(*) as count FROM tag_types WHERE is_active = $1",
-            (True,)
-        )
-        stats['tags'] = tag_results[0]['count'] if tag_results else 0
-        # Comments
-        comment_results = await self.execute_query(
-            "SELECT COUNT(*) as count FROM post_discussions WHERE is_deleted = $1",
-            (False,)
-        )
-        stats['comments'] = comment_results[0]['count'] if comment_results else 0
-        return stats
+        """Get application statistics (all four counts in one round-trip)"""
+        async with self.connection_pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """SELECT
+                       (SELECT COUNT(*) FROM users WHERE is_active = TRUE)::int AS users,
+                       (SELECT COUNT(*) FROM posts WHERE status = 'published' AND is_latest = TRUE)::int AS posts,
+                       (SELECT COUNT(*) FROM tag_types WHERE is_active = TRUE)::int AS tags,
+                       (SELECT COUNT(*) FROM post_discussions WHERE is_deleted = FALSE)::int AS comments"""
+            )
+        return dict(row)
 
     # ============================================
     # FILE UPLOAD OPERATIONS
     # ============================================
     
     async def create_content_upload(self, upload_data: Dict[str, Any]) -> bool:
-        """Create a new file upload record"""
+        """Create a new file upload record (the bytes go to content_uploads_blob)"""
         try:
-            await self.execute_command(
-                """INSERT INTO content_uploads 
-                   (id, filename, original_filename, content_type, file_size, file_data,
-                    uploaded_by, is_public, visibility, title, description, created_by, updated_by)
-                   VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)""",
-                (
-                    upload_data['id'], upload_data['filename'], upload_data['original_filename'],
-                    upload_data['content_type'], upload_data['file_size'], upload_data['file_data'],
-                    upload_data['uploaded_by'], upload_data['is_public'], upload_data['visibility'],
-                    upload_data['title'], upload_data.get('description'), 
-                    upload_data['created_by'], upload_data['updated_by']
+            if not await self._has_schema_feature('upload_blob_table'):
+                # Pre-2.6.0 schema (bootstrap.sql): bytes stay inline in content_uploads
+                await self.execute_command(
+                    """INSERT INTO content_uploads 
+                       (id, filename, original_filename, content_type, file_size, file_data,
+                        uploaded_by, is_public, visibility, title, description, created_by, updated_by)
+                       VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)""",
+                    (
+                        upload_data['id'], upload_data['filename'], upload_data['original_filename'],
+                        upload_data['content_type'], upload_data['file_size'], upload_data['file_data'],
+                        upload_data['uploaded_by'], upload_data['is_public'], upload_data['visibility'],
+                        upload_data['title'], upload_data.get('description'),
+                        upload_data['created_by'], upload_data['updated_by']
+                    )
                 )
-            )
+                return True
+            
+            async with self.connection_pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        """INSERT INTO content_uploads 
+                           (id, filename, original_filename, content_type, file_size,
+                            uploaded_by, is_public, visibility, title, description, created_by, updated_by)
+                           VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)""",
+                        upload_data['id'], upload_data['filename'], upload_data['original_filename'],
+                        upload_data['content_type'], upload_data['file_size'],
+                        upload_data['uploaded_by'], upload_data['is_public'], upload_data['visibility'],
+                        upload_data['title'], upload_data.get('description'), 
+                        upload_data['created_by'], upload_data['updated_by']
+                    )
+                    await conn.execute(
+                        "INSERT INTO content_uploads_blob (upload_id, file_data) VALUES ($1, $2)",
+                        upload_data['id'], upload_data['file_data']
+                    )
             return True
         except Exception as e:
             logger.error(f"Failed to create content upload: {e}")
             return False
     
     async def get_content_upload(self, file_id: str) -> Optional[Dict[str, Any]]:
-        """Get file upload data by ID"""
+        """Get file upload metadata by ID (without file_data; see get_content_upload_blob)"""
         try:
-            results = await self.execute_query(
-                "SELECT * FROM content_uploads WHERE id = $1 AND is_deleted = $2",
+            return await self.fetch_record(
+                f"SELECT {_UPLOAD_META_COLUMNS} FROM content_uploads cu WHERE cu.id = $1 AND cu.is_deleted = $2",
                 (file_id, False)
             )
-            return dict(results[0]) if results else None
         except Exception as e:
             logger.error(f"Failed to get content upload: {e}")
             return None
     
-    async def get_user_uploads(self, user_id: str, visibility: Optional[str] = None, 
-                              tags: Optional[List[str]] = None, search: Optional[str] = None,
-                              sort_by: str = "recent", limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get user's uploaded files with filtering"""
+    async def get_content_upload_blob(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """Get file upload metadata together with file_data (from content_uploads_blob), for serving the file"""
         try:
-            # Base query
-            query = """
-                SELECT DISTINCT cu.* FROM content_uploads cu
-                WHERE cu.uploaded_by = $1 AND cu.is_deleted = $2
-            """
-            params = [user_id, False]
-            param_count = 2
-            
-            # Add visibility filter
-            if visibility:
-                param_count += 1
-                query += f" AND cu.visibility = ${param_count}"
-                params.append(visibility)
-            
-            # Add search filter
-            if search:
-                param_count += 1
-                search_param = f"${param_count}"
-                query += f" AND (cu.title ILIKE {search_param} OR cu.original_filename ILIKE {search_param} OR cu.description ILIKE {search_param})"
-                params.append(f"%{search}%")
-            
-            # Add tag filter
-            if tags:
-                placeholders = ','.join([f"${param_count + i + 1}" for i in range(len(tags))])
-                query += f"""
-                    AND cu.id IN (
-                        SELECT DISTINCT cut.upload_id 
-                        FROM content_upload_tags cut 
-                        JOIN tag_types tt ON cut.tag_id = tt.id 
-                        WHERE tt.name = ANY(ARRAY[{placeholders}])
-                    )
-                """
-                params.extend(tags)
-                param_count += len(tags)
-            
-            # Add sorting
-            if sort_by == "recent":
-                query += " ORDER BY cu.created_ts DESC"
-            elif sort_by == "name":
-                query += " ORDER BY cu.title ASC, cu.original_filename ASC"
-            else:
-                query += " ORDER BY cu.created_ts DESC"
-            
-            # Add pagination
-            param_count += 1
-            query += f" LIMIT ${param_count}"
-            params.append(limit)
+            if not await self._has_schema_feature('upload_blob_table'):
+                return await self.fetch_record(
+                    f"""SELECT {_UPLOAD_META_COLUMNS}, cu.file_data
+                        FROM content_uploads cu
+                        WHERE cu.id = $1 AND cu.is_deleted = $2""",
+                    (file_id, False)
+                )
+            return await self.fetch_record(
+                f"""SELECT {_UPLOAD_META_COLUMNS}, b.file_data
+                    FROM content_uploads cu
+                    JOIN content_uploads_blob b ON b.upload_id = cu.id
+                    WHERE cu.id = $1 AND cu.is_deleted = $2""",
+                (file_id, False)
+            )
+        except Exception as e:
+            logger.error(f"Failed to get content upload data: {e}")
+            return None
+    
+    def _upload_filter_sql(self, user_id: str, visibility: Optional[str] = None,
+                           tags: Optional[List[str]] = None,
+                           search: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause and params shared by the upload listing queries
+        
+        Absent filters are bound as NULL, so the clause text is the same for every
+        filter combination and the listing statements stay in asyncpg's cache.
+        """
+        params: List[Any] = [
+            user_id,
+            False,
+            visibility or None,
+            f"%{search}%" if search else None,
+            list(tags) if tags else None,
+        ]
+        return _UPLOAD_FILTER_SQL, params
+    
+    def _user_uploads_query(self, where: str, params: List[Any], sort_by: str, limit: int, offset: int,
+                            after_ts: Optional[datetime], after_id: Optional[str],
+                            with_total: bool = False) -> str:
+        """Append cursor, ordering and paging to an upload filter; extends params in place"""
+        param_count = len(params)
+        total_column = ", COUNT(*) OVER() AS total_count" if with_total else ""
+        query = f"SELECT {_UPLOAD_META_COLUMNS}{total_column} FROM content_uploads cu WHERE {where}"
+        
+        # Keyset cursor applies to the recent-first ordering only
+        use_cursor = sort_by != "name" and after_ts is not None and after_id is not None
+        if use_cursor:
+            query += f" AND (cu.created_ts, cu.id) < (${param_count + 1}, ${param_count + 2})"
+            params.extend([_naive_utc(after_ts), after_id])
+            param_count += 2
+        
+        # Add sorting
+        if sort_by == "name":
+            query += " ORDER BY cu.title ASC, cu.original_filename ASC"
+        else:
+            query += " ORDER BY cu.created_ts DESC, cu.id DESC"
+        
+        # Add pagination
+        param_count += 1
+        query += f" LIMIT ${param_count}"
+        params.append(limit)
+        if not use_cursor:
             param_count += 1
             query += f" OFFSET ${param_count}"
             params.append(offset)
-            
-            results = await self.execute_query(query, tuple(params))
-            return [dict(row) for row in results]
+        return query
+    
+    async def get_user_uploads(self, user_id: str, visibility: Optional[str] = None, 
+                              tags: Optional[List[str]] = None, search: Optional[str] = None,
+                              sort_by: str = "recent", limit: int = 50, offset: int = 0,
+                              after_ts: Optional[datetime] = None,
+                              after_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get user's uploaded files with filtering
+        
+        Recent-first listings accept the last row's created_ts and id as
+        after_ts/after_id for keyset pagination; offset is then ignored.
+        """
+        try:
+            where, params = self._upload_filter_sql(user_id, visibility, tags, search)
+            query = self._user_uploads_query(where, params, sort_by, limit, offset, after_ts, after_id)
+            return await self.fetch_records(query, tuple(params))
         except Exception as e:
             logger.error(f"Failed to get user uploads: {e}")
             return []
     
+    async def get_user_uploads_page(self, user_id: str, visibility: Optional[str] = None,
+                                    tags: Optional[List[str]] = None, search: Optional[str] = None,
+                                    sort_by: str = "recent", limit: int = 50, offset: int = 0,
+                                    after_ts: Optional[datetime] = None,
+                                    after_id: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """Get one page of a user's uploads plus the total match count
+        
+        The total comes from COUNT(*) OVER() in the same query. It is only
+        counted separately when the window cannot see every match: keyset
+        pages, or an offset past the last row. Rows are returned as asyncpg
+        Records and still carry the total_count column.
+        """
+        try:
+            where, params = self._upload_filter_sql(user_id, visibility, tags, search)
+            filter_params = list(params)
+            query = self._user_uploads_query(where, params, sort_by, limit, offset,
+                                             after_ts, after_id, with_total=True)
+            use_cursor = sort_by != "name" and after_ts is not None and after_id is not None
+            async with self.connection_pool.acquire() as conn:
+                records = await conn.fetch(query, *params)
+                total = records[0]['total_count'] if records else 0
+                if use_cursor or (not records and offset > 0):
+                    total = await conn.fetchval(
+                        f"SELECT COUNT(*) FROM content_uploads cu WHERE {where}", *filter_params
+                    ) or 0
+            return records, total
+        except Exception as e:
+            logger.error(f"Failed to get user uploads page: {e}")
+            return [], 0
+    
     async def count_user_uploads(self, user_id: str, visibility: Optional[str] = None, 
                                 tags: Optional[List[str]] = None, search: Optional[str] = None) -> int:
         """Count user's uploaded files with filtering"""
         try:
-            # Base query
-            query = """
-                SELECT COUNT(DISTINCT cu.id) as count FROM content_uploads cu
-                WHERE cu.uploaded_by = $1 AND cu.is_deleted = $2
-            """
-            params = [user_id, False]
-            param_count = 2
-            
-            # Add visibility filter
-            if visibility:
-                param_count += 1
-                query += f" AND cu.visibility = ${param_count}"
-                params.append(visibility)
-            
-            # Add search filter
-            if search:
-                param_count += 1
-                search_param = f"${param_count}"
-                query += f" AND (cu.title ILIKE {search_param} OR cu.original_filename ILIKE {search_param} OR cu.description ILIKE {search_param})"
-                params.append(f"%{search}%")
-            
-            # Add tag filter
-            if tags:
-                placeholders = ','.join([f"${param_count + i + 1}" for i in range(len(tags))])
-                query += f"""
-                    AND cu.id IN (
-                        SELECT DISTINCT cut.upload_id 
-                        FROM content_upload_tags cut 
-                        JOIN tag_types tt ON cut.tag_id = tt.id 
-                        WHERE tt.name = ANY(ARRAY[{placeholders}])
-                    )
-                """
-                params.extend(tags)
-            
-            results = await self.execute_query(query, tuple(params))
-            return results[0]['count'] if results else 0
+            where, params = self._upload_filter_sql(user_id, visibility, tags, search)
+            return await self.execute_scalar(
+                f"SELECT COUNT(*) as count FROM content_uploads cu WHERE {where}", tuple(params)
+            ) or 0
         except Exception as e:
             logger.error(f"Failed to count user uploads: {e}")
             return 0
     
     async def update_content_upload(self, file_id: str, update_data: Dict[str, Any]) -> bool:
-        """Update file upload metadata"""
+        """Update file upload metadata
+        
+        Uses one fixed statement for every field combination; fields that are
+        absent (or None) keep their current value.
+        """
         try:
-            # Build dynamic update query
-            set_clauses = []
-            params = []
-            param_count = 0
-            
-            for key, value in update_data.items():
-                if key in ['title', 'description', 'visibility', 'is_public', 'updated_by', 'is_deleted']:
-                    param_count += 1
-                    set_clauses.append(f"{key} = ${param_count}")
-                    params.append(value)
-            
-            if not set_clauses:
+            values = [update_data.get(key) for key in _UPLOAD_UPDATE_FIELDS]
+            if all(value is None for value in values):
                 return True  # No updates needed
             
-            # Add updated timestamp
-            param_count += 1
-            set_clauses.append(f"updated_ts = CURRENT_TIMESTAMP")
-            
-            # Add WHERE clause
-            param_count += 1
-            params.append(file_id)
-            
-            query = f"UPDATE content_uploads SET {', '.join(set_clauses)} WHERE id = ${param_count}"
-            await self.execute_command(query, tuple(params))
+            await self.execute_command(_UPDATE_UPLOAD_SQL, (file_id, *values))
             return True
         except Exception as e:
             logger.error(f"Failed to update content upload: {e}")
@@ -1304,7 +1601,7 @@ class PostgreSQLService(DatabaseService):
     async def get_upload_tags(self, file_id: str) -> List[Dict[str, Any]]:
         """Get tags associated with a file upload"""
         try:
-            results = await self.execute_query(
+            return await self.fetch_records(
                 """SELECT tt.id, tt.name, tt.description, tt.color 
                    FROM content_upload_tags cut
                    JOIN tag_types tt ON cut.tag_id = tt.id
@@ -1312,69 +1609,68 @@ class PostgreSQLService(DatabaseService):
                    ORDER BY tt.name""",
                 (file_id,)
             )
-            return [dict(row) for row in results]
         except Exception as e:
             logger.error(f"Failed to get upload tags: {e}")
             return []
 
-    async def _get_or_create_tag_id(self, tag_name: str, user_id: str) -> Optional[str]:
-        """Get existing tag ID or create new tag and return ID"""
-        try:
-            # Check if tag exists
-            existing_tag = await self.get_tag_by_name(tag_name)
-            if existing_tag:
-                return existing_tag['id']
-            
-            # Create new tag
-            import re
-            # Remove # symbol, strip other special chars except hyphens, replace spaces with hyphens, lowercase
-            tag_id = re.sub(r'[^a-zA-Z0-9 -]', '', tag_name.replace('#', '')).lower().replace(' ', '-')
-            await self.create_tag({
-                'id': tag_id,
-                'name': tag_name,
-                'description': f'Auto-created tag: {tag_name}',
-                'created_by': user_id
-            })
-            return tag_id
-            
-        except Exception as e:
-            logger.error(f"Failed to get or create tag {tag_name}: {e}")
-            return None
+    async def _link_upload_tags(self, conn: asyncpg.Connection, user_id: str, file_id: str,
+                                tag_names: List[str]) -> bool:
+        """Create missing tags and link them to an upload on the given connection; returns whether tags were created"""
+        names = list(dict.fromkeys(n.strip().lower() for n in tag_names if n and n.strip()))
+        if not names:
+            return False
+        
+        # Create any tags that do not exist yet (slug: ASCII letters/digits/hyphens, spaces to hyphens)
+        created = await conn.fetch(
+            """INSERT INTO tag_types (id, name, description, created_by)
+               SELECT lower(replace(regexp_replace(t.name, '[^a-zA-Z0-9 -]', '', 'g'), ' ', '-')),
+                      t.name, 'Auto-created tag: ' || t.name, $2
+               FROM UNNEST($1::text[]) AS t(name)
+               ON CONFLICT DO NOTHING
+               RETURNING id""",
+            names, user_id
+        )
+        # Link each name to its tag: an active tag with that name, else the tag holding its slug
+        await conn.execute(
+            """INSERT INTO content_upload_tags (id, upload_id, tag_id, created_by)
+               SELECT gen_random_uuid()::text, $2, COALESCE(by_name.id, by_slug.id), $3
+               FROM UNNEST($1::text[]) AS t(name)
+               LEFT JOIN tag_types by_name ON by_name.name = t.name AND by_name.is_active = TRUE
+               LEFT JOIN tag_types by_slug
+                      ON by_slug.id = lower(replace(regexp_replace(t.name, '[^a-zA-Z0-9 -]', '', 'g'), ' ', '-'))
+               WHERE COALESCE(by_name.id, by_slug.id) IS NOT NULL
+               ON CONFLICT (upload_id, tag_id) DO NOTHING""",
+            names, file_id, user_id
+        )
+        return bool(created)
     
     async def associate_tags_with_upload(self, user_id: str, file_id: str, tag_names: List[str]) -> bool:
-        """Associate tags with a file upload"""
+        """Associate tags with a file upload (missing tags are created; two statements in total)"""
         try:
-            for tag_name in tag_names:
-                # Get or create tag
-                tag_id = await self._get_or_create_tag_id(tag_name.strip().lower(), user_id)
-                
-                if tag_id:
-                    # Create association (ignore if already exists)
-                    await self.execute_command(
-                        """INSERT INTO content_upload_tags 
-                           (id, upload_id, tag_id, created_by) 
-                           VALUES ($1, $2, $3, $4)
-                           ON CONFLICT (upload_id, tag_id) DO NOTHING""",
-                        (str(uuid.uuid4()), file_id, tag_id, user_id)
-                    )
+            async with self.connection_pool.acquire() as conn:
+                async with conn.transaction():
+                    created = await self._link_upload_tags(conn, user_id, file_id, tag_names)
+            if created:
+                self.invalidate_reference_cache('tags')
             return True
         except Exception as e:
             logger.error(f"Failed to associate tags with upload: {e}")
             return False
     
     async def update_upload_tags(self, user_id: str, file_id: str, tag_names: List[str]) -> bool:
-        """Update tags for a file upload"""
+        """Update tags for a file upload (replace all associations in one transaction)"""
         try:
-            # Remove existing tag associations
-            await self.execute_command(
-                "DELETE FROM content_upload_tags WHERE upload_id = $1",
-                (file_id,)
-            )
-            
-            # Add new associations
-            if tag_names:
-                return await self.associate_tags_with_upload(user_id, file_id, tag_names)
-            
+            async with self.connection_pool.acquire() as conn:
+                async with conn.transaction():
+                    # Remove existing tag associations
+                    await conn.execute(
+                        "DELETE FROM content_upload_tags WHERE upload_id = $1",
+                        file_id
+                    )
+                    # Add new associations
+                    created = await self._link_upload_tags(conn, user_id, file_id, tag_names or [])
+            if created:
+                self.invalidate_reference_cache('tags')
             return True
         except Exception as e:
             logger.error(f"Failed to update upload tags: {e}")
@@ -1385,33 +1681,51 @@ class PostgreSQLService(DatabaseService):
     # =====================================================
     
     async def table_exists(self, table_name: str) -> bool:
-        """Check if a table exists in the database"""
+        """Check if a table exists in the database
+        
+        The first successful lookup loads every public table name from
+        pg_tables; later hits are answered from memory. Misses are always
+        re-checked, since bootstrap and migrations create tables at runtime.
+        """
+        if table_name in self._known_tables:
+            return True
         try:
             async with self.connection_pool.acquire() as conn:
-                result = await conn.fetchval(
-                    """SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = $1
-                    )""",
-                    table_name
-                )
-                return result
+                rows = await conn.fetch("SELECT tablename FROM pg_tables WHERE schemaname = 'public'")
+            self._known_tables.update(row['tablename'] for row in rows)
+            return table_name in self._known_tables
         except Exception as e:
             logger.error(f"Failed to check if table {table_name} exists: {e}")
             return False
     
+    async def _has_schema_feature(self, feature: str) -> bool:
+        """Check for a migration-added schema piece listed in _SCHEMA_FEATURE_SQL
+        
+        Lets queries fall back to the bootstrap.sql schema when migrations
+        were skipped. A present feature is cached for good (migrations only
+        add); an absent one is re-checked after REFERENCE_CACHE_TTL seconds,
+        or right away after this process runs bootstrap or a migration.
+        """
+        entry = self._schema_features.get(feature)
+        if entry and (entry[1] or time.monotonic() - entry[0] < REFERENCE_CACHE_TTL):
+            return entry[1]
+        try:
+            async with self.connection_pool.acquire() as conn:
+                present = bool(await conn.fetchval(_SCHEMA_FEATURE_SQL[feature]))
+        except Exception as e:
+            logger.error(f"Failed to check schema feature {feature}: {e}")
+            # Assume the migrated schema, as before the check existed
+            return True
+        if not present and entry is None:
+            logger.warning(f"⚠️ Schema feature '{feature}' missing (migrations skipped?), using fallback queries")
+        self._schema_features[feature] = (time.monotonic(), present)
+        return present
+    
     async def get_site_setting(self, setting_key: str, user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get a site setting by key"""
         try:
             async with self.connection_pool.acquire() as conn:
-                result = await conn.fetchrow(
-                    """SELECT id, setting_key, setting_value, setting_type, user_id, description, 
-                              is_active, created_ts, updated_ts, created_by, updated_by
-                       FROM site_settings 
-                       WHERE setting_key = $1 AND user_id IS NOT DISTINCT FROM $2 AND is_active = TRUE""",
-                    setting_key, user_id
-                )
+                result = await conn.fetchrow(_GET_SITE_SETTING_SQL, setting_key, user_id)
                 
                 if result:
                     setting = dict(result)
@@ -1419,8 +1733,8 @@ class PostgreSQLService(DatabaseService):
                     value = setting['setting_value']
                     if setting['setting_type'] == 'json':
                         try:
-                            value = json.loads(value)
-                        except json.JSONDecodeError:
+                            value = orjson.loads(value)
+                        except orjson.JSONDecodeError:
                             logger.warning(f"Failed to parse JSON setting: {setting_key}")
                     elif setting['setting_type'] == 'boolean':
                         value = value.lower() in ('true', '1', 'yes', 'on')
@@ -1445,46 +1759,16 @@ class PostgreSQLService(DatabaseService):
             logger.info(f"Setting site setting {setting_key} for user {user_id or 'system'} - {setting_value} ({setting_type})")
             # Convert value to string based on type
             if setting_type == 'json':
-                value_str = json.dumps(setting_value)
+                value_str = _json_dumps(setting_value)
             elif setting_type == 'boolean':
                 value_str = 'true' if setting_value else 'false'
             else:
                 value_str = str(setting_value)
             
+            # Update-or-insert in one statement; the audit user falls back to the 'system' user
             async with self.connection_pool.acquire() as conn:
-                # Get a valid system user ID (username='system') for created_by/updated_by
-                system_user_id = user_id
-                if not system_user_id:
-                    system_user_result = await conn.fetchval(
-                        "SELECT id FROM users WHERE username = 'system' AND is_active = TRUE LIMIT 1"
-                    )
-                    system_user_id = system_user_result or user_id
-                
-                # Check if setting exists
-                existing = await conn.fetchrow(
-                    "SELECT id FROM site_settings WHERE setting_key = $1 AND user_id IS NOT DISTINCT FROM $2",
-                    setting_key, user_id
-                )
-                
-                if existing:
-                    # Update existing setting
-                    await conn.execute(
-                        """UPDATE site_settings 
-                           SET setting_value = $1, setting_type = $2, description = $3, 
-                               updated_ts = CURRENT_TIMESTAMP, updated_by = $4
-                           WHERE setting_key = $5 AND user_id IS NOT DISTINCT FROM $6""",
-                        value_str, setting_type, description, system_user_id, setting_key, user_id
-                    )
-                else:
-                    # Create new setting
-                    await conn.execute(
-                        """INSERT INTO site_settings 
-                           (id, setting_key, setting_value, setting_type, user_id, description, 
-                            created_by, updated_by)
-                           VALUES ($1, $2, $3, $4, $5, $6, $7, $8)""",
-                        str(uuid.uuid4()), setting_key, value_str, setting_type, user_id, 
-                        description, system_user_id, system_user_id
-                    )
+                await conn.execute(_UPSERT_SITE_SETTING_SQL,
+                                   setting_key, value_str, setting_type, description, user_id)
             
             return True
         except Exception as e:
@@ -1508,14 +1792,10 @@ class PostgreSQLService(DatabaseService):
         """Execute a migration SQL script"""
         try:
             async with self.connection_pool.acquire() as conn:
-                # Split SQL into individual statements
-                statements = [stmt.strip() for stmt in migration_sql.split(';') if stmt.strip()]
-                
                 async with conn.transaction():
-                    for statement in statements:
-                        if statement:
-                            logger.debug(f"Executing migration statement: {statement[:100]}...")
-                            await conn.execute(statement)
+                    # Sent as one script: keeps dollar-quoted function bodies intact
+                    await conn.execute(migration_sql)
+            self._schema_features.clear()
             
             logger.info("✅ Migration SQL executed successfully")
             return True
@@ -1539,6 +1819,7 @@ class PostgreSQLService(DatabaseService):
                 sql_content = file.read()
             
             # Execute bootstrap SQL (PostgreSQL version with $1, $2 syntax handling)
+            self._schema_features.clear()
             return await self.execute_bootstrap(sql_content)
             
         except Exception as e:
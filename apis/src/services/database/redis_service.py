@@ -3,13 +3,19 @@ Redis Database Service Implementation
 Provides Redis-based storage for ITG DocVerse
 """
 
-import json
+import asyncio
+import functools
 import logging
-import uuid
+import random
+import time
+import typing
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from enum import Enum
+from typing import List, Optional, Dict, Any, FrozenSet, Tuple
 from uuid import uuid4
 
+import orjson
 import redis.asyncio as redis
 from redis.asyncio import Redis
 
@@ -22,6 +28,209 @@ from ...config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+
+# Removes a post with every index entry, tag link and comment in one atomic server-side call.
+# Keys are UNLINKed so large post bodies are freed off the server's main thread.
+# KEYS[1] = post:{id}, ARGV[1] = post id. Returns 0 when the post does not exist.
+_DELETE_POST_LUA = """
+local post_id = ARGV[1]
+local post = redis.call('HMGET', KEYS[1], 'author_id', 'status', 'post_type')
+if not post[1] then
+    return 0
+end
+
+redis.call('SREM', 'indexes:posts', post_id)
+redis.call('ZREM', 'posts:by_date', post_id)
+redis.call('SREM', 'posts:by_author:' .. post[1], post_id)
+if post[2] then redis.call('SREM', 'posts:by_status:' .. post[2], post_id) end
+if post[3] then redis.call('SREM', 'posts:by_type:' .. post[3], post_id) end
+
+for _, tag_id in ipairs(redis.call('SMEMBERS', 'post:tags:' .. post_id)) do
+    redis.call('SREM', 'posts:by_tag:' .. tag_id, post_id)
+    redis.call('SREM', 'tag:posts:' .. tag_id, post_id)
+end
+redis.call('UNLINK', 'post:tags:' .. post_id, KEYS[1])
+
+for _, comment_id in ipairs(redis.call('SMEMBERS', 'comments:by_post:' .. post_id)) do
+    local body = redis.call('GET', 'comment:' .. comment_id)
+    if body then
+        local ok, comment = pcall(cjson.decode, body)
+        if ok and type(comment.author_id) == 'string' then
+            redis.call('SREM', 'comments:by_author:' .. comment.author_id, comment_id)
+        end
+        redis.call('UNLINK', 'comment:' .. comment_id)
+    end
+    redis.call('SREM', 'indexes:comments', comment_id)
+end
+redis.call('UNLINK', 'comments:by_post:' .. post_id, 'comments:by_post_date:' .. post_id)
+return 1
+"""
+
+# Updates a post's HASH fields and moves it between the status/type filter SETs in one atomic step,
+# so the SET moves always follow the values actually stored. KEYS = post:{id}; ARGV = post id, the
+# number of field/value pairs, the pairs, then the fields to clear. Returns the new HASH, or nil
+# if the post does not exist.
+_UPDATE_POST_LUA = """
+local post_id = ARGV[1]
+if redis.call('HEXISTS', KEYS[1], 'id') == 0 then
+    return false
+end
+local old = redis.call('HMGET', KEYS[1], 'status', 'post_type')
+
+local pairs_end = 2 + 2 * tonumber(ARGV[2])
+if pairs_end > 2 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, 3, pairs_end))
+end
+if #ARGV > pairs_end then
+    redis.call('HDEL', KEYS[1], unpack(ARGV, pairs_end + 1, #ARGV))
+end
+
+local new = redis.call('HMGET', KEYS[1], 'status', 'post_type')
+local prefixes = {'posts:by_status:', 'posts:by_type:'}
+for i = 1, 2 do
+    if old[i] ~= new[i] then
+        if old[i] then redis.call('SREM', prefixes[i] .. old[i], post_id) end
+        if new[i] then redis.call('SADD', prefixes[i] .. new[i], post_id) end
+    end
+end
+return redis.call('HGETALL', KEYS[1])
+"""
+
+# Adds a reaction unless the user already has one of this type on the target (checked atomically).
+# KEYS = constraint key, reaction:{id}, then the target/user/type index sets, and for favorites the
+# user's favorite set; ARGV = reaction id, reaction JSON, target id. Returns the stored reaction's id.
+_ADD_REACTION_LUA = """
+local existing = redis.call('GET', KEYS[1])
+if existing then
+    return existing
+end
+redis.call('SET', KEYS[2], ARGV[2])
+redis.call('SADD', KEYS[3], ARGV[1])
+redis.call('SADD', KEYS[4], ARGV[1])
+redis.call('SADD', KEYS[5], ARGV[1])
+if KEYS[6] then
+    redis.call('SADD', KEYS[6], ARGV[3])
+end
+redis.call('SET', KEYS[1], ARGV[1])
+return ARGV[1]
+"""
+
+
+def _favorites_key(user_id: str, target_type: str) -> str:
+    """SET of the target ids a user has marked event-favorite, per target type"""
+    return f"reactions:user:{user_id}:favorite-{target_type}"
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Serialize a value to JSON with orjson (datetimes and enums natively, anything else via str)
+    
+    Returns orjson's UTF-8 bytes as they are: every caller writes the result to Redis, and
+    redis-py sends bytes without re-encoding, so decoding to str would only add a copy.
+    """
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Most queued user events written per pipeline by the background event writer
+_EVENT_BATCH_SIZE = 500
+# Pending events before log_user_event starts failing (Redis writes are then falling behind)
+_EVENT_QUEUE_SIZE = 10000
+# Write attempts per batch before it is dropped, and the first retry delay in seconds (doubles)
+_EVENT_WRITE_ATTEMPTS = 5
+_EVENT_RETRY_DELAY = 0.5
+# Seconds close() waits for queued events to be written
+_EVENT_FLUSH_TIMEOUT = 10
+
+# Seconds a user response dict is served from the in-process cache, and how many are kept
+USER_CACHE_TTL = 5
+USER_CACHE_SIZE = 1024
+# Pub/sub channel on which user writes announce the changed user id, so every
+# worker process drops its cached copy (USER_CACHE_TTL bounds staleness if a message is missed)
+_USER_INVALIDATION_CHANNEL = "cache:invalidate:user"
+# Same for tag bodies and tag name -> id lookups (tags are never edited in this backend)
+TAG_CACHE_TTL = 60
+TAG_CACHE_SIZE = 10000
+
+# User fields the API responses expose; readers HMGET only these (never password_hash etc.)
+_USER_DICT_FIELDS = ('id', 'username', 'display_name', 'email', 'bio', 'location', 'avatar_url', 'is_verified')
+_USER_DEFAULTS = {
+    'id': None, 'username': None, 'display_name': None, 'email': None,
+    'bio': '', 'location': '', 'avatar_url': '', 'is_verified': False, 'is_active': True,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _loads_cached(data: str) -> Dict[str, Any]:
+    """Parse a stored JSON body, memoized on the payload so repeat reads of an unchanged
+    record skip the parse. A changed record is a different payload, so entries never go
+    stale; callers must treat the returned dict as read-only."""
+    return orjson.loads(data)
+
+
+def _field_type(field) -> Any:
+    """A model field's annotation with Optional[...] unwrapped"""
+    annotation = field.annotation
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else annotation
+    return annotation
+
+
+def _is_enum(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, Enum)
+
+
+@functools.lru_cache(maxsize=None)
+def _hash_json_fields(model_class) -> FrozenSet[str]:
+    """Model fields stored JSON-encoded in a HASH; str, datetime and enum fields are stored as plain strings"""
+    json_fields = set()
+    for name, field in model_class.model_fields.items():
+        annotation = _field_type(field)
+        if not (annotation in (str, datetime) or _is_enum(annotation)):
+            json_fields.add(name)
+    return frozenset(json_fields)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_decoders(model_class) -> typing.Tuple[typing.Tuple[str, typing.Callable[[str], Any]], ...]:
+    """(name, decoder) for a model's datetime and enum fields, worked out once per class"""
+    decoders = []
+    for name, field in model_class.model_fields.items():
+        annotation = _field_type(field)
+        if annotation is datetime:
+            decoders.append((name, datetime.fromisoformat))
+        elif _is_enum(annotation):
+            decoders.append((name, annotation))
+    return tuple(decoders)
+
+
+class _TTLCache:
+    """Bounded in-process cache whose entries expire ttl seconds after being stored (oldest evicted first)"""
+    
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: typing.OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: str) -> Any:
+        """The cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class RedisService(DatabaseService):
     """Redis implementation of DatabaseService"""
     
@@ -38,11 +247,36 @@ class RedisService(DatabaseService):
             'socket_keepalive_options': {},
             'health_check_interval': 30
         }
+        # Set by _initialize_search_index when the server has the RediSearch module
+        self._search_available = False
+        self._delete_post_script = None
+        self._update_post_script = None
+        self._add_reaction_script = None
+        # Recently read users (id -> user dict), tag bodies (id -> stored JSON) and tag ids by name
+        self._user_cache = _TTLCache(USER_CACHE_TTL, USER_CACHE_SIZE)
+        self._tag_cache = _TTLCache(TAG_CACHE_TTL, TAG_CACHE_SIZE)
+        self._tag_name_cache = _TTLCache(TAG_CACHE_TTL, TAG_CACHE_SIZE)
+        # User events are written off the request path by a background task (see log_user_event)
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._event_writer: Optional[asyncio.Task] = None
+        # Drops _user_cache entries changed by other processes (see _listen_for_invalidations)
+        self._invalidation_listener: Optional[asyncio.Task] = None
+        # Events this process gave up on after repeated write failures (logged with each drop)
+        self._dropped_events = 0
     
     async def initialize(self) -> None:
         """Initialize Redis connection"""
         try:
-            self.redis_client = redis.Redis(**self._connection_params)
+            # Bounded shared pool: concurrent requests each check out their own connection,
+            # and wait for a free one (rather than opening more) once redis_pool_size are busy
+            pool = redis.BlockingConnectionPool(
+                max_connections=settings.redis_pool_size, **self._connection_params
+            )
+            self.redis_client = redis.Redis(connection_pool=pool)
+            # Runs via EVALSHA, falling back to EVAL if the server's script cache was flushed
+            self._delete_post_script = self.redis_client.register_script(_DELETE_POST_LUA)
+            self._update_post_script = self.redis_client.register_script(_UPDATE_POST_LUA)
+            self._add_reaction_script = self.redis_client.register_script(_ADD_REACTION_LUA)
             
             # Test connection
             await self.redis_client.ping()
@@ -51,14 +285,38 @@ class RedisService(DatabaseService):
             # Initialize indexes and data structures
             await self._initialize_indexes()
             
+            self._event_queue = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+            self._event_writer = asyncio.create_task(self._write_events())
+            self._invalidation_listener = asyncio.create_task(self._listen_for_invalidations())
+            
         except Exception as e:
             logger.error(f"❌ Failed to connect to Redis: {e}")
             raise
     
     async def close(self) -> None:
         """Close Redis connection"""
+        if self._invalidation_listener:
+            self._invalidation_listener.cancel()
+            try:
+                # Let it release its pubsub connection before the pool is disconnected
+                await self._invalidation_listener
+            except asyncio.CancelledError:
+                pass
+            self._invalidation_listener = None
+        if self._event_writer:
+            # Let queued events reach Redis before the connections go away, but do not
+            # hang shutdown on a Redis that is not accepting writes
+            try:
+                await asyncio.wait_for(self._event_queue.join(), timeout=_EVENT_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.error(f"Gave up flushing user events after {_EVENT_FLUSH_TIMEOUT}s; "
+                             f"{self._event_queue.qsize()} still queued were not written")
+            self._event_writer.cancel()
+            self._event_writer = None
         if self.redis_client:
             await self.redis_client.close()
+            # A pool passed in explicitly is not closed with the client
+            await self.redis_client.connection_pool.disconnect()
             logger.info("Redis connection closed")
     
     async def ping(self) -> bool:
@@ -84,40 +342,22 @@ class RedisService(DatabaseService):
         try:
             logger.debug("🔧 Starting Redis indexes and data structures initialization...")
             
-            # Create index sets if they don't exist
-            indexes_to_create = ["users", "posts", "tags", "comments"]
-            created_indexes = 0
-            existing_indexes = 0
-            
-            for index_name in indexes_to_create:
-                index_key = f"indexes:{index_name}"
-                if await self.redis_client.exists(index_key):
-                    existing_indexes += 1
-                    logger.debug(f"📋 Index {index_key} already exists")
-                else:
-                    await self.redis_client.sadd(index_key, "initialized")
-                    created_indexes += 1
-                    logger.debug(f"✅ Created index {index_key}")
-            
-            logger.debug(f"📊 Index summary: {created_indexes} created, {existing_indexes} existing")
-            
-            # Initialize counters if they don't exist
-            counters_to_create = ["users", "posts", "tags", "comments"]
-            created_counters = 0
-            existing_counters = 0
-            
-            for counter_name in counters_to_create:
-                counter_key = f"counters:{counter_name}"
-                if not await self.redis_client.exists(counter_key):
-                    await self.redis_client.set(counter_key, 0)
-                    created_counters += 1
-                    logger.debug(f"✅ Created counter {counter_key} = 0")
-                else:
-                    current_value = await self.redis_client.get(counter_key)
-                    existing_counters += 1
-                    logger.debug(f"📋 Counter {counter_key} already exists = {current_value}")
-            
-            logger.debug(f"🔢 Counter summary: {created_counters} created, {existing_counters} existing")
+            # Index sets only ever hold real ids (an empty one simply does not exist); older
+            # deployments seeded each with an "initialized" member, so strip that first
+            index_keys = [f"indexes:{name}" for name in ("users", "posts", "tags", "comments")]
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for index_key in index_keys:
+                    pipe.srem(index_key, "initialized")
+                pipe.set("meta:initialized", datetime.now(timezone.utc).isoformat(), nx=True)
+                await pipe.execute()
+            
+            # Posts and users are stored as HASHes; convert any left in the old JSON string layout
+            await self._migrate_to_hash("post", Post)
+            await self._migrate_to_hash("user", User)
+            await self._backfill_users_by_date()
+            await self._backfill_favorite_sets()
+            await self._backfill_comment_timelines()
+            await self._initialize_search_index()
             
             # Log Redis database info
             db_size = await self.redis_client.dbsize()
@@ -132,21 +372,14 @@ class RedisService(DatabaseService):
             logger.debug(f"🐛 Redis initialization error traceback: {traceback.format_exc()}")
             raise
     
-    def _serialize_model(self, obj: Any) -> str:
-        """Serialize model object to JSON string"""
-        if hasattr(obj, 'model_dump'):
-            # Pydantic model
-            data = obj.model_dump()
-        else:
-            # Regular object
-            data = obj.__dict__.copy()
-        
-        # Convert datetime objects to ISO strings
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = value.isoformat()
+    def _serialize_model(self, obj: Any) -> typing.Union[str, bytes]:
+        """Serialize model object to JSON"""
+        if hasattr(obj, 'model_dump_json'):
+            # Pydantic model: pydantic-core writes the JSON directly, no intermediate dict
+            return obj.model_dump_json()
         
-        return json.dumps(data, default=str)
+        # Regular object; orjson writes datetimes as ISO strings itself
+        return _json_dumps(obj.__dict__)
     
     def _deserialize_model(self, data: str, model_class) -> Any:
         """Deserialize JSON string to model object"""
@@ -154,21 +387,165 @@ class RedisService(DatabaseService):
             return None
         
         try:
-            obj_data = json.loads(data)
-            
-            # Convert ISO strings back to datetime objects
-            for key, value in obj_data.items():
-                if isinstance(value, str) and key.endswith('_at'):
-                    try:
-                        obj_data[key] = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                    except (ValueError, AttributeError):
-                        pass
-            
-            return model_class(**obj_data)
+            # The parsed dict is shared through the cache, so decode timestamps and enums into
+            # a copy, visiting only the fields that need it
+            fields = dict(_loads_cached(data))
+            for name, decode in _field_decoders(model_class):
+                value = fields.get(name)
+                if isinstance(value, str):
+                    fields[name] = decode(value)
+            # Skips validation: only valid because every body was written by _serialize_model
+            # from a validated model, so the shape is already guaranteed
+            return model_class.model_construct(**fields)
         except Exception as e:
             logger.error(f"Failed to deserialize {model_class.__name__}: {e}")
             return None
     
+    def _hash_value(self, field: str, value: Any, json_fields: FrozenSet[str]) -> typing.Union[str, bytes]:
+        """Encode one model field for storage as a HASH field value"""
+        if field in json_fields:
+            return _json_dumps(value)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, Enum):
+            return str(value.value)
+        return str(value)
+    
+    def _to_hash(self, obj: Any) -> Dict[str, typing.Union[str, bytes]]:
+        """Encode a model as a HASH mapping; None fields are left out (a missing field reads back as None)"""
+        json_fields = _hash_json_fields(type(obj))
+        return {
+            field: self._hash_value(field, value, json_fields)
+            for field, value in obj.model_dump().items()
+            if value is not None
+        }
+    
+    def _from_hash(self, data: Dict[str, str], model_class) -> Dict[str, Any]:
+        """Decode a HASH written by _to_hash back into plain field values (datetimes stay ISO strings)"""
+        json_fields = _hash_json_fields(model_class)
+        return {
+            field: orjson.loads(value) if field in json_fields else value
+            for field, value in data.items()
+        }
+    
+    async def _migrate_to_hash(self, name: str, model_class) -> None:
+        """Convert {name}:{id} bodies stored as JSON strings (older layout) to HASHes, once
+        
+        Bodies that cannot be decoded are renamed to quarantine:{name}:{id} and dropped
+        from the {name} indexes, so HASH readers never meet a STRING key (WRONGTYPE).
+        """
+        marker = f"migrations:{name}s_hash"
+        if await self.redis_client.exists(marker):
+            return
+        
+        ids = list(await self.redis_client.smembers(f"indexes:{name}s"))
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for item_id in ids:
+                pipe.type(f"{name}:{item_id}")
+            key_types = await pipe.execute()
+        legacy_ids = [item_id for item_id, key_type in zip(ids, key_types) if key_type == "string"]
+        
+        quarantined = []
+        if legacy_ids:
+            legacy_data = await self.redis_client.mget([f"{name}:{item_id}" for item_id in legacy_ids])
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                for item_id, data in zip(legacy_ids, legacy_data):
+                    key = f"{name}:{item_id}"
+                    obj = self._deserialize_model(data, model_class)
+                    if obj:
+                        pipe.delete(key)
+                        pipe.hset(key, mapping=self._to_hash(obj))
+                        continue
+                    # The feeds page ids out of {name}s:by_date, so leaving it is enough to hide the id
+                    if data is not None:
+                        pipe.rename(key, f"quarantine:{key}")
+                    pipe.srem(f"indexes:{name}s", item_id)
+                    pipe.zrem(f"{name}s:by_date", item_id)
+                    quarantined.append(item_id)
+                await pipe.execute()
+        
+        await self.redis_client.set(marker, 1)
+        logger.info(f"✅ Converted {len(legacy_ids) - len(quarantined)} Redis {name} bodies to HASHes")
+        if quarantined:
+            logger.warning(f"⚠️ Quarantined {len(quarantined)} undecodable Redis {name} bodies "
+                           f"as quarantine:{name}:<id>: {quarantined}")
+    
+    async def _backfill_users_by_date(self) -> None:
+        """Populate the users:by_date ZSET for users created before it existed, once"""
+        if await self.redis_client.exists("migrations:users_by_date"):
+            return
+        
+        user_ids = list(await self.redis_client.smembers("indexes:users"))
+        if user_ids:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for uid in user_ids:
+                    pipe.hget(f"user:{uid}", "created_at")
+                created = await pipe.execute()
+            scores = {
+                uid: datetime.fromisoformat(created_at).timestamp()
+                for uid, created_at in zip(user_ids, created) if created_at
+            }
+            if scores:
+                await self.redis_client.zadd("users:by_date", scores)
+        
+        await self.redis_client.set("migrations:users_by_date", 1)
+        logger.info(f"✅ Indexed {len(user_ids)} Redis users by creation date")
+    
+    async def _backfill_favorite_sets(self) -> None:
+        """Populate the per-user favorite target sets from existing event-favorite reactions, once"""
+        if await self.redis_client.exists("migrations:favorite_sets"):
+            return
+        
+        reaction_ids = list(await self.redis_client.smembers("reactions:type:event-favorite"))
+        if reaction_ids:
+            reaction_data = await self.redis_client.mget([f"reaction:{rid}" for rid in reaction_ids])
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for data in reaction_data:
+                    if data:
+                        reaction = orjson.loads(data)
+                        pipe.sadd(_favorites_key(reaction['user_id'], reaction['target_type']), reaction['target_id'])
+                await pipe.execute()
+        
+        await self.redis_client.set("migrations:favorite_sets", 1)
+        logger.info(f"✅ Indexed {len(reaction_ids)} Redis favorites by user")
+    
+    async def _backfill_comment_timelines(self) -> None:
+        """Populate the per-post comments:by_post_date ZSETs for comments created before they existed, once"""
+        if await self.redis_client.exists("migrations:comments_by_post_date"):
+            return
+        
+        comment_ids = list(await self.redis_client.smembers("indexes:comments"))
+        if comment_ids:
+            comment_data = await self.redis_client.mget([f"comment:{cid}" for cid in comment_ids])
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for data in comment_data:
+                    comment = self._deserialize_model(data, Comment)
+                    if comment and comment.created_at:
+                        pipe.zadd(f"comments:by_post_date:{comment.post_id}",
+                                  {comment.id: comment.created_at.timestamp()})
+                await pipe.execute()
+        
+        await self.redis_client.set("migrations:comments_by_post_date", 1)
+        logger.info(f"✅ Indexed {len(comment_ids)} Redis comments by post and date")
+    
+    async def _initialize_search_index(self) -> None:
+        """Create the RediSearch index over post HASHes, if the module is available"""
+        try:
+            try:
+                await self.redis_client.execute_command("FT.INFO", "idx:posts")
+            except redis.ResponseError as e:
+                if "unknown command" in str(e).lower():
+                    raise
+                await self.redis_client.execute_command(
+                    "FT.CREATE", "idx:posts", "ON", "HASH", "PREFIX", 1, "post:",
+                    "SCHEMA", "title", "TEXT", "WEIGHT", 2, "content", "TEXT",
+                    "status", "TAG", "author_id", "TAG"
+                )
+                logger.info("✅ Created RediSearch index idx:posts")
+            self._search_available = True
+        except redis.ResponseError as e:
+            logger.warning(f"⚠️ RediSearch not available, search_posts will scan posts instead: {e}")
+    
     # ============================================
     # USER OPERATIONS
     # ============================================
@@ -185,18 +562,19 @@ class RedisService(DatabaseService):
             user.created_at = user.created_at or now
             user.updated_at = now
             
-            # Store user data
-            user_key = f"user:{user.id}"
-            await self.redis_client.set(user_key, self._serialize_model(user))
-            
-            # Add to indexes
-            await self.redis_client.sadd("indexes:users", user.id)
-            await self.redis_client.set(f"user:username:{user.username}", user.id)
-            await self.redis_client.set(f"user:email:{user.email}", user.id)
-            
-            # Update counter
-            await self.redis_client.incr("counters:users")
-            
+            # Store user data and indexes atomically in one MULTI/EXEC round trip
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.delete(f"user:{user.id}")
+                pipe.hset(f"user:{user.id}", mapping=self._to_hash(user))
+                pipe.sadd("indexes:users", user.id)
+                pipe.zadd("users:by_date", {user.id: user.created_at.timestamp()})
+                pipe.set(f"user:username:{user.username}", user.id)
+                pipe.set(f"user:email:{user.email}", user.id)
+                # Other worker processes drop their cached copy once this commits
+                pipe.publish(_USER_INVALIDATION_CHANNEL, user.id)
+                await pipe.execute()
+            
+            self._user_cache.pop(user.id)
             logger.info(f"Created user: {user.username}")
             return user
             
@@ -204,25 +582,69 @@ class RedisService(DatabaseService):
             logger.error(f"Failed to create user: {e}")
             raise
     
+    async def _listen_for_invalidations(self) -> None:
+        """Background task: drop cached users that any process (this one included) has rewritten
+        
+        Holds one pooled connection subscribed to _USER_INVALIDATION_CHANNEL. If the
+        subscription breaks, messages may have been missed, so the whole user cache
+        is cleared before resubscribing.
+        """
+        while True:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(_USER_INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message['type'] == 'message':
+                        self._user_cache.pop(message['data'])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"User cache invalidation subscription lost, resubscribing: {e}")
+                self._user_cache.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.reset()
+    
+    def _user_dict(self, values: List[Optional[str]]) -> Optional[Dict[str, Any]]:
+        """Build the user response dict from an HMGET of _USER_DICT_FIELDS (None if the user is missing)"""
+        if values[0] is None:
+            return None
+        # Fill the present fields straight into a copy of the defaults (absent fields were None)
+        json_fields = _hash_json_fields(User)
+        user = dict(_USER_DEFAULTS)
+        for field, value in zip(_USER_DICT_FIELDS, values):
+            if value is not None:
+                user[field] = orjson.loads(value) if field in json_fields else value
+        return user
+    
+    async def _get_user_dicts(self, user_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """User response dicts for user_ids, from the short-lived in-process cache where possible;
+        the misses are read with HMGETs of just the response fields in one pipelined round trip"""
+        users: Dict[str, Dict[str, Any]] = {}
+        for uid in user_ids:
+            user = self._user_cache.get(uid)
+            if user:
+                users[uid] = user
+        
+        missing = [uid for uid in dict.fromkeys(user_ids) if uid not in users]
+        if missing:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for uid in missing:
+                    pipe.hmget(f"user:{uid}", _USER_DICT_FIELDS)
+                results = await pipe.execute()
+            for uid, values in zip(missing, results):
+                user = self._user_dict(values)
+                if user:
+                    users[uid] = user
+                    self._user_cache.put(uid, user)
+        
+        # Callers get their own copies; the cached dicts stay untouched
+        return [dict(users[uid]) if uid in users else None for uid in user_ids]
+    
     async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID (returns Dict for compatibility)"""
         try:
-            user_key = f"user:{user_id}"
-            user_data = await self.redis_client.get(user_key)
-            if user_data:
-                user_dict = json.loads(user_data)
-                return {
-                    'id': user_dict.get('id'),
-                    'username': user_dict.get('username'),
-                    'display_name': user_dict.get('display_name'),
-                    'email': user_dict.get('email'),
-                    'bio': user_dict.get('bio', ''),
-                    'location': user_dict.get('location', ''),
-                    'avatar_url': user_dict.get('avatar_url', ''),
-                    'is_verified': user_dict.get('is_verified', False),
-                    'is_active': True
-                }
-            return None
+            return (await self._get_user_dicts([user_id]))[0]
         except Exception as e:
             logger.error(f"Failed to get user {user_id}: {e}")
             return None
@@ -232,7 +654,7 @@ class RedisService(DatabaseService):
         try:
             user_id = await self.redis_client.get(f"user:username:{username}")
             if user_id:
-                return await self.get_user_by_id(user_id.decode() if isinstance(user_id, bytes) else user_id)
+                return await self.get_user_by_id(user_id)
             return None
         except Exception as e:
             logger.error(f"Failed to get user by username {username}: {e}")
@@ -241,18 +663,16 @@ class RedisService(DatabaseService):
     async def get_users(self, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
         """Get list of users with pagination (returns List of Dict for compatibility)"""
         try:
-            user_ids = await self.redis_client.smembers("indexes:users")
-            user_ids = list(user_ids)[skip:skip + limit]
-            
-            users = []
-            for user_id in user_ids:
-                if user_id != "initialized":  # Skip the initialization marker
-                    decoded_id = user_id.decode() if isinstance(user_id, bytes) else user_id
-                    user = await self.get_user_by_id(decoded_id)
-                    if user:
-                        users.append(user)
-            
-            return users
+            if limit <= 0:
+                return []
+            
+            # Page server-side over the creation-date ZSET (newest first) instead of pulling the whole set
+            user_ids = await self.redis_client.zrevrange("users:by_date", skip, skip + limit - 1)
+            if not user_ids:
+                return []
+            
+            # One pipelined round trip for the whole page
+            return [user for user in await self._get_user_dicts(user_ids) if user]
         except Exception as e:
             logger.error(f"Failed to get users: {e}")
             return []
@@ -264,25 +684,10 @@ class RedisService(DatabaseService):
     async def create_tag(self, tag: Tag) -> Tag:
         """Create a new tag"""
         try:
-            # Generate ID if not provided
-            if not tag.id:
-                tag.id = f"tag-{uuid4()}"
-            
-            # Set timestamps
-            now = datetime.now(timezone.utc)
-            tag.created_at = tag.created_at or now
-            tag.updated_at = now
-            
-            # Store tag data
-            tag_key = f"tag:{tag.id}"
-            await self.redis_client.set(tag_key, self._serialize_model(tag))
-            
-            # Add to indexes
-            await self.redis_client.sadd("indexes:tags", tag.id)
-            await self.redis_client.set(f"tag:name:{tag.name}", tag.id)
-            
-            # Update counter
-            await self.redis_client.incr("counters:tags")
+            # Store tag data and indexes atomically in one MULTI/EXEC round trip
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                self._queue_create_tag(pipe, tag)
+                await pipe.execute()
             
             logger.info(f"Created tag: {tag.name}")
             return tag
@@ -291,23 +696,55 @@ class RedisService(DatabaseService):
             logger.error(f"Failed to create tag: {e}")
             raise
     
+    def _queue_create_tag(self, pipe, tag: Tag) -> None:
+        """Fill in the tag's id and timestamps and stage its body and indexes on pipe"""
+        # Generate ID if not provided
+        if not tag.id:
+            tag.id = f"tag-{uuid4()}"
+        
+        # Set timestamps
+        now = datetime.now(timezone.utc)
+        tag.created_at = tag.created_at or now
+        tag.updated_at = now
+        
+        pipe.set(f"tag:{tag.id}", self._serialize_model(tag))
+        pipe.sadd("indexes:tags", tag.id)
+        pipe.set(f"tag:name:{tag.name}", tag.id)
+        self._tag_cache.pop(tag.id)
+        self._tag_name_cache.pop(tag.name)
+    
+    def _tag_dict(self, tag_data: str) -> Dict[str, Any]:
+        """Build the tag response dict from a stored tag JSON string"""
+        tag_dict = _loads_cached(tag_data)
+        return {
+            'id': tag_dict.get('id'),
+            'name': tag_dict.get('name'),
+            'description': tag_dict.get('description', ''),
+            'color': tag_dict.get('color', '#666666'),
+            'posts_count': tag_dict.get('posts_count', 0),
+            'is_active': True,
+            'created_at': tag_dict.get('created_at'),
+            'updated_at': tag_dict.get('updated_at')
+        }
+    
+    async def _get_tag_payloads(self, tag_ids: List[str]) -> List[Optional[str]]:
+        """Stored tag JSON for tag_ids, from the in-process cache where possible; the misses
+        are read with one MGET"""
+        payloads = {tid: self._tag_cache.get(tid) for tid in tag_ids}
+        missing = [tid for tid, data in payloads.items() if data is None]
+        if missing:
+            for tid, data in zip(missing, await self.redis_client.mget([f"tag:{tid}" for tid in missing])):
+                if data:
+                    payloads[tid] = data
+                    self._tag_cache.put(tid, data)
+        return [payloads[tid] for tid in tag_ids]
+    
     async def get_tag_by_id(self, tag_id: str) -> Optional[Dict[str, Any]]:
         """Get tag by ID (returns Dict for compatibility)"""
         try:
-            tag_key = f"tag:{tag_id}"
-            tag_data = await self.redis_client.get(tag_key)
+            tag_data = (await self._get_tag_payloads([tag_id]))[0]
             if tag_data:
-                tag_dict = json.loads(tag_data)
-                return {
-                    'id': tag_dict.get('id'),
-                    'name': tag_dict.get('name'),
-                    'description': tag_dict.get('description', ''),
-                    'color': tag_dict.get('color', '#666666'),
-                    'posts_count': tag_dict.get('posts_count', 0),
-                    'is_active': True,
-                    'created_at': tag_dict.get('created_at'),
-                    'updated_at': tag_dict.get('updated_at')
-                }
+                return self._tag_dict(tag_data)
             return None
         except Exception as e:
             logger.error(f"Failed to get tag {tag_id}: {e}")
@@ -316,10 +753,10 @@ class RedisService(DatabaseService):
     async def get_tag_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get tag by name (returns Dict for compatibility)"""
         try:
-            tag_id = await self.redis_client.get(f"tag:name:{name}")
+            tag_id = self._tag_name_cache.get(name) or await self.redis_client.get(f"tag:name:{name}")
             if tag_id:
-                decoded_id = tag_id.decode() if isinstance(tag_id, bytes) else tag_id
-                return await self.get_tag_by_id(decoded_id)
+                self._tag_name_cache.put(name, tag_id)
+                return await self.get_tag_by_id(tag_id)
             return None
         except Exception as e:
             logger.error(f"Failed to get tag by name {name}: {e}")
@@ -328,17 +765,13 @@ class RedisService(DatabaseService):
     async def get_tags(self) -> List[Dict[str, Any]]:
         """Get all tags (returns List of Dict for compatibility)"""
         try:
-            tag_ids = await self.redis_client.smembers("indexes:tags")
-            
-            tags = []
-            for tag_id in tag_ids:
-                if tag_id != "initialized":  # Skip the initialization marker
-                    decoded_id = tag_id.decode() if isinstance(tag_id, bytes) else tag_id
-                    tag = await self.get_tag_by_id(decoded_id)
-                    if tag:
-                        tags.append(tag)
+            tag_ids = list(await self.redis_client.smembers("indexes:tags"))
+            if not tag_ids:
+                return []
             
-            return tags
+            # Cached bodies plus one MGET for the rest, instead of a GET per tag
+            tag_data = await self._get_tag_payloads(tag_ids)
+            return [self._tag_dict(data) for data in tag_data if data]
         except Exception as e:
             logger.error(f"Failed to get tags: {e}")
             return []
@@ -354,8 +787,7 @@ class RedisService(DatabaseService):
             if not post.id:
                 if post.post_type == PostType.THOUGHTS:
                     # Generate random 7-digit number for thoughts
-                    import random
-                    post.id = f"thoughts-{random.randint(1000000, 9999999)}"
+                    post.id = f"thoughts-{random.randrange(1000000, 10000000)}"
                 else:
                     post.id = f"post-{uuid4()}"
             
@@ -364,24 +796,25 @@ class RedisService(DatabaseService):
             post.created_at = post.created_at or now
             post.updated_at = now
             
-            # Store post data
-            post_key = f"post:{post.id}"
-            await self.redis_client.set(post_key, self._serialize_model(post))
-            
-            # Add to indexes
-            await self.redis_client.sadd("indexes:posts", post.id)
-            await self.redis_client.zadd(f"posts:by_date", {post.id: post.created_at.timestamp()})
-            await self.redis_client.sadd(f"posts:by_author:{post.author_id}", post.id)
-            await self.redis_client.sadd(f"posts:by_status:{post.status.value}", post.id)
-            await self.redis_client.sadd(f"posts:by_type:{post.post_type.value}", post.id)
-            
-            # Add tag associations
-            if post.tags:
-                for tag_id in post.tags:
-                    await self.redis_client.sadd(f"posts:by_tag:{tag_id}", post.id)
-            
-            # Update counter
-            await self.redis_client.incr("counters:posts")
+            # Store post fields as a HASH and every secondary index atomically in one MULTI/EXEC
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.delete(f"post:{post.id}")
+                pipe.hset(f"post:{post.id}", mapping=self._to_hash(post))
+                pipe.sadd("indexes:posts", post.id)
+                pipe.zadd("posts:by_date", {post.id: post.created_at.timestamp()})
+                pipe.sadd(f"posts:by_author:{post.author_id}", post.id)
+                pipe.sadd(f"posts:by_status:{post.status.value}", post.id)
+                pipe.sadd(f"posts:by_type:{post.post_type.value}", post.id)
+                
+                # Add tag associations (both per-tag post sets, as the delete script expects;
+                # get_posts filters on tag:posts); the reverse set is one variadic SADD
+                if post.tags:
+                    for tag_id in post.tags:
+                        pipe.sadd(f"posts:by_tag:{tag_id}", post.id)
+                        pipe.sadd(f"tag:posts:{tag_id}", post.id)
+                    pipe.sadd(f"post:tags:{post.id}", *post.tags)
+                
+                await pipe.execute()
             
             logger.info(f"Created post: {post.id}")
             return post
@@ -390,45 +823,44 @@ class RedisService(DatabaseService):
             logger.error(f"Failed to create post: {e}")
             raise
     
+    def _post_dict(self, post_hash: Dict[str, str]) -> Dict[str, Any]:
+        """Build the post response dict from a stored post HASH"""
+        post_dict = self._from_hash(post_hash, Post)
+        return {
+            'id': post_dict.get('id'),
+            'title': post_dict.get('title'),
+            'content': post_dict.get('content'),
+            'author_id': post_dict.get('author_id'),
+            'post_type_id': post_dict.get('post_type'),  # Use raw value
+            'status': post_dict.get('status'),  # Use raw value
+            'project_id': post_dict.get('project_id'),
+            'git_url': post_dict.get('git_url'),
+            'created_ts': post_dict.get('created_at'),  # Use raw timestamp
+            'updated_ts': post_dict.get('updated_at'),  # Use raw timestamp
+            'cover_image_url': post_dict.get('cover_image_url'),
+            'feed_content': post_dict.get('feed_content'),
+            'revision': post_dict.get('revision', 0),
+            'read_time': post_dict.get('read_time', 0),
+            'branch_name': post_dict.get('branch_name'),
+            'document_type': post_dict.get('document_type'),
+            'created_by': post_dict.get('created_by', post_dict.get('author_id')),
+            'updated_by': post_dict.get('updated_by', post_dict.get('author_id'))
+        }
+    
     async def get_post_by_id(self, post_id: str) -> Optional[Dict[str, Any]]:
         """Get post by ID"""
         try:
             post_key = f"post:{post_id}"
-            post_data = await self.redis_client.get(post_key)
+            post_data = await self.redis_client.hgetall(post_key)
             
             if not post_data:
                 logger.warning(f"No data found for post {post_id}")
                 return None
 
-            # Try to parse as raw JSON first (simpler approach)
-            import json
             try:
-                post_dict = json.loads(post_data)
-                logger.info(f"✅ Successfully parsed JSON for post {post_id}")
-                
-                # Return dictionary format directly from JSON
-                return {
-                    'id': post_dict.get('id'),
-                    'title': post_dict.get('title'),
-                    'content': post_dict.get('content'),
-                    'author_id': post_dict.get('author_id'),
-                    'post_type_id': post_dict.get('post_type'),  # Use raw value
-                    'status': post_dict.get('status'),  # Use raw value
-                    'project_id': post_dict.get('project_id'),
-                    'git_url': post_dict.get('git_url'),
-                    'created_ts': post_dict.get('created_at'),  # Use raw timestamp
-                    'updated_ts': post_dict.get('updated_at'),  # Use raw timestamp
-                    'cover_image_url': post_dict.get('cover_image_url'),
-                    'feed_content': post_dict.get('feed_content'),
-                    'revision': post_dict.get('revision', 0),
-                    'read_time': post_dict.get('read_time', 0),
-                    'branch_name': post_dict.get('branch_name'),
-                    'document_type': post_dict.get('document_type'),
-                    'created_by': post_dict.get('created_by', post_dict.get('author_id')),
-                    'updated_by': post_dict.get('updated_by', post_dict.get('author_id'))
-                }
-            except Exception as json_error:
-                logger.error(f"❌ Failed to parse JSON for post {post_id}: {json_error}")
+                return self._post_dict(post_data)
+            except Exception as decode_error:
+                logger.error(f"❌ Failed to decode post {post_id}: {decode_error}")
                 return None
             
         except Exception as e:
@@ -450,51 +882,46 @@ class RedisService(DatabaseService):
             status_value = getattr(status, "value", status)
             post_type_value = getattr(post_type, "value", post_type) if post_type else None
 
-            # Start with all posts of the requested status
-            status_key = f"posts:by_status:{status_value}"
-            post_ids = await self.redis_client.smembers(status_key)
-            logger.info(f"📊 Redis get_posts: status_key={status_key}, found {len(post_ids)} post IDs")
+            if limit <= 0:
+                return []
             
-            # Apply filters
+            # Filter, sort and paginate inside Redis: intersect the posts:by_date ZSET with the
+            # filter SETs (weight 0, so the score stays the creation timestamp) and read one page
+            filter_keys = {"posts:by_date": 1, f"posts:by_status:{status_value}": 0}
             if author_id:
-                author_posts = await self.redis_client.smembers(f"posts:by_author:{author_id}")
-                post_ids = post_ids & author_posts  # Use set intersection operator
-                logger.info(f"📊 After author filter: {len(post_ids)} posts")
-            
+                filter_keys[f"posts:by_author:{author_id}"] = 0
             if tag_id:
-                tag_posts = await self.redis_client.smembers(f"tag:posts:{tag_id}")
-                post_ids = post_ids & tag_posts  # Use set intersection operator
-                logger.info(f"📊 After tag filter: {len(post_ids)} posts")
-            
+                filter_keys[f"tag:posts:{tag_id}"] = 0
             if post_type_value:
-                type_posts = await self.redis_client.smembers(f"posts:by_type:{post_type_value}")
-                post_ids = post_ids & type_posts  # Use set intersection operator
-                logger.info(f"📊 After type filter: {len(post_ids)} posts")
+                filter_keys[f"posts:by_type:{post_type_value}"] = 0
             
-            # Convert to list and get post data
-            post_list = []
-            for post_id in post_ids:
-                if post_id != "initialized":
-                    try:
-                        post_dict = await self.get_post_by_id(post_id)
-                        if post_dict:
-                            # Keep tags empty for now; name lookup can be added later
-                            post_dict['tags'] = post_dict.get('tags', '') or ''
-                            post_list.append(post_dict)
-                            logger.info(f"📊 Added post {post_id} to result")
-                        else:
-                            logger.warning(f"📊 get_post_by_id returned None for {post_id}")
-                    except Exception as e:
-                        logger.error(f"📊 Error processing post {post_id}: {e}")
-                        continue
+            post_ids = await self._page_post_ids(filter_keys, skip, limit)
             
-            logger.info(f"📊 Final result: {len(post_list)} posts returned")
-            
-            # Sort by created_ts descending (newest first)
-            post_list.sort(key=lambda p: p.get('created_ts', ''), reverse=True)
+            # Fetch the page's post HASHes in one pipelined round trip (ZREVRANGE order is kept);
+            # a bad key (e.g. WRONGTYPE) only costs its own post, not the whole page
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for pid in post_ids:
+                    pipe.hgetall(f"post:{pid}")
+                post_data = await pipe.execute(raise_on_error=False)
             
-            # Apply pagination
-            return post_list[skip:skip + limit]
+            post_list = []
+            for post_id, data in zip(post_ids, post_data):
+                if isinstance(data, Exception):
+                    logger.error(f"📊 Failed to read post {post_id}: {data}")
+                    continue
+                if not data:
+                    logger.warning(f"📊 No data found for post {post_id}")
+                    continue
+                try:
+                    post_dict = self._post_dict(data)
+                except Exception as e:
+                    logger.error(f"📊 Error processing post {post_id}: {e}")
+                    continue
+                # Keep tags empty for now; name lookup can be added later
+                post_dict['tags'] = ''
+                post_list.append(post_dict)
+            
+            return post_list
             
         except Exception as e:
             logger.error(f"❌ get_posts failed: {e}")
@@ -502,32 +929,47 @@ class RedisService(DatabaseService):
             logger.error(f"❌ Traceback: {traceback.format_exc()}")
             return []
     
+    async def _page_post_ids(self, filter_keys: Dict[str, int], skip: int, limit: int) -> List[str]:
+        """Return one newest-first page of post ids from a weighted ZINTERSTORE of filter_keys"""
+        # Scratch key is private to this call and dropped in the same MULTI/EXEC
+        tmp_key = f"tmp:posts:{uuid4()}"
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zinterstore(tmp_key, filter_keys)
+            pipe.zrevrange(tmp_key, skip, skip + limit - 1)
+            pipe.delete(tmp_key)
+            total, post_ids, _ = await pipe.execute()
+        logger.debug(f"📊 Redis post query: {total} matching posts, page has {len(post_ids)}")
+        return post_ids
+    
     async def update_post(self, post_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a post"""
         try:
-            # Get the current post as Post object for updating
             post_key = f"post:{post_id}"
-            post_data = await self.redis_client.get(post_key)
-            post_obj = self._deserialize_model(post_data, Post)
             
-            if not post_obj:
+            # Write only the changed fields (no read-modify-write of the whole body)
+            json_fields = _hash_json_fields(Post)
+            changed = {key: value for key, value in updates.items() if key in Post.model_fields and key != 'id'}
+            changed['updated_at'] = datetime.now(timezone.utc)
+            mapping = {
+                key: self._hash_value(key, value, json_fields)
+                for key, value in changed.items() if value is not None
+            }
+            cleared = [key for key, value in changed.items() if value is None]
+            
+            # Write, move the post between the status/type filter SETs get_posts intersects, and
+            # read back in one script: the old values are read atomically with the write, so
+            # concurrent updates cannot leave the SETs disagreeing with the stored fields
+            args = [post_id, len(mapping)]
+            for key, value in mapping.items():
+                args.extend((key, value))
+            args.extend(cleared)
+            flat_hash = await self._update_post_script(keys=[post_key], args=args)
+            if flat_hash is None:
                 return None
-            
-            # Apply updates
-            for key, value in updates.items():
-                if hasattr(post_obj, key):
-                    setattr(post_obj, key, value)
-            
-            # Update timestamp
-            post_obj.updated_at = datetime.now(timezone.utc)
-            
-            # Save updated post
-            await self.redis_client.set(post_key, self._serialize_model(post_obj))
+            post_hash = dict(zip(flat_hash[::2], flat_hash[1::2]))
             
             logger.info(f"Updated post: {post_id}")
-            
-            # Return updated post as dictionary (like get_post_by_id)
-            return await self.get_post_by_id(post_id)
+            return self._post_dict(post_hash)
             
         except Exception as e:
             logger.error(f"Failed to update post {post_id}: {e}")
@@ -536,34 +978,10 @@ class RedisService(DatabaseService):
     async def delete_post(self, post_id: str) -> bool:
         """Delete a post"""
         try:
-            post_dict = await self.get_post_by_id(post_id)
-            if not post_dict:
+            # One server-side script removes the post, its indexes, tag links and comments
+            if not await self._delete_post_script(keys=[f"post:{post_id}"], args=[post_id]):
                 return False
             
-            # Remove from all indexes
-            await self.redis_client.srem("indexes:posts", post_id)
-            await self.redis_client.zrem("posts:by_date", post_id)
-            await self.redis_client.srem(f"posts:by_author:{post_dict['author_id']}", post_id)
-            await self.redis_client.srem(f"posts:by_status:{post_dict['status']}", post_id)
-            await self.redis_client.srem(f"posts:by_type:{post_dict['post_type_id']}", post_id)
-            
-            # Remove tag associations
-            tag_ids = await self.redis_client.smembers(f"post:tags:{post_id}")
-            for tag_id in tag_ids:
-                await self.redis_client.srem(f"posts:by_tag:{tag_id}", post_id)
-            await self.redis_client.delete(f"post:tags:{post_id}")
-            
-            # Delete the post data
-            await self.redis_client.delete(f"post:{post_id}")
-            
-            # Delete associated comments
-            comment_ids = await self.redis_client.smembers(f"comments:by_post:{post_id}")
-            for comment_id in comment_ids:
-                await self.delete_comment(comment_id)
-            
-            # Update counter
-            await self.redis_client.decr("counters:posts")
-            
             logger.info(f"Deleted post: {post_id}")
             return True
             
@@ -587,17 +1005,14 @@ class RedisService(DatabaseService):
             comment.created_at = comment.created_at or now
             comment.updated_at = now
             
-            # Store comment data
-            comment_key = f"comment:{comment.id}"
-            await self.redis_client.set(comment_key, self._serialize_model(comment))
-            
-            # Add to indexes
-            await self.redis_client.sadd("indexes:comments", comment.id)
-            await self.redis_client.sadd(f"comments:by_post:{comment.post_id}", comment.id)
-            await self.redis_client.sadd(f"comments:by_author:{comment.author_id}", comment.id)
-            
-            # Update counter
-            await self.redis_client.incr("counters:comments")
+            # Store comment data and indexes atomically in one MULTI/EXEC round trip
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.set(f"comment:{comment.id}", self._serialize_model(comment))
+                pipe.sadd("indexes:comments", comment.id)
+                pipe.sadd(f"comments:by_post:{comment.post_id}", comment.id)
+                pipe.zadd(f"comments:by_post_date:{comment.post_id}", {comment.id: comment.created_at.timestamp()})
+                pipe.sadd(f"comments:by_author:{comment.author_id}", comment.id)
+                await pipe.execute()
             
             logger.info(f"Created comment: {comment.id}")
             return comment
@@ -619,44 +1034,56 @@ class RedisService(DatabaseService):
     async def get_comments_by_post(self, post_id: str) -> List[Comment]:
         """Get comments for a post"""
         try:
-            comment_ids = await self.redis_client.smembers(f"comments:by_post:{post_id}")
-            
-            comments = []
-            for comment_id in comment_ids:
-                comment = await self.get_comment_by_id(comment_id)
-                if comment:
-                    comments.append(comment)
-            
-            # Sort by created_at ascending (oldest first)
-            comments.sort(key=lambda c: c.created_at)
-            return comments
+            # The post's comment timeline ZSET is already oldest first
+            comment_ids = await self.redis_client.zrange(f"comments:by_post_date:{post_id}", 0, -1)
+            if not comment_ids:
+                return []
+            
+            # One MGET round trip for all of the post's comments
+            comment_data = await self.redis_client.mget([f"comment:{cid}" for cid in comment_ids])
+            return [
+                comment for comment in (self._deserialize_model(data, Comment) for data in comment_data if data)
+                if comment
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get comments for post {post_id}: {e}")
             return []
     
+    async def _get_comment_payloads(self, post_id: str) -> List[Dict[str, Any]]:
+        """A post's stored comment payloads, oldest first, without building models (read-only dicts)"""
+        comment_ids = await self.redis_client.zrange(f"comments:by_post_date:{post_id}", 0, -1)
+        if not comment_ids:
+            return []
+        comment_data = await self.redis_client.mget([f"comment:{cid}" for cid in comment_ids])
+        return [_loads_cached(data) for data in comment_data if data]
+    
     async def get_recent_comments(self, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent comments across all posts"""
         try:
-            # Get all comment IDs
-            comment_ids = await self.redis_client.smembers("indexes:comments")
-            
-            # Get comments with timestamp for sorting
-            comments_with_ts = []
-            for comment_id in comment_ids:
-                comment = await self.get_comment_by_id(comment_id)
-                if comment:
-                    comments_with_ts.append((comment, comment.created_at))
-            
-            # Sort by created_at descending (most recent first)
-            comments_with_ts.sort(key=lambda x: x[1], reverse=True)
+            # Get all comments in one MGET
+            comment_ids = list(await self.redis_client.smembers("indexes:comments"))
+            comment_data = await self.redis_client.mget([f"comment:{cid}" for cid in comment_ids]) if comment_ids else []
+            comments = [c for c in (self._deserialize_model(data, Comment) for data in comment_data if data) if c]
+            
+            # Sort by created_at descending (most recent first) and paginate
+            comments.sort(key=lambda c: c.created_at, reverse=True)
+            page = comments[skip:skip + limit]
+            
+            # Authors and post titles for the page, one pipelined round trip each
+            author_ids = list(dict.fromkeys(c.author_id for c in page))
+            users = dict(zip(author_ids, await self._get_user_dicts(author_ids)))
+            post_ids = list(dict.fromkeys(c.post_id for c in page))
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for pid in post_ids:
+                    pipe.hget(f"post:{pid}", "title")
+                titles = dict(zip(post_ids, await pipe.execute()))
             
-            # Apply pagination and convert to dict format
+            # Convert to dict format
             result = []
-            for comment, _ in comments_with_ts[skip:skip + limit]:
-                # Get user and post info
-                user = await self.get_user_by_id(comment.author_id)
-                post = await self.get_post_by_id(comment.post_id)
+            for comment in page:
+                user = users.get(comment.author_id)
+                post_title = titles.get(comment.post_id)
                 
                 comment_dict = {
                     'id': comment.id,
@@ -667,9 +1094,9 @@ class RedisService(DatabaseService):
                     'is_edited': False,  # Mock value
                     'created_ts': comment.created_at,
                     'updated_ts': comment.updated_at,
-                    'display_name': user.display_name if user else 'Unknown',
-                    'username': user.username if user else 'unknown',
-                    'post_title': post.title if post else 'Unknown Post'
+                    'display_name': user['display_name'] if user else 'Unknown',
+                    'username': user['username'] if user else 'unknown',
+                    'post_title': post_title or 'Unknown Post'
                 }
                 result.append(comment_dict)
             
@@ -686,16 +1113,14 @@ class RedisService(DatabaseService):
             if not comment:
                 return False
             
-            # Remove from indexes
-            await self.redis_client.srem("indexes:comments", comment_id)
-            await self.redis_client.srem(f"comments:by_post:{comment.post_id}", comment_id)
-            await self.redis_client.srem(f"comments:by_author:{comment.author_id}", comment_id)
-            
-            # Delete the comment data
-            await self.redis_client.delete(f"comment:{comment_id}")
-            
-            # Update counter
-            await self.redis_client.decr("counters:comments")
+            # Remove indexes and data atomically in one MULTI/EXEC round trip
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.srem("indexes:comments", comment_id)
+                pipe.srem(f"comments:by_post:{comment.post_id}", comment_id)
+                pipe.zrem(f"comments:by_post_date:{comment.post_id}", comment_id)
+                pipe.srem(f"comments:by_author:{comment.author_id}", comment_id)
+                pipe.delete(f"comment:{comment_id}")
+                await pipe.execute()
             
             logger.info(f"Deleted comment: {comment_id}")
             return True
@@ -708,29 +1133,55 @@ class RedisService(DatabaseService):
     # SEARCH OPERATIONS
     # ============================================
     
-    async def search_posts(self, query: str, limit: int = 10) -> List[Post]:
-        """Search posts by content (simple implementation)"""
+    async def search_posts(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Search published posts by title and content
+        
+        Uses the idx:posts RediSearch index (BM25, title weighted x2) when the
+        module is available, otherwise scans the published posts.
+        """
         try:
-            # Get all published posts
-            posts = await self.get_posts(limit=1000, status=PostStatus.PUBLISHED)
-            
-            # Simple text search in title and content
+            if self._search_available:
+                # Escape query syntax characters so user input is matched as plain terms
+                terms = " ".join(
+                    "".join(ch if ch.isalnum() or ch == "_" else f"\\{ch}" for ch in word)
+                    for word in query.split()
+                )
+                if not terms:
+                    return []
+                result = await self.redis_client.execute_command(
+                    "FT.SEARCH", "idx:posts", f"@status:{{{PostStatus.PUBLISHED.value}}} ({terms})",
+                    "LIMIT", 0, limit
+                )
+                # Reply: [total, key, [field, value, ...], key, [...], ...]
+                return [
+                    self._post_dict(dict(zip(fields[::2], fields[1::2])))
+                    for fields in result[2::2]
+                ]
+            
+            # Fallback: simple text search in title and content. Only those two fields of the
+            # newest 1000 published posts are fetched; full hashes are read for the matches alone
+            post_ids = await self._page_post_ids(
+                {"posts:by_date": 1, f"posts:by_status:{PostStatus.PUBLISHED.value}": 0}, 0, 1000
+            )
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for pid in post_ids:
+                    pipe.hmget(f"post:{pid}", "title", "content")
+                texts = await pipe.execute()
             query_lower = query.lower()
-            matching_posts = []
-            
-            for post in posts:
-                if (query_lower in post.title.lower() or 
-                    query_lower in post.content.lower()):
-                    matching_posts.append(post)
             
-            # Sort by relevance (simple: count of query occurrences)
-            def relevance_score(post):
-                title_matches = post.title.lower().count(query_lower)
-                content_matches = post.content.lower().count(query_lower)
+            def relevance_score(title, content):
+                title_matches = (title or '').lower().count(query_lower)
+                content_matches = (content or '').lower().count(query_lower)
                 return title_matches * 2 + content_matches  # Title matches weighted higher
             
-            matching_posts.sort(key=relevance_score, reverse=True)
-            return matching_posts[:limit]
+            scored = [(relevance_score(title, content), pid) for pid, (title, content) in zip(post_ids, texts)]
+            top_ids = [pid for score, pid in sorted(scored, key=lambda x: x[0], reverse=True) if score][:limit]
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for pid in top_ids:
+                    pipe.hgetall(f"post:{pid}")
+                post_data = await pipe.execute()
+            matching_posts = [self._post_dict(data) for data in post_data if data]
+            return matching_posts
             
         except Exception as e:
             logger.error(f"Failed to search posts: {e}")
@@ -743,12 +1194,14 @@ class RedisService(DatabaseService):
     async def get_stats(self) -> Dict[str, int]:
         """Get application statistics"""
         try:
-            stats = {}
-            stats['users'] = int(await self.redis_client.get("counters:users") or 0)
-            stats['posts'] = int(await self.redis_client.get("counters:posts") or 0)
-            stats['tags'] = int(await self.redis_client.get("counters:tags") or 0)
-            stats['comments'] = int(await self.redis_client.get("counters:comments") or 0)
-            return stats
+            # Counts come straight from the index sets, so they cannot drift from the data;
+            # all four commands share one round trip
+            names = ("users", "posts", "tags", "comments")
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for name in names:
+                    pipe.scard(f"indexes:{name}")
+                results = await pipe.execute()
+            return {name: int(count) for name, count in zip(names, results)}
         except Exception as e:
             logger.error(f"Failed to get stats: {e}")
             return {}
@@ -773,18 +1226,26 @@ class RedisService(DatabaseService):
                 'created_ts': datetime.now(timezone.utc).isoformat()
             }
             
-            # Store the reaction
-            reaction_key = f"reaction:{reaction_id}"
-            await self.redis_client.set(reaction_key, json.dumps(reaction))
-            
-            # Add to indexes
-            await self.redis_client.sadd(f"reactions:target:{target_id}:{target_type}", reaction_id)
-            await self.redis_client.sadd(f"reactions:user:{user_id}", reaction_id)
-            await self.redis_client.sadd(f"reactions:type:{reaction_type}", reaction_id)
-            
-            # Create unique constraint key (one reaction per user/target/type combination)
+            # Check the unique constraint (one reaction per user/target/type combination) and store
+            # the reaction with its indexes in one atomic script call
             constraint_key = f"reaction:constraint:{target_id}:{user_id}:{reaction_type}:{target_type}"
-            await self.redis_client.set(constraint_key, reaction_id)
+            keys = [
+                constraint_key,
+                f"reaction:{reaction_id}",
+                f"reactions:target:{target_id}:{target_type}",
+                f"reactions:user:{user_id}",
+                f"reactions:type:{reaction_type}",
+            ]
+            if reaction_type == 'event-favorite':
+                keys.append(_favorites_key(user_id, target_type))
+            stored_id = await self._add_reaction_script(
+                keys=keys, args=[reaction_id, _json_dumps(reaction), target_id]
+            )
+            if stored_id != reaction_id:
+                # Already reacted: return the existing reaction, like the SQL backends' upsert
+                existing = await self.redis_client.get(f"reaction:{stored_id}")
+                if existing:
+                    return orjson.loads(existing)
             
             logger.info(f"Added reaction: {reaction_type} to {target_type} {target_id} by user {user_id}")
             return reaction
@@ -803,17 +1264,15 @@ class RedisService(DatabaseService):
             if not reaction_id:
                 return False
             
-            # Remove the reaction
-            reaction_key = f"reaction:{reaction_id}"
-            await self.redis_client.delete(reaction_key)
-            
-            # Remove from indexes
-            await self.redis_client.srem(f"reactions:target:{target_id}:{target_type}", reaction_id)
-            await self.redis_client.srem(f"reactions:user:{user_id}", reaction_id)
-            await self.redis_client.srem(f"reactions:type:{reaction_type}", reaction_id)
-            
-            # Remove constraint
-            await self.redis_client.delete(constraint_key)
+            # Remove the reaction, its indexes and the constraint key atomically
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.delete(f"reaction:{reaction_id}", constraint_key)
+                pipe.srem(f"reactions:target:{target_id}:{target_type}", reaction_id)
+                pipe.srem(f"reactions:user:{user_id}", reaction_id)
+                pipe.srem(f"reactions:type:{reaction_type}", reaction_id)
+                if reaction_type == 'event-favorite':
+                    pipe.srem(_favorites_key(user_id, target_type), target_id)
+                await pipe.execute()
             
             logger.info(f"Removed reaction: {reaction_type} from {target_type} {target_id} by user {user_id}")
             return True
@@ -825,25 +1284,26 @@ class RedisService(DatabaseService):
     async def get_reactions(self, target_id: str, target_type: str = 'post') -> List[Dict[str, Any]]:
         """Get reactions for a target (post, discussion, tag)"""
         try:
-            reaction_ids = await self.redis_client.smembers(f"reactions:target:{target_id}:{target_type}")
-            reactions = []
+            reaction_ids = list(await self.redis_client.smembers(f"reactions:target:{target_id}:{target_type}"))
+            if not reaction_ids:
+                return []
+            
+            # One MGET for the reaction bodies, one pipeline for their (deduplicated) users
+            reaction_data = await self.redis_client.mget([f"reaction:{rid}" for rid in reaction_ids])
+            reactions = [orjson.loads(data) for data in reaction_data if data]
+            user_ids = list(dict.fromkeys(reaction['user_id'] for reaction in reactions))
+            users = {
+                uid: user for uid, user in zip(user_ids, await self._get_user_dicts(user_ids)) if user
+            }
             
-            for reaction_id in reaction_ids:
-                reaction_key = f"reaction:{reaction_id}"
-                reaction_data = await self.redis_client.get(reaction_key)
-                
-                if reaction_data:
-                    reaction = json.loads(reaction_data)
-                    
-                    # Add user info
-                    user = await self.get_user_by_id(reaction['user_id'])
-                    if user:
-                        reaction.update({
-                            'username': user['username'],
-                            'display_name': user['display_name']
-                        })
-                    
-                    reactions.append(reaction)
+            # Add user info
+            for reaction in reactions:
+                user = users.get(reaction['user_id'])
+                if user:
+                    reaction.update({
+                        'username': user['username'],
+                        'display_name': user['display_name']
+                    })
             
             return reactions
             
@@ -867,6 +1327,8 @@ class RedisService(DatabaseService):
         """Log a user event"""
         try:
             event_id = event_data.get('id', str(uuid4()))
+            # One clock read: the float is the timeline score, created_ts is formatted from it
+            timestamp = time.time()
             
             event = {
                 'id': event_id,
@@ -875,20 +1337,16 @@ class RedisService(DatabaseService):
                 'target_type': event_data.get('target_type'),
                 'target_id': event_data.get('target_id'),
                 'metadata': event_data.get('metadata', {}),
-                'created_ts': datetime.now(timezone.utc).isoformat()
+                'created_ts': datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
             }
             
-            # Store the event
-            event_key = f"event:{event_id}"
-            await self.redis_client.set(event_key, json.dumps(event))
-            
-            # Add to indexes
-            await self.redis_client.sadd(f"events:user:{event_data['user_id']}", event_id)
-            await self.redis_client.sadd(f"events:type:{event_data['event_type_id']}", event_id)
-            
-            # Add to timeline (sorted by timestamp)
-            timestamp = datetime.now(timezone.utc).timestamp()
-            await self.redis_client.zadd(f"events:timeline:{event_data['user_id']}", {event_id: timestamp})
+            # Written by the background event writer, so the request does not wait on Redis
+            # (the timeline score goes along so the writer need not re-parse created_ts).
+            # A full queue means writes are failing, so the caller gets the error.
+            try:
+                self._event_queue.put_nowait((event, timestamp))
+            except asyncio.QueueFull:
+                raise RuntimeError(f"User event queue is full ({_EVENT_QUEUE_SIZE} events not yet written to Redis)")
             
             logger.info(f"Logged user event: {event_data['event_type_id']} for user {event_data['user_id']}")
             return event_id
@@ -897,6 +1355,53 @@ class RedisService(DatabaseService):
             logger.error(f"Failed to log user event: {e}")
             raise
     
+    async def _write_events(self) -> None:
+        """Background task: write queued user events in pipelined batches
+        
+        Waits for the first event, then takes whatever else is already queued
+        (up to _EVENT_BATCH_SIZE) so bursts share one round trip. A failed batch
+        is retried with exponential backoff; after _EVENT_WRITE_ATTEMPTS it is
+        dropped and counted in _dropped_events. The writes are idempotent, so a
+        retry after a partly applied pipeline is safe.
+        """
+        while True:
+            batch = [await self._event_queue.get()]
+            while len(batch) < _EVENT_BATCH_SIZE and not self._event_queue.empty():
+                batch.append(self._event_queue.get_nowait())
+            try:
+                for attempt in range(1, _EVENT_WRITE_ATTEMPTS + 1):
+                    try:
+                        await self._write_event_batch(batch)
+                        break
+                    except Exception as e:
+                        if attempt == _EVENT_WRITE_ATTEMPTS:
+                            self._dropped_events += len(batch)
+                            logger.error(f"Dropped {len(batch)} user events after {attempt} failed writes "
+                                         f"({self._dropped_events} dropped in total): {e}")
+                        else:
+                            delay = _EVENT_RETRY_DELAY * 2 ** (attempt - 1)
+                            logger.warning(f"Failed to write {len(batch)} user events (attempt {attempt}), "
+                                           f"retrying in {delay:.1f}s: {e}")
+                            await asyncio.sleep(delay)
+            finally:
+                for _ in batch:
+                    self._event_queue.task_done()
+    
+    async def _write_event_batch(self, batch: List[Tuple[Dict[str, Any], float]]) -> None:
+        """Write one batch of queued (event, timestamp) pairs in a single pipelined round trip"""
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for event, timestamp in batch:
+                event_id, user_id = event['id'], event['user_id']
+                # One HASH field per column; only the metadata dict needs JSON encoding
+                pipe.hset(f"event:{event_id}", mapping={
+                    field: _json_dumps(value) if field == 'metadata' else str(value)
+                    for field, value in event.items() if value is not None
+                })
+                pipe.sadd(f"events:type:{event['event_type_id']}", event_id)
+                # The per-user timeline, sorted by timestamp, is also the user's event index
+                pipe.zadd(f"events:timeline:{user_id}", {event_id: timestamp})
+            await pipe.execute()
+    
     # ============================================
     # DATABASE QUERY OPERATIONS
     # ============================================
@@ -907,7 +1412,6 @@ class RedisService(DatabaseService):
             # Emulate favorites filtering queries from posts router
             if ("FROM posts p" in query and "event-favorite" in query and
                 ("INNER JOIN reactions r ON p.id = r.target_id" in query or "SELECT DISTINCT pt2.post_id" in query)):
-                import json
                 # Extract params: [status, is_latest, (maybe user_id), (optional filters...), limit, skip]
                 params_list = list(params) if params else []
                 if len(params_list) < 2:
@@ -937,109 +1441,73 @@ class RedisService(DatabaseService):
                             elif not author_id:
                                 author_id = val
 
-                # Start with posts by status
-                post_ids = await self.redis_client.smembers(f"posts:by_status:{status_value}")
-                if not isinstance(post_ids, set):
-                    post_ids = set(post_ids or [])
-
-                # Compute favorite post IDs
-                if (use_fav_posts or use_fav_tags) and user_id:
-                    reaction_ids = await self.redis_client.smembers(f"reactions:user:{user_id}")
-                else:
-                    reaction_ids = set()
-
-                if use_fav_posts and user_id:
-                    fav_post_ids = set()
-                    for rid in reaction_ids:
-                        data = await self.redis_client.get(f"reaction:{rid}")
-                        if not data:
-                            continue
-                        try:
-                            reaction = json.loads(data)
-                        except Exception:
-                            continue
-                        if (reaction.get('reaction_type') == 'event-favorite' and 
-                            reaction.get('target_type') in ('post', 'thoughts')):
-                            fav_post_ids.add(reaction.get('target_id'))
-                    post_ids = post_ids & fav_post_ids
-
+                # Favorite tags are needed client-side to name their tag:posts sets; favorite
+                # posts are unioned straight from their index sets inside the MULTI below
+                fav_tag_ids = []
                 if use_fav_tags and user_id:
-                    fav_tag_ids = set()
-                    for rid in reaction_ids:
-                        data = await self.redis_client.get(f"reaction:{rid}")
-                        if not data:
-                            continue
-                        try:
-                            reaction = json.loads(data)
-                        except Exception:
-                            continue
-                        if (reaction.get('reaction_type') == 'event-favorite' and 
-                            reaction.get('target_type') == 'tag'):
-                            fav_tag_ids.add(reaction.get('target_id'))
-                    tag_post_ids = set()
-                    for tid in fav_tag_ids:
-                        posts_for_tag = await self.redis_client.smembers(f"tag:posts:{tid}")
-                        if posts_for_tag:
-                            if not isinstance(posts_for_tag, set):
-                                posts_for_tag = set(posts_for_tag)
-                            tag_post_ids |= posts_for_tag
-                    post_ids = post_ids & tag_post_ids
-
-                # Apply additional filters
+                    fav_tag_ids = list(await self.redis_client.smembers(_favorites_key(user_id, 'tag')))
+                
+                if limit <= 0 or (use_fav_tags and user_id and not fav_tag_ids):
+                    return []
+                
+                # Intersect, sort and paginate inside Redis: the posts:by_date ZSET against the
+                # filter SETs (weight 0) plus scratch sets for the favorites, all in one MULTI/EXEC
+                scratch = f"tmp:posts:{uuid4()}"
+                filter_keys = {"posts:by_date": 1, f"posts:by_status:{status_value}": 0}
                 if author_id:
-                    author_posts = await self.redis_client.smembers(f"posts:by_author:{author_id}")
-                    post_ids = post_ids & author_posts
+                    filter_keys[f"posts:by_author:{author_id}"] = 0
                 if tag_id:
-                    tag_posts = await self.redis_client.smembers(f"tag:posts:{tag_id}")
-                    post_ids = post_ids & tag_posts
+                    filter_keys[f"tag:posts:{tag_id}"] = 0
                 if post_type_value:
-                    type_posts = await self.redis_client.smembers(f"posts:by_type:{post_type_value}")
-                    post_ids = post_ids & type_posts
-
-                # Build post dicts
+                    filter_keys[f"posts:by_type:{post_type_value}"] = 0
+                
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    if use_fav_posts and user_id:
+                        pipe.sunionstore(f"{scratch}:fav_posts", [
+                            _favorites_key(user_id, 'post'), _favorites_key(user_id, 'thoughts')
+                        ])
+                        filter_keys[f"{scratch}:fav_posts"] = 0
+                    if use_fav_tags and user_id:
+                        pipe.sunionstore(f"{scratch}:fav_tags", [f"tag:posts:{tid}" for tid in fav_tag_ids])
+                        filter_keys[f"{scratch}:fav_tags"] = 0
+                    pipe.zinterstore(scratch, filter_keys)
+                    pipe.zrevrange(scratch, skip, skip + limit - 1)
+                    pipe.delete(scratch, f"{scratch}:fav_posts", f"{scratch}:fav_tags")
+                    results = await pipe.execute()
+                page_ids = results[-2]
+                if not page_ids:
+                    return []
+                
+                # Page bodies and tag links in one pipelined round trip
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for pid in page_ids:
+                        pipe.hgetall(f"post:{pid}")
+                        pipe.smembers(f"post:tags:{pid}")
+                    page_data = await pipe.execute()
+                post_hashes, post_tag_ids = page_data[0::2], page_data[1::2]
+                
+                # Tag names for the whole page with one MGET (CSV to match the sqlite 'tags' column)
+                all_tag_ids = list({tid for tag_ids in post_tag_ids for tid in tag_ids})
+                tag_data = await self._get_tag_payloads(all_tag_ids)
+                tag_names = {tid: self._tag_dict(data)['name'] for tid, data in zip(all_tag_ids, tag_data) if data}
+                
                 posts: List[Dict[str, Any]] = []
-                for pid in post_ids:
-                    if pid == "initialized":
+                for post_hash, tag_ids in zip(post_hashes, post_tag_ids):
+                    if not post_hash:
                         continue
-                    post = await self.get_post_by_id(pid)
-                    if post:
-                        # Add tag names CSV to match sqlite 'tags' column
-                        try:
-                            tag_ids = await self.redis_client.smembers(f"post:tags:{pid}")
-                            tag_names = []
-                            for tid in tag_ids or []:
-                                tag = await self.get_tag_by_id(tid)
-                                if tag:
-                                    tag_names.append(tag.name)
-                            post['tags'] = ", ".join(sorted(tag_names)) if tag_names else ''
-                        except Exception:
-                            post['tags'] = ''
-                        posts.append(post)
-
-                # Sort and paginate
-                posts.sort(key=lambda p: p.get('created_ts', ''), reverse=True)
-                return posts[skip:skip+limit]
+                    post = self._post_dict(post_hash)
+                    names = sorted(tag_names[tid] for tid in tag_ids if tid in tag_names)
+                    post['tags'] = ", ".join(names)
+                    posts.append(post)
+                return posts
 
             # Existing special case: favorite tags list
             if "SELECT DISTINCT r.target_id FROM reactions r" in query and "event-favorite" in query:
                 # This is the favorite tags query
                 user_id = params[0] if params else None
                 if user_id:
-                    # Get all reactions of type 'event-favorite' for this user
-                    reaction_ids = await self.redis_client.smembers(f"reactions:user:{user_id}")
-                    favorite_tags = []
-                    
-                    for reaction_id in reaction_ids:
-                        reaction_key = f"reaction:{reaction_id}"
-                        reaction_data = await self.redis_client.get(reaction_key)
-                        
-                        if reaction_data:
-                            reaction = json.loads(reaction_data)
-                            if (reaction.get('reaction_type') == 'event-favorite' and 
-                                reaction.get('target_type') == 'tag'):
-                                favorite_tags.append({'target_id': reaction['target_id']})
-                    
-                    return favorite_tags
+                    target_ids = await self.redis_client.smembers(_favorites_key(user_id, 'tag'))
+                    return [{'target_id': target_id} for target_id in target_ids]
             
             # For other queries, log warning and return empty result
             logger.warning(f"Redis execute_query not implemented for: {query[:100]}...")
@@ -1064,27 +1532,51 @@ class RedisService(DatabaseService):
     # TAG ASSOCIATION OPERATIONS
     # ============================================
 
+    async def _resolve_tag_ids(self, tag_names: List[str], make_tag) -> List[str]:
+        """Look up tag ids by name (cached, then one MGET), creating the missing tags via make_tag(name) in one batch"""
+        names = list(dict.fromkeys(tag_names))
+        if not names:
+            return []
+        existing = [self._tag_name_cache.get(name) for name in names]
+        unknown = [i for i, tag_id in enumerate(existing) if tag_id is None]
+        if unknown:
+            looked_up = await self.redis_client.mget([f"tag:name:{names[i]}" for i in unknown])
+            for i, tag_id in zip(unknown, looked_up):
+                if tag_id:
+                    existing[i] = tag_id
+                    self._tag_name_cache.put(names[i], tag_id)
+        
+        # Create all the missing tags in one MULTI/EXEC
+        missing = [make_tag(name) for name, tag_id in zip(names, existing) if not tag_id]
+        if missing:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                for tag in missing:
+                    self._queue_create_tag(pipe, tag)
+                await pipe.execute()
+            logger.info(f"Created {len(missing)} tags: {[tag.name for tag in missing]}")
+        
+        created = {tag.name: tag.id for tag in missing}
+        return [tag_id or created[name] for name, tag_id in zip(names, existing)]
+    
     async def associate_tags_with_post(self, author_id: str, post_id: str, tag_names: List[str]) -> bool:
         """Associate tags with a post"""
         try:
-            for tag_name in tag_names:
-                # Find or create tag
-                tag = await self.get_tag_by_name(tag_name)
-                if not tag:
-                    # Create new tag
-                    tag = Tag(
-                        id=f"tag-{uuid4()}",
-                        name=tag_name,
-                        description="",
-                        color="#666666",
-                        posts_count=0,
-                        created_by=author_id
-                    )
-                    await self.create_tag(tag)
-                
-                # Associate with post
-                await self.redis_client.sadd(f"post:tags:{post_id}", tag.id)
-                await self.redis_client.sadd(f"tag:posts:{tag.id}", post_id)
+            tag_ids = await self._resolve_tag_ids(tag_names, lambda name: Tag(
+                id=f"tag-{uuid4()}",
+                name=name,
+                description="",
+                color="#666666",
+                posts_count=0,
+                created_by=author_id
+            ))
+            
+            # Associate with post: one variadic SADD for the post's tag set, one SADD per tag's post set
+            if tag_ids:
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.sadd(f"post:tags:{post_id}", *tag_ids)
+                    for tag_id in tag_ids:
+                        pipe.sadd(f"tag:posts:{tag_id}", post_id)
+                    await pipe.execute()
             
             logger.info(f"Associated {len(tag_names)} tags with post {post_id}")
             return True
@@ -1096,17 +1588,21 @@ class RedisService(DatabaseService):
     async def get_post_tags(self, post_id: str) -> List[Dict[str, Any]]:
         """Get tags for a specific post"""
         try:
-            tag_ids = await self.redis_client.smembers(f"post:tags:{post_id}")
-            tags = []
+            tag_ids = list(await self.redis_client.smembers(f"post:tags:{post_id}"))
+            if not tag_ids:
+                return []
             
-            for tag_id in tag_ids:
-                tag = await self.get_tag_by_id(tag_id)
-                if tag:
+            # Cached bodies plus at most one MGET for all of the post's tags
+            tag_data = await self._get_tag_payloads(tag_ids)
+            tags = []
+            for data in tag_data:
+                if data:
+                    tag = self._tag_dict(data)
                     tags.append({
-                        'id': tag.id,
-                        'name': tag.name,
-                        'description': tag.description,
-                        'color': tag.color,
+                        'id': tag['id'],
+                        'name': tag['name'],
+                        'description': tag['description'],
+                        'color': tag['color'],
                         'is_active': True
                     })
             
@@ -1119,29 +1615,24 @@ class RedisService(DatabaseService):
     async def update_post_tags(self, author_id: str, post_id: str, tag_names: List[str]) -> bool:
         """Update tags for a post by removing existing associations and creating new ones"""
         try:
-            # Remove existing tag associations for this post
-            await self.redis_client.delete(f"post:tags:{post_id}")
-            
-            # Add new tag associations
-            for tag_name in tag_names:
-                # Find existing tag by name or create new one
-                tag = await self.get_tag_by_name(tag_name)
-                if not tag:
-                    # Create new tag
-                    import uuid
-                    from src.models.tag import Tag
-                    tag_id = str(uuid.uuid4())
-                    tag = Tag(
-                        id=tag_id,
-                        name=tag_name,
-                        description=f"Auto-created tag: {tag_name}",
-                        color="#24A890"
-                    )
-                    await self.create_tag(tag)
-                
-                # Associate tag with post
-                await self.redis_client.sadd(f"post:tags:{post_id}", tag.id)
-                await self.redis_client.sadd(f"tag:posts:{tag.id}", post_id)
+            old_tag_ids = await self.redis_client.smembers(f"post:tags:{post_id}")
+            tag_ids = await self._resolve_tag_ids(tag_names, lambda name: Tag(
+                id=str(uuid4()),
+                name=name,
+                description=f"Auto-created tag: {name}",
+                color="#24A890"
+            ))
+            
+            # Replace the associations atomically: drop the old links, add the new ones variadically
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.delete(f"post:tags:{post_id}")
+                for tag_id in old_tag_ids:
+                    pipe.srem(f"tag:posts:{tag_id}", post_id)
+                if tag_ids:
+                    pipe.sadd(f"post:tags:{post_id}", *tag_ids)
+                    for tag_id in tag_ids:
+                        pipe.sadd(f"tag:posts:{tag_id}", post_id)
+                await pipe.execute()
             
             logger.info(f"Updated tags for post {post_id}: {tag_names}")
             return True
@@ -1156,23 +1647,27 @@ class RedisService(DatabaseService):
     async def get_post_discussions(self, post_id: str) -> List[Dict[str, Any]]:
         """Get discussions for a post"""
         try:
-            # Convert comments to discussion format
-            comments = await self.get_comments_by_post(post_id)
-            discussions = []
+            # Convert comments to discussion format; the stored payloads are used as they are,
+            # so created_at is already the ISO string the response needs
+            comments = await self._get_comment_payloads(post_id)
             
+            # Author info for every comment in one pipelined round trip
+            author_ids = list(dict.fromkeys(comment['author_id'] for comment in comments))
+            users = dict(zip(author_ids, await self._get_user_dicts(author_ids)))
+            
+            discussions = []
             for comment in comments:
-                # Get user info
-                user = await self.get_user_by_id(comment.author_id)
+                user = users.get(comment['author_id'])
                 
                 discussion = {
-                    'id': comment.id,
-                    'post_id': comment.post_id,
-                    'author_id': comment.author_id,
-                    'content': comment.content,
+                    'id': comment['id'],
+                    'post_id': comment['post_id'],
+                    'author_id': comment['author_id'],
+                    'content': comment['content'],
                     'username': user['username'] if user else 'unknown',
                     'display_name': user['display_name'] if user else 'Unknown User',
                     'avatar_url': user['avatar_url'] if user else '',
-                    'created_ts': comment.created_at.isoformat(),
+                    'created_ts': comment['created_at'],
                     'is_deleted': False,
                     'thread_path': '',
                     'thread_level': 0
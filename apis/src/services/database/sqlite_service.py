@@ -6,16 +6,22 @@ Provides SQLite-specific database operations
 import re
 import aiosqlite
 import logging
-import json
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+import orjson
+
 from .base import DatabaseService
 from ...config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string using orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class SQLiteService(DatabaseService):
     """SQLite database service implementation"""
     
@@ -137,6 +143,7 @@ class SQLiteService(DatabaseService):
                 
                 await db.commit()
                 logger.info(f"✅ SQLite bootstrap SQL executed: {success_count} successful, {warning_count} warnings")
+                return True
                 
         except Exception as e:
             logger.error(f"❌ SQLite bootstrap execution failed: {e}")
@@ -609,7 +616,7 @@ class SQLiteService(DatabaseService):
                     event_data['id'], event_data['user_id'], event_data['event_type_id'],
                     event_data.get('target_type'), event_data.get('target_id'),
                     event_data.get('session_id'), event_data.get('ip_address'),
-                    event_data.get('user_agent'), json.dumps(event_data.get('metadata', {}))
+                    event_data.get('user_agent'), _json_dumps(event_data.get('metadata', {}))
                 )
             )
             return event_data['id']
@@ -650,7 +657,7 @@ class SQLiteService(DatabaseService):
             now = datetime.utcnow().isoformat()
             event_metadata = metadata or {}
             event_metadata['mentioned_by'] = mentioning_user_id
-            metadata_json = json.dumps(event_metadata)
+            metadata_json = _json_dumps(event_metadata)
             
             events_to_insert = []
             for username in valid_user_map.keys():
@@ -1203,8 +1210,8 @@ class SQLiteService(DatabaseService):
                 value = setting['setting_value']
                 if setting['setting_type'] == 'json':
                     try:
-                        value = json.loads(value)
-                    except json.JSONDecodeError:
+                        value = orjson.loads(value)
+                    except orjson.JSONDecodeError:
                         logger.warning(f"Failed to parse JSON setting: {setting_key}")
                 elif setting['setting_type'] == 'boolean':
                     value = value.lower() in ('true', '1', 'yes', 'on')
@@ -1228,7 +1235,7 @@ class SQLiteService(DatabaseService):
         try:
             # Convert value to string based on type
             if setting_type == 'json':
-                value_str = json.dumps(setting_value)
+                value_str = _json_dumps(setting_value)
             elif setting_type == 'boolean':
                 value_str = 'true' if setting_value else 'false'
             else:
@@ -1304,15 +1311,11 @@ class SQLiteService(DatabaseService):
                 # Enable foreign key constraints
                 await db.execute("PRAGMA foreign_keys = ON")
                 
-                # Split SQL into individual statements
-                statements = [stmt.strip() for stmt in migration_sql.split(';') if stmt.strip()]
-                
-                for statement in statements:
-                    if statement:
-                        logger.debug(f"Executing migration statement: {statement[:100]}...")
-                        await db.execute(statement)
-                
-                await db.commit()
+                # Run the whole script in one call and one explicit transaction. SQLite parses
+                # the statements itself, so ';' inside literals or trigger bodies is safe, and a
+                # failing statement leaves the transaction open to be rolled back on close.
+                logger.debug(f"Executing migration script: {migration_sql.strip()[:100]}...")
+                await db.executescript(f"BEGIN;\n{migration_sql}\nCOMMIT;")
             
             logger.info("✅ Migration SQL executed successfully")
             return True
@@ -62,20 +62,22 @@ async def _get_posts_from_favorite_tags(db, user_id: str, favorite_tags: List[st
     
     logger.debug(f"Fetching posts from {len(favorite_tags)} favorite tags for user {user_id} since {since_date}")
     
-    # Build query to get posts from favorite tags
-    placeholders = ','.join(['?' for _ in favorite_tags])
-    
     # Database-specific SQL
     if settings.database_type == "postgresql":
         tags_query = "SELECT string_agg(tt.name, ', ') FROM post_tags ptg JOIN tag_types tt ON ptg.tag_id = tt.id WHERE ptg.post_id = p.id"
         is_current = "TRUE"
         is_latest = "TRUE"
         is_deleted = "FALSE"
+        # One array parameter regardless of how many tags the user follows
+        tag_filter = "= ANY(?::text[])"
+        tag_params = (list(favorite_tags),)
     else:
         tags_query = "SELECT GROUP_CONCAT(tt.name, ', ') FROM post_tags ptg JOIN tag_types tt ON ptg.tag_id = tt.id WHERE ptg.post_id = p.id"
         is_current = "1"
         is_latest = "1"
         is_deleted = "0"
+        tag_filter = f"IN ({','.join(['?' for _ in favorite_tags])})"
+        tag_params = tuple(favorite_tags)
     
     query = f"""
         SELECT DISTINCT p.id, p.title, p.author_id, u.display_name as author_name,
@@ -98,7 +100,7 @@ async def _get_posts_from_favorite_tags(db, user_id: str, favorite_tags: List[st
         JOIN users u ON p.author_id = u.id
         LEFT JOIN posts_content pc ON p.id = pc.post_id AND pc.is_current = {is_current}
         JOIN post_tags pt ON p.id = pt.post_id
-        WHERE pt.tag_id IN ({placeholders})
+        WHERE pt.tag_id {tag_filter}
           AND p.status = 'published'
           AND p.is_latest = {is_latest}
           AND p.created_ts >= ?
@@ -106,7 +108,7 @@ async def _get_posts_from_favorite_tags(db, user_id: str, favorite_tags: List[st
         LIMIT 5
     """
     
-    params = tuple(favorite_tags) + (since_date if settings.database_type == "postgresql" else since_date.isoformat(),)
+    params = tag_params + (since_date if settings.database_type == "postgresql" else since_date.isoformat(),)
     
     if settings.database_type == "postgresql":
         query = db._convert_placeholders(query)